@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AllergyConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "allergy"
+
+    def ready(self) -> None:
+        from allergy import signals  # noqa: F401, PLC0415
@@ -0,0 +1,192 @@
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+from functools import wraps
+from typing import Any, cast
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+
+DATA_VERSION_KEY = "allergy:data-version:{user_id}"
+CALENDAR_FRAGMENT_KEY = "allergy:calendar:{user_id}:{version}:{year}-{month}:{selected_day}:{explicit_selected_date}"
+YEAR_FRAGMENT_KEY = "allergy:year:{user_id}:{version}:{year}"
+CALENDAR_FRAGMENT_HITS_KEY = "allergy:calendar:hits"
+CALENDAR_FRAGMENT_MISSES_KEY = "allergy:calendar:misses"
+CALENDAR_FRAGMENT_TIMEOUT = 60 * 60 * 24
+ANALYSIS_KEY = "allergy:analysis:{user_id}:{version}:{name}"
+ANALYSIS_TIMEOUT = 60 * 60 * 24
+
+
+def get_data_version(user_id: int) -> int:
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        # Seeding from the clock keeps a version lost to eviction from ever matching an older fragment.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key, time.time_ns())
+    return int(version)
+
+
+async def aget_data_version(user_id: int) -> int:
+    # Async views use the async cache API, since backends such as the database cache cannot be called from the loop.
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key, time.time_ns())
+    return int(version)
+
+
+def bump_data_version(user_id: int) -> None:
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_data_version_on_commit(user_id: int) -> None:
+    # Bumping before the commit would let a concurrent read cache the old rows under the new version.
+    transaction.on_commit(lambda: bump_data_version(user_id))
+
+
+def _increment_counter(key: str) -> None:
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+async def _aincrement_counter(key: str) -> None:
+    await cache.aadd(key, 0, timeout=None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, 1, timeout=None)
+
+
+def _calendar_fragment_key(
+    user_id: int, version: int, month_start: date, selected_day: int | None, explicit_selected_date: date | None
+) -> str:
+    return CALENDAR_FRAGMENT_KEY.format(
+        user_id=user_id,
+        version=version,
+        year=month_start.year,
+        month=month_start.month,
+        selected_day=selected_day or "",
+        explicit_selected_date=explicit_selected_date.isoformat() if explicit_selected_date else "",
+    )
+
+
+def calendar_fragment_key(
+    user_id: int, year: int, month: int, selected_day: int | None, explicit_selected_date: date | None
+) -> str:
+    return _calendar_fragment_key(
+        user_id, get_data_version(user_id), date(year, month, 1), selected_day, explicit_selected_date
+    )
+
+
+async def acalendar_fragment_key(
+    user_id: int, year: int, month: int, selected_day: int | None, explicit_selected_date: date | None
+) -> str:
+    return _calendar_fragment_key(
+        user_id, await aget_data_version(user_id), date(year, month, 1), selected_day, explicit_selected_date
+    )
+
+
+def year_fragment_key(user_id: int, year: int) -> str:
+    return YEAR_FRAGMENT_KEY.format(user_id=user_id, version=get_data_version(user_id), year=year)
+
+
+def get_calendar_fragment(key: str) -> str | None:
+    fragment: str | None = cache.get(key)
+    _increment_counter(CALENDAR_FRAGMENT_MISSES_KEY if fragment is None else CALENDAR_FRAGMENT_HITS_KEY)
+    return fragment
+
+
+async def aget_calendar_fragment(key: str) -> str | None:
+    fragment: str | None = await cache.aget(key)
+    await _aincrement_counter(CALENDAR_FRAGMENT_MISSES_KEY if fragment is None else CALENDAR_FRAGMENT_HITS_KEY)
+    return fragment
+
+
+def set_calendar_fragment(key: str, fragment: str) -> None:
+    cache.set(key, fragment, timeout=CALENDAR_FRAGMENT_TIMEOUT)
+
+
+async def aset_calendar_fragment(key: str, fragment: str) -> None:
+    await cache.aset(key, fragment, timeout=CALENDAR_FRAGMENT_TIMEOUT)
+
+
+def get_calendar_fragment_stats() -> dict[str, int]:
+    counters = cache.get_many([CALENDAR_FRAGMENT_HITS_KEY, CALENDAR_FRAGMENT_MISSES_KEY])
+    return {
+        "hits": counters.get(CALENDAR_FRAGMENT_HITS_KEY, 0),
+        "misses": counters.get(CALENDAR_FRAGMENT_MISSES_KEY, 0),
+    }
+
+
+def cached_analysis[T](user_id: int, name: str, compute: Callable[[], T]) -> T:
+    # Keyed by the data version, so any write to the user's entries computes the analysis again.
+    key = ANALYSIS_KEY.format(user_id=user_id, version=get_data_version(user_id), name=name)
+    return cast(T, cache.get_or_set(key, compute, timeout=ANALYSIS_TIMEOUT))
+
+
+def _user_data_validator(request: HttpRequest, user: User, version: int) -> str:
+    # Partials embed CSRF tokens and may fall back to today's date, so both are part of the validator.
+    validator = ":".join(
+        [
+            str(user.pk),
+            str(version),
+            request.get_full_path(),
+            request.META.get("CSRF_COOKIE", ""),
+            date.today().isoformat(),
+        ]
+    )
+    return hashlib.blake2b(validator.encode(), digest_size=16).hexdigest()
+
+
+def user_data_etag(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+    user = cast(User, request.user)
+    return _user_data_validator(request, user, get_data_version(user.pk))
+
+
+async def auser_data_etag(request: HttpRequest) -> str:
+    user = cast(User, await request.auser())
+    return _user_data_validator(request, user, await aget_data_version(user.pk))
+
+
+def _async_etag[**P](
+    view: Callable[P, Awaitable[HttpResponseBase]],
+) -> Callable[P, Awaitable[HttpResponseBase]]:
+    # Django's etag() calls its ETag function synchronously even around async views, so async views get their own
+    # wrapper that awaits the async cache API.
+    @wraps(view)
+    async def conditional_view(*args: P.args, **kwargs: P.kwargs) -> HttpResponseBase:
+        request = cast(HttpRequest, args[0])
+        res_etag = quote_etag(await auser_data_etag(request))
+        response: HttpResponseBase | None = get_conditional_response(request, etag=res_etag)
+        if response is None:
+            response = await view(*args, **kwargs)
+        if request.method in ("GET", "HEAD"):
+            response.headers.setdefault("ETag", res_etag)
+        return response
+
+    return conditional_view
+
+
+def condition_on_user_data[**P, R](view: Callable[P, R]) -> Callable[P, R]:
+    if iscoroutinefunction(view):
+        conditional_view = cast(Callable[P, R], _async_etag(cast(Callable[P, Awaitable[HttpResponseBase]], view)))
+    else:
+        conditional_view = etag(user_data_etag)(view)
+    return cache_control(private=True, no_cache=True)(conditional_view)
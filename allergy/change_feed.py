@@ -0,0 +1,144 @@
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db.models import Model, Q
+from django.utils import timezone
+
+from allergy.models import DeletedRecord, Medication, SymptomEntry, SymptomType
+
+CHANGE_FEED_PAGE_SIZE = 500
+# Rows are stamped before their transaction commits, so the newest changes are held back until
+# slower concurrent writers had the chance to commit rows with slightly older timestamps.
+CHANGE_FEED_SETTLE_DELAY = timedelta(seconds=5)
+
+
+@dataclass(frozen=True)
+class ChangeSource:
+    name: str
+    model: type[Model]
+    changed_at_field: str
+    fields: tuple[str, ...]
+
+
+CHANGE_SOURCES = (
+    ChangeSource(
+        DeletedRecord.RecordType.SYMPTOM_ENTRY,
+        SymptomEntry,
+        "updated_at",
+        ("user_id", "entry_date", "symptom_type_id", "intensity", "created_at"),
+    ),
+    ChangeSource(
+        DeletedRecord.RecordType.SYMPTOM_TYPE,
+        SymptomType,
+        "updated_at",
+        ("user_id", "name", "created_at"),
+    ),
+    ChangeSource(
+        DeletedRecord.RecordType.MEDICATION,
+        Medication,
+        "updated_at",
+        ("user_id", "medication_name", "medication_type", "created_at"),
+    ),
+    ChangeSource("deleted", DeletedRecord, "created_at", ("user_id", "record_type", "record_uuid")),
+)
+
+
+@dataclass(frozen=True)
+class Change:
+    record_type: str
+    action: str
+    uuid: uuid.UUID
+    changed_at: datetime
+    data: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "record_type": self.record_type,
+            "action": self.action,
+            "uuid": str(self.uuid),
+            "changed_at": self.changed_at.isoformat(),
+            "data": self.data,
+        }
+
+
+@dataclass(frozen=True)
+class ChangePage:
+    changes: list[Change]
+    next_cursor: str
+    has_more: bool
+
+
+def encode_cursor(positions: dict[str, tuple[datetime, uuid.UUID]]) -> str:
+    payload = {name: [changed_at.isoformat(), str(row_uuid)] for name, (changed_at, row_uuid) in positions.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload, sort_keys=True).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, tuple[datetime, uuid.UUID]]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return {
+            name: (datetime.fromisoformat(changed_at), uuid.UUID(row_uuid))
+            for name, (changed_at, row_uuid) in payload.items()
+        }
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid change feed cursor.") from e
+
+
+def _as_change(source: ChangeSource, row: dict[str, Any]) -> Change:
+    row_uuid = row.pop("uuid")
+    changed_at = row.pop(source.changed_at_field)
+    if source.model is DeletedRecord:
+        return Change(
+            record_type=row["record_type"],
+            action="delete",
+            uuid=row["record_uuid"],
+            changed_at=changed_at,
+            data={"user_id": row["user_id"]},
+        )
+    return Change(record_type=source.name, action="upsert", uuid=row_uuid, changed_at=changed_at, data=row)
+
+
+def get_changes(
+    cursor: str | None = None,
+    *,
+    user: User | None = None,
+    limit: int = CHANGE_FEED_PAGE_SIZE,
+    until: datetime | None = None,
+) -> ChangePage:
+    positions = decode_cursor(cursor) if cursor else {}
+    until = until or timezone.now() - CHANGE_FEED_SETTLE_DELAY
+
+    # Each source is read with its own keyset on (changed_at, uuid); the pages are then merged so
+    # that the combined feed stays ordered by change time.
+    candidates: list[tuple[datetime, uuid.UUID, ChangeSource, dict[str, Any]]] = []
+    for source in CHANGE_SOURCES:
+        changed_at_field = source.changed_at_field
+        rows = source.model._default_manager.filter(**{f"{changed_at_field}__lte": until})
+        if user is not None:
+            rows = rows.filter(user_id=user.pk)
+        if source.name in positions:
+            last_changed_at, last_uuid = positions[source.name]
+            rows = rows.filter(
+                Q(**{f"{changed_at_field}__gt": last_changed_at})
+                | Q(**{changed_at_field: last_changed_at, "uuid__gt": last_uuid})
+            )
+        for row in rows.order_by(changed_at_field, "uuid").values("uuid", changed_at_field, *source.fields)[
+            : limit + 1
+        ]:
+            candidates.append((row[changed_at_field], row["uuid"], source, row))
+
+    candidates.sort(key=lambda candidate: (candidate[0], str(candidate[1])))
+    page = candidates[:limit]
+
+    changes = []
+    for changed_at, row_uuid, source, row in page:
+        positions[source.name] = (changed_at, row_uuid)
+        changes.append(_as_change(source, row))
+
+    return ChangePage(changes=changes, next_cursor=encode_cursor(positions), has_more=len(candidates) > limit)
@@ -0,0 +1,123 @@
+import math
+import uuid
+from dataclasses import dataclass
+from itertools import combinations
+
+from django.contrib.auth.models import User
+
+from allergy.cache import cached_analysis
+from allergy.models import DailyEntrySummary, SymptomType
+
+TOP_PAIRS_SIZE = 10
+STRONG_CORRELATION = 0.5
+WEAK_CORRELATION = 0.2
+
+
+def correlation_css_class(correlation: float | None) -> str:
+    if correlation is None:
+        return "bg-gray-50"
+    if correlation >= STRONG_CORRELATION:
+        return "bg-red-200"
+    if correlation >= WEAK_CORRELATION:
+        return "bg-orange-100"
+    if correlation <= -WEAK_CORRELATION:
+        return "bg-blue-100"
+    return "bg-white"
+
+
+@dataclass(frozen=True)
+class SymptomPair:
+    first_name: str
+    second_name: str
+    days_together: int
+    correlation: float | None
+
+
+@dataclass(frozen=True)
+class CooccurrenceMatrix:
+    day_count: int
+    symptom_type_uuids: list[uuid.UUID]
+    symptom_names: list[str]
+    # counts[i][j] is the number of logged days with both symptoms; the diagonal holds the days of each symptom.
+    counts: list[list[int]]
+    # Pearson correlation of the daily intensities, None where a symptom's intensity never varies.
+    correlations: list[list[float | None]]
+
+    @property
+    def top_pairs(self) -> list[SymptomPair]:
+        pairs = [
+            SymptomPair(
+                first_name=self.symptom_names[first],
+                second_name=self.symptom_names[second],
+                days_together=self.counts[first][second],
+                correlation=self.correlations[first][second],
+            )
+            for first, second in combinations(range(len(self.symptom_names)), 2)
+            if self.counts[first][second]
+        ]
+        pairs.sort(key=lambda pair: (-pair.days_together, -(pair.correlation or 0), pair.first_name, pair.second_name))
+        return pairs[:TOP_PAIRS_SIZE]
+
+    @property
+    def rows(self) -> list[tuple[str, list[tuple[int, float | None, str]]]]:
+        return [
+            (
+                name,
+                [
+                    (count, correlation, correlation_css_class(correlation))
+                    for count, correlation in zip(self.counts[row], self.correlations[row], strict=True)
+                ],
+            )
+            for row, name in enumerate(self.symptom_names)
+        ]
+
+
+def _matrices(days: list[dict[int, int]], type_count: int) -> tuple[list[list[int]], list[list[float | None]]]:
+    # Only the symptoms present on a day are visited, which keeps the loops sparse.
+    day_count = len(days)
+    count_matrix = [[0] * type_count for _ in range(type_count)]
+    products = [[0] * type_count for _ in range(type_count)]
+    sums = [0] * type_count
+    for type_intensities in days:
+        for first, first_intensity in type_intensities.items():
+            sums[first] += first_intensity
+            for second, second_intensity in type_intensities.items():
+                count_matrix[first][second] += 1
+                products[first][second] += first_intensity * second_intensity
+
+    correlation_matrix: list[list[float | None]] = []
+    for first in range(type_count):
+        correlation_row: list[float | None] = []
+        for second in range(type_count):
+            pair_covariance = day_count * products[first][second] - sums[first] * sums[second]
+            pair_variance = (day_count * products[first][first] - sums[first] ** 2) * (
+                day_count * products[second][second] - sums[second] ** 2
+            )
+            correlation_row.append(round(pair_covariance / math.sqrt(pair_variance), 3) if pair_variance > 0 else None)
+        correlation_matrix.append(correlation_row)
+    return count_matrix, correlation_matrix
+
+
+def compute_cooccurrence(user: User) -> CooccurrenceMatrix:
+    symptom_types = list(SymptomType.objects.filter(user=user).values_list("uuid", "name").order_by("name"))
+    columns = {str(type_uuid): column for column, (type_uuid, _) in enumerate(symptom_types)}
+
+    # Every logged day becomes one sparse row of the day x symptom type matrix, absent symptoms are left out.
+    days = [
+        {columns[type_uuid]: intensity for type_uuid, intensity in type_intensities.items() if type_uuid in columns}
+        for type_intensities in DailyEntrySummary.objects.filter(user=user).values_list("type_intensities", flat=True)
+    ]
+    counts, correlations = _matrices(days, len(symptom_types))
+
+    logged = [column for column in range(len(symptom_types)) if counts[column][column]]
+    return CooccurrenceMatrix(
+        day_count=len(days),
+        symptom_type_uuids=[symptom_types[column][0] for column in logged],
+        symptom_names=[symptom_types[column][1] for column in logged],
+        counts=[[counts[row][column] for column in logged] for row in logged],
+        correlations=[[correlations[row][column] for column in logged] for row in logged],
+    )
+
+
+def get_cooccurrence(user: User) -> CooccurrenceMatrix:
+    return cached_analysis(user.pk, "cooccurrence", lambda: compute_cooccurrence(user))
@@ -0,0 +1,62 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db.models import FilteredRelation, Q, QuerySet
+
+from allergy.models import SymptomType
+from allergy.summaries import MonthEntries, aget_month_entries, get_month_entries
+
+
+@dataclass(frozen=True)
+class DaySymptom:
+    uuid: uuid.UUID
+    name: str
+    intensity: int | None
+
+    @property
+    def selected(self) -> bool:
+        return self.intensity is not None
+
+
+@dataclass(frozen=True)
+class DayView:
+    selected_date: date
+    symptoms: list[DaySymptom]
+    month_entries: MonthEntries
+
+    @property
+    def selected_symptoms(self) -> list[DaySymptom]:
+        return [symptom for symptom in self.symptoms if symptom.selected]
+
+
+def _day_symptom_rows(user: User, selected_date: date) -> QuerySet[SymptomType, tuple[uuid.UUID, str, int | None]]:
+    return (
+        SymptomType.objects.filter(user=user)
+        .annotate(day_entry=FilteredRelation("symptom_entries", condition=Q(symptom_entries__entry_date=selected_date)))
+        .values_list("uuid", "name", "day_entry__intensity")
+        .order_by("name")
+    )
+
+
+def get_day_view(user: User, selected_date: date) -> DayView:
+    return DayView(
+        selected_date=selected_date,
+        symptoms=[
+            DaySymptom(uuid=type_uuid, name=name, intensity=intensity)
+            for type_uuid, name, intensity in _day_symptom_rows(user, selected_date)
+        ],
+        month_entries=get_month_entries(user, selected_date.year, selected_date.month),
+    )
+
+
+async def aget_day_view(user: User, selected_date: date) -> DayView:
+    return DayView(
+        selected_date=selected_date,
+        symptoms=[
+            DaySymptom(uuid=type_uuid, name=name, intensity=intensity)
+            async for type_uuid, name, intensity in _day_symptom_rows(user, selected_date)
+        ],
+        month_entries=await aget_month_entries(user, selected_date.year, selected_date.month),
+    )
@@ -0,0 +1,182 @@
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import batched
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from allergy.cache import bump_data_version_on_commit
+from allergy.models import SymptomEntry, SymptomType
+from allergy.summaries import refresh_entry_rollups
+
+UPSERT_BATCH_SIZE = 500
+MAX_FILL_RANGE_DAYS = 366
+
+
+@dataclass(frozen=True)
+class EntryWrite:
+    entry_date: date
+    symptom_type: SymptomType
+    intensity: int
+
+
+def _upsert_sql(row_count: int) -> str:
+    quote_name = connection.ops.quote_name
+    columns = [quote_name(field.attname) for field in SymptomEntry._meta.concrete_fields]
+    conflict_columns = [quote_name(column) for column in ("user_id", "entry_date", "symptom_type_id")]
+    update_columns = [quote_name(column) for column in ("intensity", "updated_at")]
+    row_placeholder = f"({', '.join(['%s'] * len(columns))})"
+    return (
+        f"INSERT INTO {quote_name(SymptomEntry._meta.db_table)} ({', '.join(columns)}) "
+        f"VALUES {', '.join([row_placeholder] * row_count)} "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) "
+        f"DO UPDATE SET {', '.join(f'{column} = EXCLUDED.{column}' for column in update_columns)} "
+        f"RETURNING {', '.join(columns)}"
+    )
+
+
+def upsert_symptom_entries(user: User, writes: Iterable[EntryWrite]) -> list[SymptomEntry]:
+    # A single INSERT ... ON CONFLICT may not touch the same row twice, so the last write per row wins.
+    latest_writes = {(write.entry_date, write.symptom_type.pk): write for write in writes}
+    if not latest_writes:
+        return []
+
+    now = timezone.now()
+    symptom_types = {write.symptom_type.pk: write.symptom_type for write in latest_writes.values()}
+    entries: list[SymptomEntry] = []
+    with transaction.atomic():
+        for batch in batched(latest_writes.values(), UPSERT_BATCH_SIZE, strict=False):
+            params: list[Any] = []
+            for write in batch:
+                new_entry = SymptomEntry(
+                    uuid=uuid.uuid4(),
+                    user=user,
+                    entry_date=write.entry_date,
+                    symptom_type=write.symptom_type,
+                    intensity=write.intensity,
+                    created_at=now,
+                    updated_at=now,
+                )
+                params.extend(
+                    field.get_db_prep_save(getattr(new_entry, field.attname), connection)
+                    for field in SymptomEntry._meta.concrete_fields
+                )
+            # RETURNING hands back the stored row, so updated entries keep their original primary key.
+            entries.extend(SymptomEntry.objects.raw(_upsert_sql(len(batch)), params))
+
+        # The upsert bypasses the post_save signal, so summaries and the data version are refreshed here.
+        refresh_entry_rollups(user.pk, [entry.entry_date for entry in entries])
+        bump_data_version_on_commit(user.pk)
+
+    for entry in entries:
+        entry.user = user
+        entry.symptom_type = symptom_types[entry.symptom_type_id]
+    return entries
+
+
+def _new_uuid_sql() -> str | None:
+    if connection.vendor == "postgresql":
+        return "gen_random_uuid()"
+    if connection.vendor == "sqlite":
+        # UUIDField is stored as 32 hex characters on SQLite.
+        return "lower(hex(randomblob(16)))"
+    return None
+
+
+def _copy_day_sql(new_uuid_sql: str) -> str:
+    quote_name = connection.ops.quote_name
+    table = quote_name(SymptomEntry._meta.db_table)
+    columns = [
+        quote_name(column)
+        for column in ("uuid", "user_id", "entry_date", "symptom_type_id", "intensity", "created_at", "updated_at")
+    ]
+    conflict_columns = [quote_name(column) for column in ("user_id", "entry_date", "symptom_type_id")]
+    update_columns = [quote_name(column) for column in ("intensity", "updated_at")]
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {new_uuid_sql}, {quote_name('user_id')}, %s, {quote_name('symptom_type_id')}, "
+        f"{quote_name('intensity')}, %s, %s FROM {table} "
+        f"WHERE {quote_name('user_id')} = %s AND {quote_name('entry_date')} = %s "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) "
+        f"DO UPDATE SET {', '.join(f'{column} = EXCLUDED.{column}' for column in update_columns)}"
+    )
+
+
+def copy_day_entries(user: User, source_date: date, target_date: date) -> int:
+    new_uuid_sql = _new_uuid_sql()
+    if new_uuid_sql is None:
+        # Without a UUID function in SQL the copies get their primary keys from Python instead.
+        source_entries = SymptomEntry.objects.filter(user=user, entry_date=source_date).select_related("symptom_type")
+        return len(
+            upsert_symptom_entries(
+                user,
+                (
+                    EntryWrite(entry_date=target_date, symptom_type=entry.symptom_type, intensity=entry.intensity)
+                    for entry in source_entries
+                ),
+            )
+        )
+
+    now = SymptomEntry._meta.get_field("updated_at").get_db_prep_save(timezone.now(), connection)
+    date_field = SymptomEntry._meta.get_field("entry_date")
+    params = [
+        date_field.get_db_prep_save(target_date, connection),
+        now,
+        now,
+        user.pk,
+        date_field.get_db_prep_save(source_date, connection),
+    ]
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(_copy_day_sql(new_uuid_sql), params)
+            copied: int = cursor.rowcount
+
+        # The INSERT ... SELECT bypasses the post_save signal, so summaries and the data version are refreshed here.
+        if copied:
+            refresh_entry_rollups(user.pk, [target_date])
+            bump_data_version_on_commit(user.pk)
+    return copied
+
+
+def _fill_range_sql() -> str:
+    quote_name = connection.ops.quote_name
+    columns = [
+        quote_name(column)
+        for column in ("uuid", "user_id", "entry_date", "symptom_type_id", "intensity", "created_at", "updated_at")
+    ]
+    conflict_columns = [quote_name(column) for column in ("user_id", "entry_date", "symptom_type_id")]
+    update_columns = [quote_name(column) for column in ("intensity", "updated_at")]
+    return (
+        f"INSERT INTO {quote_name(SymptomEntry._meta.db_table)} ({', '.join(columns)}) "
+        "SELECT gen_random_uuid(), %s, fill_day::date, %s, %s, %s, %s "
+        "FROM generate_series(%s::date, %s::date, interval '1 day') AS fill_day "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) "
+        f"DO UPDATE SET {', '.join(f'{column} = EXCLUDED.{column}' for column in update_columns)}"
+    )
+
+
+def fill_symptom_range(
+    user: User, symptom_type: SymptomType, start_date: date, end_date: date, intensity: int
+) -> list[date]:
+    days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    if connection.vendor != "postgresql":
+        upsert_symptom_entries(
+            user, (EntryWrite(entry_date=day, symptom_type=symptom_type, intensity=intensity) for day in days)
+        )
+        return days
+
+    # Postgres generates the days itself, so the whole range is written by one statement.
+    now = timezone.now()
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(_fill_range_sql(), [user.pk, symptom_type.pk, intensity, now, now, start_date, end_date])
+
+        # The INSERT ... SELECT bypasses the post_save signal, so summaries and the data version are refreshed here.
+        refresh_entry_rollups(user.pk, days)
+        bump_data_version_on_commit(user.pk)
+    return days
@@ -0,0 +1,95 @@
+import csv
+import json
+from collections.abc import AsyncIterator, Iterator
+from itertools import islice
+from typing import Any, cast
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+
+from allergy.models import Medication, SymptomEntry
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_COLUMNS = (
+    "record_type",
+    "entry_date",
+    "symptom",
+    "intensity",
+    "medication_name",
+    "medication_type",
+    "created_at",
+    "updated_at",
+)
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_export_rows(user: User) -> Iterator[tuple[Any, ...]]:
+    # values_list plus iterator() keeps a server-side cursor open and never builds model instances,
+    # so memory use does not grow with the length of the history.
+    entries = (
+        SymptomEntry.objects.filter(user=user)
+        .order_by("entry_date", "symptom_type__name")
+        .values_list("entry_date", "symptom_type__name", "intensity", "created_at", "updated_at")
+    )
+    for entry_date, symptom, intensity, created_at, updated_at in entries.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield ("symptom_entry", entry_date, symptom, intensity, None, None, created_at, updated_at)
+
+    medications = (
+        Medication.objects.filter(user=user)
+        .order_by("medication_name", "medication_type")
+        .values_list("medication_name", "medication_type", "created_at", "updated_at")
+    )
+    for medication_name, medication_type, created_at, updated_at in medications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield ("medication", None, None, None, medication_name, medication_type, created_at, updated_at)
+
+
+def _next_chunk(rows: Iterator[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    return list(islice(rows, EXPORT_CHUNK_SIZE))
+
+
+async def aiter_export_rows(user: User) -> AsyncIterator[tuple[Any, ...]]:
+    # ASGI servers would buffer a sync iterator completely before streaming it, so they get this one instead.
+    # QuerySet.aiterator() runs values_list queries on the event loop, so the sync rows are created
+    # and advanced on the database thread, one chunk at a time.
+    rows = await sync_to_async(iter_export_rows)(user)
+    while chunk := await sync_to_async(_next_chunk)(rows):
+        for row in chunk:
+            yield row
+
+
+def _csv_line(writer: Any, row: tuple[Any, ...]) -> str:
+    return cast(str, writer.writerow(["" if value is None else value for value in row]))
+
+
+def _ndjson_line(row: tuple[Any, ...]) -> str:
+    record = {column: value for column, value in zip(EXPORT_COLUMNS, row, strict=True) if value is not None}
+    return json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_csv_export(user: User) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in iter_export_rows(user):
+        yield _csv_line(writer, row)
+
+
+async def aiter_csv_export(user: User) -> AsyncIterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    async for row in aiter_export_rows(user):
+        yield _csv_line(writer, row)
+
+
+def iter_ndjson_export(user: User) -> Iterator[str]:
+    for row in iter_export_rows(user):
+        yield _ndjson_line(row)
+
+
+async def aiter_ndjson_export(user: User) -> AsyncIterator[str]:
+    async for row in aiter_export_rows(user):
+        yield _ndjson_line(row)
@@ -1,10 +1,21 @@
+from datetime import date
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.core.validators import MaxValueValidator, MinValueValidator
-from django.forms import DateField, Form, IntegerField, UUIDField
+from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
+from django.forms import DateField, Form, IntegerField, JSONField, ModelMultipleChoiceField, UUIDField
 
-from allergy.models import SymptomEntry, SymptomType
+from allergy.entries import MAX_FILL_RANGE_DAYS, EntryWrite, fill_symptom_range, upsert_symptom_entries
+from allergy.intakes import record_medication_intakes
+from allergy.models import Medication, MedicationIntake, SymptomEntry, SymptomType
+
+MAX_BATCH_ENTRIES = 500
+
+symptom_name_validator = RegexValidator(
+    regex=r"^[A-Za-z\s]+$",
+    message="Symptom name should only contain letters and spaces",
+    code="invalid_symptom_name",
+)
 
 
 class AddSymptomForm(Form):
@@ -28,15 +39,133 @@ class AddSymptomForm(Form):
             raise ValidationError("Invalid symptom type") from e
 
     def save(self) -> SymptomEntry:
-        entry_date = self.cleaned_data["selected_date"]
-        symptom_type = self.cleaned_data["symptom_uuid"]
-        intensity = self.cleaned_data["intensity"]
-
-        entry, _ = SymptomEntry.objects.update_or_create(
-            user=self.user,
-            entry_date=entry_date,
-            symptom_type=symptom_type,
-            defaults={"intensity": intensity},
+        write = EntryWrite(
+            entry_date=self.cleaned_data["selected_date"],
+            symptom_type=self.cleaned_data["symptom_uuid"],
+            intensity=self.cleaned_data["intensity"],
         )
-
+        [entry] = upsert_symptom_entries(self.user, [write])
         return entry
+
+
+class SymptomEntryBatchForm(Form):
+    entries = JSONField(required=True)
+    selected_date = DateField(required=False)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.user = kwargs.pop("user", None)
+        super().__init__(*args, **kwargs)
+
+    def clean_entries(self) -> list[EntryWrite]:
+        entries = self.cleaned_data["entries"]
+        if not isinstance(entries, list) or not entries:
+            raise ValidationError("Provide a non-empty list of entries.")
+        if len(entries) > MAX_BATCH_ENTRIES:
+            raise ValidationError(f"Provide at most {MAX_BATCH_ENTRIES} entries.")
+
+        entry_date_field = DateField()
+        symptom_uuid_field = UUIDField()
+        intensity_field = IntegerField(validators=[MinValueValidator(1), MaxValueValidator(10)])
+
+        parsed_entries = []
+        for position, entry in enumerate(entries, start=1):
+            if not isinstance(entry, dict):
+                raise ValidationError(f"Entry {position} is not an object.")
+            try:
+                parsed_entries.append(
+                    (
+                        entry_date_field.clean(entry.get("date")),
+                        symptom_uuid_field.clean(entry.get("symptom_uuid")),
+                        intensity_field.clean(entry.get("intensity")),
+                    )
+                )
+            except ValidationError as e:
+                raise ValidationError(f"Entry {position}: {' '.join(e.messages)}") from e
+
+        symptom_uuids = {symptom_uuid for _, symptom_uuid, _ in parsed_entries}
+        symptom_types = SymptomType.objects.filter(user=self.user).in_bulk(symptom_uuids)
+        if len(symptom_types) != len(symptom_uuids):
+            raise ValidationError("Invalid symptom type")
+
+        return [
+            EntryWrite(entry_date=entry_date, symptom_type=symptom_types[symptom_uuid], intensity=intensity)
+            for entry_date, symptom_uuid, intensity in parsed_entries
+        ]
+
+    def save(self) -> list[SymptomEntry]:
+        return upsert_symptom_entries(self.user, self.cleaned_data["entries"])
+
+
+class SymptomEditLogForm(SymptomEntryBatchForm):
+    selected_date = DateField(required=True)
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean() or {}
+        selected_date = cleaned_data.get("selected_date")
+        entries = cleaned_data.get("entries")
+        if selected_date and entries and any(write.entry_date != selected_date for write in entries):
+            raise ValidationError("All edits must be for the selected date.")
+        return cleaned_data
+
+
+class SymptomRangeFillForm(Form):
+    symptom_uuid = UUIDField(required=True)
+    start_date = DateField(required=True)
+    end_date = DateField(required=True)
+    intensity = IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(10)],
+        required=True,
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.user = kwargs.pop("user", None)
+        super().__init__(*args, **kwargs)
+
+    def clean_symptom_uuid(self) -> SymptomType:
+        symptom_uuid = self.cleaned_data["symptom_uuid"]
+        try:
+            return SymptomType.objects.get(uuid=symptom_uuid, user=self.user)
+        except SymptomType.DoesNotExist as e:
+            raise ValidationError("Invalid symptom type") from e
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean() or {}
+        start_date = cleaned_data.get("start_date")
+        end_date = cleaned_data.get("end_date")
+        if start_date and end_date:
+            if end_date < start_date:
+                raise ValidationError("The end date must not be before the start date.")
+            if (end_date - start_date).days >= MAX_FILL_RANGE_DAYS:
+                raise ValidationError(f"Fill at most {MAX_FILL_RANGE_DAYS} days at once.")
+        return cleaned_data
+
+    def save(self) -> list[date]:
+        return fill_symptom_range(
+            self.user,
+            self.cleaned_data["symptom_uuid"],
+            self.cleaned_data["start_date"],
+            self.cleaned_data["end_date"],
+            self.cleaned_data["intensity"],
+        )
+
+
+class MedicationIntakeForm(Form):
+    medications = ModelMultipleChoiceField(
+        queryset=Medication.objects.none(),
+        to_field_name="uuid",
+        error_messages={"required": "Select at least one medication."},
+    )
+    dose = IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(10)],
+        required=True,
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.user = kwargs.pop("user", None)
+        super().__init__(*args, **kwargs)
+        self.fields["medications"].queryset = Medication.objects.filter(user=self.user)  # type: ignore[attr-defined]
+
+    def save(self, intake_date: date) -> list[MedicationIntake]:
+        return record_medication_intakes(
+            self.user, self.cleaned_data["medications"], intake_date, self.cleaned_data["dose"]
+        )
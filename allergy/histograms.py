@@ -0,0 +1,62 @@
+import math
+import uuid
+from dataclasses import dataclass
+
+from django.contrib.auth.models import User
+from django.db.models import Count
+
+from allergy.cache import cached_analysis
+from allergy.models import SymptomEntry
+from allergy.trends import MAX_INTENSITY
+
+# Tailwind needs the full class names in the template output, so bar heights are picked from a fixed scale.
+BAR_HEIGHT_CSS_CLASSES = ("h-0", "h-1", "h-2", "h-3", "h-4", "h-5", "h-6", "h-7", "h-8")
+
+
+@dataclass(frozen=True)
+class HistogramBar:
+    intensity: int
+    entry_count: int
+    height_css_class: str
+
+    @property
+    def label(self) -> str:
+        return f"Intensity {self.intensity}: {self.entry_count} {'entry' if self.entry_count == 1 else 'entries'}"
+
+
+@dataclass(frozen=True)
+class IntensityHistogram:
+    # counts[i] is the number of entries logged with intensity i + 1.
+    counts: list[int]
+
+    @property
+    def bars(self) -> list[HistogramBar]:
+        highest = max(self.counts)
+        return [
+            HistogramBar(
+                intensity=intensity,
+                entry_count=count,
+                height_css_class=BAR_HEIGHT_CSS_CLASSES[
+                    math.ceil(count / highest * (len(BAR_HEIGHT_CSS_CLASSES) - 1)) if highest else 0
+                ],
+            )
+            for intensity, count in enumerate(self.counts, start=1)
+        ]
+
+
+def compute_intensity_histograms(user: User) -> dict[uuid.UUID, IntensityHistogram]:
+    # One grouped aggregate returns at most MAX_INTENSITY rows per symptom type, whatever the number of entries.
+    intensity_counts = (
+        SymptomEntry.objects.filter(user=user)
+        .values("symptom_type_id", "intensity")
+        .annotate(entries=Count("uuid"))
+        .order_by()
+    )
+    counts_by_type: dict[uuid.UUID, list[int]] = {}
+    for row in intensity_counts:
+        counts_by_type.setdefault(row["symptom_type_id"], [0] * MAX_INTENSITY)[row["intensity"] - 1] = row["entries"]
+    return {type_uuid: IntensityHistogram(counts=counts) for type_uuid, counts in counts_by_type.items()}
+
+
+def get_intensity_histograms(user: User) -> dict[uuid.UUID, IntensityHistogram]:
+    return cached_analysis(user.pk, "intensity-histograms", lambda: compute_intensity_histograms(user))
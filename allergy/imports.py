@@ -0,0 +1,168 @@
+import csv
+import json
+import re
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from itertools import batched
+from pathlib import PurePath
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from allergy.entries import EntryWrite, upsert_symptom_entries
+from allergy.forms import symptom_name_validator
+from allergy.models import SymptomType
+
+IMPORT_BATCH_SIZE = 2000
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_FORMATS_BY_SUFFIX = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+MAX_SYMPTOM_NAME_LENGTH = 255
+
+
+class DiaryImportError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class DiaryRow:
+    entry_date: date
+    symptom_name: str
+    intensity: int
+
+
+@dataclass(frozen=True)
+class DiaryImportResult:
+    rows: int
+    entries: int
+    created_symptom_types: int
+
+
+def _parse_intensity(value: Any) -> int:
+    # CSV cells are strings and NDJSON values are typed, but int() would truncate 3.7 and accept True or "1_0".
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        raise ValueError(value)
+    if isinstance(value, str) and not re.fullmatch(r"[0-9]+", value.strip()):
+        raise ValueError(value)
+    return int(value)
+
+
+def _parse_record(line_number: int, record: dict[str, Any]) -> DiaryRow | None:
+    # Files written by the history export also carry medication rows, which are skipped here.
+    if record.get("record_type", "symptom_entry") != "symptom_entry":
+        return None
+
+    try:
+        entry_date = date.fromisoformat(str(record.get("entry_date") or record.get("date") or ""))
+        intensity = _parse_intensity(record.get("intensity"))
+    except ValueError as e:
+        raise DiaryImportError(f"Line {line_number}: invalid date or intensity.") from e
+
+    symptom_name = re.sub(r"\s+", " ", str(record.get("symptom") or "")).strip()
+    if not symptom_name or len(symptom_name) > MAX_SYMPTOM_NAME_LENGTH:
+        raise DiaryImportError(f"Line {line_number}: invalid symptom name.")
+    try:
+        symptom_name_validator(symptom_name)
+    except ValidationError as e:
+        raise DiaryImportError(f"Line {line_number}: {e.messages[0]}.") from e
+    if not 1 <= intensity <= 10:
+        raise DiaryImportError(f"Line {line_number}: intensity must be between 1 and 10.")
+
+    return DiaryRow(entry_date=entry_date, symptom_name=symptom_name, intensity=intensity)
+
+
+def parse_csv_diary(lines: Iterable[str]) -> Iterator[DiaryRow]:
+    reader = csv.DictReader(lines)
+    for record in reader:
+        row = _parse_record(reader.line_num, record)
+        if row is not None:
+            yield row
+
+
+def parse_ndjson_diary(lines: Iterable[str]) -> Iterator[DiaryRow]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise DiaryImportError(f"Line {line_number}: invalid JSON.") from e
+        if not isinstance(record, dict):
+            raise DiaryImportError(f"Line {line_number}: expected a JSON object.")
+        row = _parse_record(line_number, record)
+        if row is not None:
+            yield row
+
+
+def import_format_for_filename(filename: str) -> str | None:
+    return IMPORT_FORMATS_BY_SUFFIX.get(PurePath(filename).suffix.lower())
+
+
+def parse_diary(lines: Iterable[str], import_format: str) -> Iterator[DiaryRow]:
+    if import_format == "csv":
+        return parse_csv_diary(lines)
+    if import_format == "ndjson":
+        return parse_ndjson_diary(lines)
+    raise DiaryImportError(f"Unsupported import format: {import_format}.")
+
+
+def _resolve_symptom_types(user: User, names: set[str]) -> tuple[dict[str, SymptomType], int]:
+    # Names are matched case-insensitively, like the symptom type form does.
+    names_by_key = {name.lower(): name for name in names}
+    symptom_types: dict[str, SymptomType] = {
+        symptom_type.name.lower(): symptom_type
+        for symptom_type in SymptomType.objects.filter(user=user)
+        .annotate(lower_name=Lower("name"))
+        .filter(lower_name__in=names_by_key)
+    }
+
+    missing = [SymptomType(user=user, name=name) for key, name in names_by_key.items() if key not in symptom_types]
+    if missing:
+        for symptom_type in SymptomType.objects.bulk_create(missing):
+            symptom_types[symptom_type.name.lower()] = symptom_type
+    return symptom_types, len(missing)
+
+
+def import_diary(
+    user: User,
+    rows: Iterable[DiaryRow],
+    *,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Callable[[int], None] | None = None,
+) -> DiaryImportResult:
+    row_count = created_symptom_types = 0
+    # A day and symptom repeated in several batches is upserted into the same entry, so entries are counted once.
+    entry_uuids: set[uuid.UUID] = set()
+    # Each batch commits on its own: rows are stamped when they are written, and a transaction spanning the
+    # whole diary would keep them invisible for longer than the change feed waits for slow writers.
+    try:
+        for batch in batched(rows, batch_size, strict=False):
+            with transaction.atomic():
+                symptom_types, created = _resolve_symptom_types(user, {row.symptom_name for row in batch})
+                entries = upsert_symptom_entries(
+                    user,
+                    (
+                        EntryWrite(
+                            entry_date=row.entry_date,
+                            symptom_type=symptom_types[row.symptom_name.lower()],
+                            intensity=row.intensity,
+                        )
+                        for row in batch
+                    ),
+                )
+            row_count += len(batch)
+            entry_uuids.update(entry.pk for entry in entries)
+            created_symptom_types += created
+            if progress is not None:
+                progress(row_count)
+    except DiaryImportError as e:
+        if not row_count:
+            raise
+        # Earlier batches stay committed; entries are upserted, so the corrected file can simply be imported again.
+        raise DiaryImportError(f"{e} The {row_count} rows before it were imported.") from e
+
+    return DiaryImportResult(rows=row_count, entries=len(entry_uuids), created_symptom_types=created_symptom_types)
@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from allergy.cache import bump_data_version_on_commit
+from allergy.models import Medication, MedicationIntake
+
+
+def record_medication_intakes(
+    user: User, medications: Iterable[Medication], intake_date: date, dose: int = 1
+) -> list[MedicationIntake]:
+    intakes = [
+        MedicationIntake(user=user, medication=medication, intake_date=intake_date, dose=dose)
+        for medication in medications
+    ]
+    if not intakes:
+        return []
+
+    with transaction.atomic():
+        # Taking a medication again on the same day only updates the dose.
+        intakes = MedicationIntake.objects.bulk_create(
+            intakes,
+            update_conflicts=True,
+            unique_fields=["user", "medication", "intake_date"],
+            update_fields=["dose", "updated_at"],
+        )
+        # bulk_create bypasses the post_save signal, so the data version is bumped here.
+        bump_data_version_on_commit(user.pk)
+    return intakes
@@ -0,0 +1,216 @@
+import asyncio
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from http import HTTPStatus
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import Client
+from django.urls import reverse
+
+from allergy.models import DeletedRecord, Medication, SymptomEntry, SymptomType
+from allergy.summaries import refresh_entry_rollups
+
+BENCHMARK_HOST = "localhost"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway user and compare requests/sec and latency of the read-only HTMX partials when served "
+        "through Django's WSGI handler (one thread per client) and its ASGI handler (one task per client). "
+        "The seeded data is deleted afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--clients", type=int, default=100, help="Number of concurrent clients.")
+        parser.add_argument("--requests", type=int, default=20, help="Requests sent by each client.")
+        parser.add_argument("--days", type=int, default=730, help="Number of days of history to seed.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated entries.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user = self._seed(options["days"], random.Random(options["seed"]))
+        try:
+            client = Client()
+            client.force_login(user)
+            cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+            paths = self._paths()
+
+            for name, run in (("WSGI", self._run_wsgi), ("ASGI", self._run_asgi)):
+                started = time.perf_counter()
+                results = run(paths, cookie, options["clients"], options["requests"])
+                self._report(name, results, time.perf_counter() - started, options["clients"])
+        finally:
+            user_pk = user.pk
+            user.delete()
+            DeletedRecord.objects.filter(user_id=user_pk).delete()
+
+    def _seed(self, days: int, rng: random.Random) -> User:
+        user = User.objects.create(username=f"benchmark-{uuid.uuid4().hex}")
+        symptom_types = SymptomType.objects.bulk_create(
+            SymptomType(user=user, name=f"Benchmark symptom {number}") for number in range(12)
+        )
+        Medication.objects.bulk_create(
+            Medication(
+                user=user,
+                medication_name=f"Benchmark medication {number}",
+                medication_type=Medication.MedicationType.PILLS,
+            )
+            for number in range(5)
+        )
+
+        first_day = date.today() - timedelta(days=days)
+        entries = SymptomEntry.objects.bulk_create(
+            (
+                SymptomEntry(
+                    user=user,
+                    entry_date=first_day + timedelta(days=offset),
+                    symptom_type=symptom_type,
+                    intensity=rng.randint(1, 10),
+                )
+                for offset in range(days + 1)
+                for symptom_type in symptom_types
+                if rng.random() < 0.5
+            ),
+            batch_size=2000,
+        )
+        refresh_entry_rollups(user.pk, (entry.entry_date for entry in entries))
+        self.stdout.write(f"Seeded {len(entries)} entries over {days} days.")
+        return user
+
+    def _paths(self) -> list[str]:
+        today = date.today()
+        return [
+            reverse("allergy:partial_calendar", kwargs={"year": today.year, "month": today.month}),
+            reverse(
+                "allergy:symptoms_container_partial",
+                kwargs={"year": today.year, "month": today.month, "day": today.day},
+            ),
+            reverse("settings:partial_existing_symptoms"),
+            reverse("settings:partial_medication_list"),
+            reverse("settings:overview_tab"),
+        ]
+
+    def _run_wsgi(self, paths: list[str], cookie: str, clients: int, requests: int) -> list[tuple[float, int]]:
+        handler = WSGIHandler()
+
+        def request(path: str) -> int:
+            statuses: list[str] = []
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": path,
+                "QUERY_STRING": "",
+                "SERVER_NAME": BENCHMARK_HOST,
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": BENCHMARK_HOST,
+                "HTTP_COOKIE": cookie,
+                "HTTP_HX_REQUEST": "true",
+                "wsgi.input": io.BytesIO(),
+                "wsgi.errors": sys.stderr,
+                "wsgi.url_scheme": "http",
+                "wsgi.version": (1, 0),
+                "wsgi.multithread": True,
+                "wsgi.multiprocess": False,
+                "wsgi.run_once": False,
+            }
+
+            def start_response(
+                status: str, headers: list[tuple[str, str]], exc_info: Any = None
+            ) -> Callable[[bytes], object]:
+                statuses.append(status)
+                return lambda data: None
+
+            body = handler(environ, start_response)
+            b"".join(body)
+            getattr(body, "close", lambda: None)()
+            return int(statuses[0].split()[0])
+
+        def run_client(client_number: int) -> list[tuple[float, int]]:
+            return self._timed(request, self._client_paths(paths, client_number, requests))
+
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            return [result for results in executor.map(run_client, range(clients)) for result in results]
+
+    def _run_asgi(self, paths: list[str], cookie: str, clients: int, requests: int) -> list[tuple[float, int]]:
+        handler = ASGIHandler()
+
+        async def request(path: str) -> int:
+            statuses: list[int] = []
+            request_sent = False
+
+            async def receive() -> dict[str, Any]:
+                nonlocal request_sent
+                if request_sent:
+                    # Nothing else arrives; Django cancels this wait once the response is sent.
+                    await asyncio.Future()
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message: Mapping[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": b"",
+                "root_path": "",
+                "headers": [(b"host", BENCHMARK_HOST.encode()), (b"cookie", cookie.encode()), (b"hx-request", b"true")],
+                "client": ("127.0.0.1", 0),
+                "server": (BENCHMARK_HOST, 80),
+            }
+            await handler(scope, receive, send)
+            return statuses[0]
+
+        async def run_client(client_number: int) -> list[tuple[float, int]]:
+            results = []
+            for path in self._client_paths(paths, client_number, requests):
+                started = time.perf_counter()
+                status = await request(path)
+                results.append((time.perf_counter() - started, status))
+            return results
+
+        async def run_clients() -> list[list[tuple[float, int]]]:
+            return await asyncio.gather(*(run_client(client_number) for client_number in range(clients)))
+
+        return [result for results in asyncio.run(run_clients()) for result in results]
+
+    @staticmethod
+    def _client_paths(paths: list[str], client_number: int, requests: int) -> list[str]:
+        return [paths[(client_number + number) % len(paths)] for number in range(requests)]
+
+    @staticmethod
+    def _timed(request: Callable[[str], int], paths: Iterable[str]) -> list[tuple[float, int]]:
+        results = []
+        for path in paths:
+            started = time.perf_counter()
+            status = request(path)
+            results.append((time.perf_counter() - started, status))
+        return results
+
+    def _report(self, name: str, results: list[tuple[float, int]], elapsed: float, clients: int) -> None:
+        latencies = sorted(latency for latency, _ in results)
+        failures = sum(1 for _, status in results if status != HTTPStatus.OK)
+        p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{name} ({clients} concurrent clients)"))
+        self.stdout.write(f"  Requests: {len(results)} ({failures} failed)")
+        self.stdout.write(f"  Requests/sec: {len(results) / elapsed:.1f}")
+        self.stdout.write(f"  p50 latency: {statistics.median(latencies) * 1000:.1f} ms")
+        self.stdout.write(f"  p99 latency: {p99 * 1000:.1f} ms")
@@ -0,0 +1,103 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import Count, Max, QuerySet, Sum
+
+from allergy.models import SymptomEntry, SymptomType
+from allergy.summaries import month_bounds
+
+COMPOSITE_INDEX_NAMES = ("entry_user_date_idx", "entry_user_type_date_idx")
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway user with a large symptom history and print the query plans and timings of the hot "
+        "SymptomEntry queries without and with the composite date indexes. All changes are rolled back."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--days", type=int, default=3650, help="Number of days of history to seed.")
+        parser.add_argument("--symptom-types", type=int, default=12, help="Number of symptom types to seed.")
+        parser.add_argument("--repeat", type=int, default=20, help="Number of timed runs per query.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated entries.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            user, symptom_type = self._seed(options["days"], options["symptom_types"], random.Random(options["seed"]))
+            queries = self._build_queries(user, symptom_type, date.today() - timedelta(days=options["days"] // 2))
+
+            indexes = [index for index in SymptomEntry._meta.indexes if index.name in COMPOSITE_INDEX_NAMES]
+            table = SymptomEntry._meta.db_table
+            schema_editor = connection.schema_editor()
+            with connection.cursor() as cursor:
+                for index in indexes:
+                    cursor.execute(
+                        schema_editor.sql_delete_index
+                        % {"table": schema_editor.quote_name(table), "name": schema_editor.quote_name(index.name)}
+                    )
+                cursor.execute(f"ANALYZE {schema_editor.quote_name(table)}")
+            self._report("Before (without composite indexes)", queries, options["repeat"])
+
+            with connection.cursor() as cursor:
+                for index in indexes:
+                    cursor.execute(str(index.create_sql(SymptomEntry, schema_editor)))
+                cursor.execute(f"ANALYZE {schema_editor.quote_name(table)}")
+            self._report("After (with composite indexes)", queries, options["repeat"])
+
+            transaction.set_rollback(True)
+
+    def _seed(self, days: int, symptom_type_count: int, rng: random.Random) -> tuple[User, SymptomType]:
+        user = User.objects.create(username=f"benchmark-{uuid.uuid4().hex}")
+        symptom_types = SymptomType.objects.bulk_create(
+            SymptomType(user=user, name=f"Benchmark symptom {number}") for number in range(symptom_type_count)
+        )
+
+        first_day = date.today() - timedelta(days=days)
+        entries = (
+            SymptomEntry(
+                user=user,
+                entry_date=first_day + timedelta(days=offset),
+                symptom_type=symptom_type,
+                intensity=rng.randint(1, 10),
+            )
+            for offset in range(days)
+            for symptom_type in symptom_types
+            if rng.random() < 0.5
+        )
+        created = SymptomEntry.objects.bulk_create(entries, batch_size=2000)
+        self.stdout.write(f"Seeded {len(created)} entries over {days} days and {symptom_type_count} symptom types.")
+        return user, symptom_types[0]
+
+    def _build_queries(self, user: User, symptom_type: SymptomType, sample_day: date) -> dict[str, QuerySet[Any]]:
+        month_start, month_end = month_bounds(sample_day.year, sample_day.month)
+        year_start, year_end = date(sample_day.year, 1, 1), date(sample_day.year + 1, 1, 1)
+        entries = SymptomEntry.objects.filter(user=user)
+        return {
+            "Month day aggregate": entries.filter(entry_date__gte=month_start, entry_date__lt=month_end)
+            .values("entry_date")
+            .annotate(entries=Count("uuid"), max_intensity=Max("intensity"), intensity_sum=Sum("intensity"))
+            .order_by(),
+            "Symptom type year": entries.filter(
+                symptom_type=symptom_type, entry_date__gte=year_start, entry_date__lt=year_end
+            ).values_list("entry_date", "intensity"),
+            "Single day": entries.filter(entry_date=sample_day).values_list("symptom_type_id", "intensity"),
+            "Recent entries": entries.order_by("-entry_date", "-created_at")[:5],
+        }
+
+    def _report(self, title: str, queries: dict[str, QuerySet[Any]], repeat: int) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append(time.perf_counter() - started)
+
+            self.stdout.write(self.style.MIGRATE_LABEL(f"{name}: best {min(timings) * 1000:.2f} ms"))
+            self.stdout.write(queryset.explain())
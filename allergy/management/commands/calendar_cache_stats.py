@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from allergy.cache import get_calendar_fragment_stats
+
+
+class Command(BaseCommand):
+    help = "Show hit and miss counters of the rendered calendar fragment cache."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = get_calendar_fragment_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_ratio = stats["hits"] / lookups if lookups else 0.0
+
+        self.stdout.write(f"Hits: {stats['hits']}")
+        self.stdout.write(f"Misses: {stats['misses']}")
+        self.stdout.write(f"Hit ratio: {hit_ratio:.1%}")
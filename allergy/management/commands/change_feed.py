@@ -0,0 +1,36 @@
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.serializers.json import DjangoJSONEncoder
+
+from allergy.change_feed import CHANGE_FEED_PAGE_SIZE, get_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Write SymptomEntry, SymptomType and Medication changes (including deletions) after a cursor as NDJSON. "
+        "The cursor to resume from is printed to stderr."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--since", default=None, help="Cursor returned by a previous run.")
+        parser.add_argument("--page-size", type=int, default=CHANGE_FEED_PAGE_SIZE, help="Changes read per page.")
+        parser.add_argument("--max-pages", type=int, default=None, help="Stop after this many pages.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        cursor = options["since"]
+        pages = 0
+        has_more = True
+        while has_more and (options["max_pages"] is None or pages < options["max_pages"]):
+            try:
+                page = get_changes(cursor, limit=options["page_size"])
+            except ValueError as e:
+                raise CommandError(str(e)) from e
+            for change in page.changes:
+                self.stdout.write(json.dumps(change.as_dict(), cls=DjangoJSONEncoder))
+            cursor = page.next_cursor
+            has_more = page.has_more
+            pages += 1
+
+        self.stderr.write(f"Next cursor: {cursor}")
@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from allergy.imports import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    DiaryImportError,
+    import_diary,
+    import_format_for_filename,
+    parse_diary,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a CSV or NDJSON symptom diary (date, symptom, intensity) for a user. Missing symptom types are "
+        "created and existing entries for the same day and symptom are overwritten."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("username", help="User the diary belongs to.")
+        parser.add_argument("path", type=Path, help="Diary file to import.")
+        parser.add_argument(
+            "--format", choices=IMPORT_FORMATS, default=None, help="File format; defaults to the file extension."
+        )
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Rows written per batch.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist as e:
+            raise CommandError(f"User {options['username']} does not exist.") from e
+
+        path: Path = options["path"]
+        import_format = options["format"] or import_format_for_filename(path.name)
+        if import_format is None:
+            raise CommandError("Cannot tell the file format from its extension; pass --format.")
+
+        try:
+            with path.open(encoding="utf-8-sig", newline="") as diary:
+                result = import_diary(
+                    user,
+                    parse_diary(diary, import_format),
+                    batch_size=options["batch_size"],
+                    progress=lambda rows: self.stderr.write(f"Imported {rows} rows..."),
+                )
+        except (OSError, UnicodeDecodeError, DiaryImportError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.rows} rows into {result.entries} entries "
+                f"and created {result.created_symptom_types} symptom types."
+            )
+        )
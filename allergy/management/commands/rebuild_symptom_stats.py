@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from allergy.summaries import rebuild_entry_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the month summaries and symptom stats of every user, or of one user, from their symptom entries. "
+        "Use it after writing entries outside of the application code."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--user", dest="username", default=None, help="Only rebuild the stats of this user.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        users = User.objects.order_by("pk")
+        if options["username"] is not None:
+            users = users.filter(username=options["username"])
+            if not users.exists():
+                raise CommandError(f"User {options['username']} does not exist.")
+
+        rebuilt = 0
+        for user_id in users.values_list("pk", flat=True).iterator():
+            rebuild_entry_rollups(user_id)
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt symptom stats for {rebuilt} users."))
@@ -0,0 +1,108 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+
+from django.contrib.auth.models import User
+
+from allergy.cache import cached_analysis
+from allergy.models import DailyEntrySummary, Medication, MedicationIntake
+
+EFFECT_WINDOW_DAYS = 3
+
+
+@dataclass(frozen=True)
+class MedicationEffect:
+    medication_uuid: uuid.UUID
+    name: str
+    icon_html: str
+    intake_count: int
+    # Mean daily symptom burden (sum of all intensities of a day) in the windows before and after the intakes.
+    mean_before: float
+    mean_after: float
+    improved_share: float
+
+    @property
+    def change(self) -> float:
+        return round(self.mean_after - self.mean_before, 1)
+
+    @property
+    def change_css_class(self) -> str:
+        if self.change < 0:
+            return "text-green-700"
+        if self.change > 0:
+            return "text-red-600"
+        return "text-gray-500"
+
+
+def _window_means(
+    burden: list[int], intake_days: list[int], medication_codes: list[int], medication_count: int
+) -> tuple[list[int], list[float], list[float], list[float]]:
+    # Window sums come from one cumulative sum of the daily series; the intake day itself is in neither window.
+    running_sums = list(accumulate(burden, initial=0))
+    intake_counts = [0] * medication_count
+    before_sums = [0.0] * medication_count
+    after_sums = [0.0] * medication_count
+    improved = [0] * medication_count
+    for day, code in zip(intake_days, medication_codes, strict=True):
+        before_mean = (running_sums[day] - running_sums[day - EFFECT_WINDOW_DAYS]) / EFFECT_WINDOW_DAYS
+        after_mean = (running_sums[day + 1 + EFFECT_WINDOW_DAYS] - running_sums[day + 1]) / EFFECT_WINDOW_DAYS
+        intake_counts[code] += 1
+        before_sums[code] += before_mean
+        after_sums[code] += after_mean
+        improved[code] += after_mean < before_mean
+    return (
+        intake_counts,
+        [total / count if count else 0.0 for total, count in zip(before_sums, intake_counts, strict=True)],
+        [total / count if count else 0.0 for total, count in zip(after_sums, intake_counts, strict=True)],
+        [total / count if count else 0.0 for total, count in zip(improved, intake_counts, strict=True)],
+    )
+
+
+def compute_medication_effects(user: User, today: date) -> list[MedicationEffect]:
+    # Intakes whose after window has not passed yet cannot be compared.
+    intakes = list(
+        MedicationIntake.objects.filter(user=user, intake_date__lte=today - timedelta(days=EFFECT_WINDOW_DAYS))
+        .values_list("medication_id", "intake_date")
+        .order_by("intake_date")
+    )
+    if not intakes:
+        return []
+
+    medications = list(Medication.objects.filter(user=user).order_by("medication_name", "medication_type"))
+    codes = {medication.uuid: code for code, medication in enumerate(medications)}
+    series_start = intakes[0][1] - timedelta(days=EFFECT_WINDOW_DAYS)
+    series_end = intakes[-1][1] + timedelta(days=EFFECT_WINDOW_DAYS)
+
+    burden = [0] * ((series_end - series_start).days + 1)
+    day_summaries = DailyEntrySummary.objects.filter(
+        user=user, entry_date__gte=series_start, entry_date__lte=series_end
+    ).values_list("entry_date", "intensity_sum")
+    for entry_date, intensity_sum in day_summaries:
+        burden[(entry_date - series_start).days] = intensity_sum
+
+    counts, means_before, means_after, improved_shares = _window_means(
+        burden,
+        [(intake_date - series_start).days for _, intake_date in intakes],
+        [codes[medication_uuid] for medication_uuid, _ in intakes],
+        len(medications),
+    )
+    return [
+        MedicationEffect(
+            medication_uuid=medication.uuid,
+            name=medication.medication_name,
+            icon_html=medication.icon_html,
+            intake_count=counts[code],
+            mean_before=round(means_before[code], 1),
+            mean_after=round(means_after[code], 1),
+            improved_share=improved_shares[code],
+        )
+        for code, medication in enumerate(medications)
+        if counts[code]
+    ]
+
+
+def get_medication_effects(user: User, today: date) -> list[MedicationEffect]:
+    return cached_analysis(
+        user.pk, f"medication-effects:{today.isoformat()}", lambda: compute_medication_effects(user, today)
+    )
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.3 on 2026-10-18 05:58
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def backfill_month_summaries(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    symptom_entry_model = apps.get_model("allergy", "SymptomEntry")
+    summary_model = apps.get_model("allergy", "MonthlyEntrySummary")
+
+    summaries = {}
+    day_counts = (
+        symptom_entry_model.objects.values("user_id", "entry_date").annotate(entries=models.Count("uuid")).order_by()
+    )
+    for row in day_counts.iterator(chunk_size=2000):
+        entry_date = row["entry_date"]
+        key = (row["user_id"], entry_date.year, entry_date.month)
+        if key not in summaries:
+            summaries[key] = summary_model(
+                user_id=row["user_id"], year=entry_date.year, month=entry_date.month, day_mask=0, entry_count=0
+            )
+        summaries[key].day_mask |= 1 << (entry_date.day - 1)
+        summaries[key].entry_count += row["entries"]
+
+    summary_model.objects.bulk_create(summaries.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0006_alter_medication_medication_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyEntrySummary",
+            fields=[
+                ("updated_at", models.DateTimeField(auto_now=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("year", models.IntegerField()),
+                ("month", models.IntegerField()),
+                ("day_mask", models.IntegerField(default=0)),
+                ("entry_count", models.IntegerField(default=0)),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "unique_together": {("user", "year", "month")},
+            },
+        ),
+        migrations.RunPython(backfill_month_summaries, migrations.RunPython.noop),
+    ]
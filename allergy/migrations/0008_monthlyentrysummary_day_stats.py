@@ -0,0 +1,49 @@
+# Generated by Django 6.0.3 on 2026-10-18 06:15
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def backfill_day_stats(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    symptom_entry_model = apps.get_model("allergy", "SymptomEntry")
+    summary_model = apps.get_model("allergy", "MonthlyEntrySummary")
+
+    day_stats: dict[tuple[int, int, int], dict[str, list[int]]] = {}
+    day_aggregates = (
+        symptom_entry_model.objects.values("user_id", "entry_date")
+        .annotate(
+            entries=models.Count("uuid"),
+            max_intensity=models.Max("intensity"),
+            intensity_sum=models.Sum("intensity"),
+        )
+        .order_by()
+    )
+    for row in day_aggregates.iterator(chunk_size=2000):
+        entry_date = row["entry_date"]
+        key = (row["user_id"], entry_date.year, entry_date.month)
+        day_stats.setdefault(key, {})[str(entry_date.day)] = [
+            row["entries"],
+            row["max_intensity"],
+            row["intensity_sum"],
+        ]
+
+    summaries = list(summary_model.objects.all())
+    for summary in summaries:
+        summary.day_stats = day_stats.get((summary.user_id, summary.year, summary.month), {})
+    summary_model.objects.bulk_update(summaries, ["day_stats"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0007_monthlyentrysummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlyentrysummary",
+            name="day_stats",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RunPython(backfill_day_stats, migrations.RunPython.noop),
+    ]
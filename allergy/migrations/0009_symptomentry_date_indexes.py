@@ -0,0 +1,24 @@
+# Generated by Django 6.0.3 on 2026-10-18 06:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0008_monthlyentrysummary_day_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="symptomentry",
+            index=models.Index(fields=["user", "entry_date"], include=("intensity",), name="entry_user_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="symptomentry",
+            index=models.Index(
+                fields=["user", "symptom_type", "entry_date"], include=("intensity",), name="entry_user_type_date_idx"
+            ),
+        ),
+    ]
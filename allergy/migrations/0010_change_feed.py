@@ -0,0 +1,62 @@
+# Generated by Django 6.0.3 on 2026-10-18 06:41
+
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def backfill_updated_at(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    for model_name in ("SymptomEntry", "SymptomType", "Medication"):
+        model = apps.get_model("allergy", model_name)
+        model.objects.filter(updated_at__isnull=True).update(updated_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0009_symptomentry_date_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletedRecord",
+            fields=[
+                ("updated_at", models.DateTimeField(auto_now=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("user_id", models.IntegerField()),
+                (
+                    "record_type",
+                    models.CharField(
+                        choices=[
+                            ("symptom_entry", "Symptom Entry"),
+                            ("symptom_type", "Symptom Type"),
+                            ("medication", "Medication"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("record_uuid", models.UUIDField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="medication",
+            index=models.Index(fields=["updated_at", "uuid"], name="medication_change_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="symptomentry",
+            index=models.Index(fields=["updated_at", "uuid"], name="entry_change_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="symptomtype",
+            index=models.Index(fields=["updated_at", "uuid"], name="symptomtype_change_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="deletedrecord",
+            index=models.Index(fields=["created_at", "uuid"], name="deletedrecord_change_feed_idx"),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 6.0.3 on 2026-10-18 07:16
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def backfill_user_symptom_stats(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    symptom_entry_model = apps.get_model("allergy", "SymptomEntry")
+    stats_model = apps.get_model("allergy", "UserSymptomStats")
+
+    type_counts: dict[int, dict[str, int]] = {}
+    type_aggregates = symptom_entry_model.objects.values("user_id", "symptom_type_id").annotate(
+        entries=models.Count("uuid")
+    )
+    for row in type_aggregates.order_by().iterator(chunk_size=2000):
+        type_counts.setdefault(row["user_id"], {})[str(row["symptom_type_id"])] = row["entries"]
+
+    user_aggregates = (
+        symptom_entry_model.objects.values("user_id")
+        .annotate(
+            entries=models.Count("uuid"),
+            days=models.Count("entry_date", distinct=True),
+            intensity_sum=models.Sum("intensity"),
+            latest_entry_date=models.Max("entry_date"),
+        )
+        .order_by()
+    )
+    stats_model.objects.bulk_create(
+        (
+            stats_model(
+                user_id=row["user_id"],
+                entry_count=row["entries"],
+                day_count=row["days"],
+                intensity_sum=row["intensity_sum"],
+                latest_entry_date=row["latest_entry_date"],
+                type_counts=type_counts.get(row["user_id"], {}),
+            )
+            for row in user_aggregates.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0010_change_feed"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserSymptomStats",
+            fields=[
+                ("updated_at", models.DateTimeField(auto_now=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("entry_count", models.IntegerField(default=0)),
+                ("day_count", models.IntegerField(default=0)),
+                ("intensity_sum", models.IntegerField(default=0)),
+                ("latest_entry_date", models.DateField(null=True)),
+                ("type_counts", models.JSONField(default=dict)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="symptom_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.RunPython(backfill_user_symptom_stats, migrations.RunPython.noop),
+    ]
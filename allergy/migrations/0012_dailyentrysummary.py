@@ -0,0 +1,73 @@
+# Generated by Django 6.0.3 on 2026-10-18 07:26
+
+import uuid
+from itertools import groupby
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def backfill_day_summaries(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    symptom_entry_model = apps.get_model("allergy", "SymptomEntry")
+    summary_model = apps.get_model("allergy", "DailyEntrySummary")
+
+    summaries: list[models.Model] = []
+    entries = (
+        symptom_entry_model.objects.values_list("user_id", "entry_date", "symptom_type_id", "intensity")
+        .order_by("user_id", "entry_date")
+        .iterator(chunk_size=2000)
+    )
+    for (user_id, entry_date), day_entries in groupby(entries, key=lambda entry: (entry[0], entry[1])):
+        type_intensities = {str(symptom_type_id): intensity for _, _, symptom_type_id, intensity in day_entries}
+        summaries.append(
+            summary_model(
+                user_id=user_id,
+                entry_date=entry_date,
+                entry_count=len(type_intensities),
+                max_intensity=max(type_intensities.values()),
+                intensity_sum=sum(type_intensities.values()),
+                type_intensities=type_intensities,
+            )
+        )
+        if len(summaries) >= 1000:
+            summary_model.objects.bulk_create(summaries)
+            summaries = []
+    summary_model.objects.bulk_create(summaries)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0011_user_symptom_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyEntrySummary",
+            fields=[
+                ("updated_at", models.DateTimeField(auto_now=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("entry_date", models.DateField()),
+                ("entry_count", models.IntegerField(default=0)),
+                ("max_intensity", models.IntegerField(default=0)),
+                ("intensity_sum", models.IntegerField(default=0)),
+                ("type_intensities", models.JSONField(default=dict)),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "entry_date"],
+                        include=("entry_count", "max_intensity", "intensity_sum"),
+                        name="dailysummary_user_date_idx",
+                    )
+                ],
+                "unique_together": {("user", "entry_date")},
+            },
+        ),
+        migrations.RunPython(backfill_day_summaries, migrations.RunPython.noop),
+    ]
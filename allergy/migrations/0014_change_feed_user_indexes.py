@@ -0,0 +1,30 @@
+# Generated by Django 6.0.3 on 2026-10-18 09:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("allergy", "0013_medicationintake"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="deletedrecord",
+            index=models.Index(fields=["user_id", "created_at", "uuid"], name="deletedrecord_user_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="medication",
+            index=models.Index(fields=["user", "updated_at", "uuid"], name="medication_user_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="symptomentry",
+            index=models.Index(fields=["user", "updated_at", "uuid"], name="entry_user_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="symptomtype",
+            index=models.Index(fields=["user", "updated_at", "uuid"], name="symptomtype_user_feed_idx"),
+        ),
+    ]
@@ -1,4 +1,6 @@
 import uuid
+from collections.abc import Collection
+from typing import Any, Self
 
 from django.contrib.auth.models import User
 from django.core.validators import MaxValueValidator, MinValueValidator
@@ -8,8 +10,11 @@ from django.db.models import (
     DateField,
     DateTimeField,
     ForeignKey,
+    Index,
     IntegerField,
+    JSONField,
     Model,
+    OneToOneField,
     TextChoices,
     UUIDField,
 )
@@ -30,6 +35,11 @@ class SymptomType(TimestampedModelMixin):
 
     class Meta:
         unique_together = ("name", "user")
+        # The change feed API reads one user's changes, the change_feed command reads everyone's.
+        indexes = [
+            Index(fields=["user", "updated_at", "uuid"], name="symptomtype_user_feed_idx"),
+            Index(fields=["updated_at", "uuid"], name="symptomtype_change_feed_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -44,10 +54,25 @@ class SymptomEntry(TimestampedModelMixin):
 
     class Meta:
         unique_together = ("user", "entry_date", "symptom_type")
+        indexes = [
+            Index(fields=["user", "entry_date"], include=["intensity"], name="entry_user_date_idx"),
+            Index(
+                fields=["user", "symptom_type", "entry_date"], include=["intensity"], name="entry_user_type_date_idx"
+            ),
+            Index(fields=["user", "updated_at", "uuid"], name="entry_user_feed_idx"),
+            Index(fields=["updated_at", "uuid"], name="entry_change_feed_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.entry_date} - {self.symptom_type.name} ({self.intensity})"
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Collection[str], values: Collection[Any], **kwargs: Any) -> Self:
+        instance = super().from_db(db, field_names, values, **kwargs)
+        # Saving an entry moved to another day or symptom type must refresh the rollups it was moved away from too.
+        instance._loaded_values = dict(zip(field_names, values, strict=True))  # type: ignore[attr-defined]
+        return instance
+
 
 class Medication(TimestampedModelMixin):
     class MedicationType(TextChoices):
@@ -65,6 +90,10 @@ class Medication(TimestampedModelMixin):
 
     class Meta:
         unique_together = ("user", "medication_name", "medication_type")
+        indexes = [
+            Index(fields=["user", "updated_at", "uuid"], name="medication_user_feed_idx"),
+            Index(fields=["updated_at", "uuid"], name="medication_change_feed_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.medication_name} - {self.medication_type}"
@@ -84,3 +113,105 @@ class Medication(TimestampedModelMixin):
     @property
     def icon_html(self) -> str:
         return self.get_medication_icon_for_type(self.medication_type)
+
+
+class MedicationIntake(TimestampedModelMixin):
+    uuid = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = ForeignKey(User, on_delete=CASCADE)
+    medication = ForeignKey(Medication, on_delete=CASCADE, related_name="intakes")
+    intake_date = DateField()
+    dose = IntegerField(default=1, validators=[MinValueValidator(1), MaxValueValidator(10)])
+
+    class Meta:
+        unique_together = ("user", "medication", "intake_date")
+        indexes = [Index(fields=["user", "intake_date"], name="intake_user_date_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.intake_date} - {self.medication.medication_name} ({self.dose})"
+
+
+class MonthlyEntrySummary(TimestampedModelMixin):
+    uuid = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = ForeignKey(User, on_delete=CASCADE)
+    year = IntegerField()
+    month = IntegerField()
+    day_mask = IntegerField(default=0)
+    entry_count = IntegerField(default=0)
+    day_stats = JSONField(default=dict)
+
+    class Meta:
+        unique_together = ("user", "year", "month")
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.year}-{self.month:02d} ({self.entry_count})"
+
+    @staticmethod
+    def days_from_mask(day_mask: int) -> list[int]:
+        return [day for day in range(1, 32) if day_mask & (1 << (day - 1))]
+
+    @property
+    def days(self) -> list[int]:
+        return self.days_from_mask(self.day_mask)
+
+
+class DailyEntrySummary(TimestampedModelMixin):
+    uuid = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = ForeignKey(User, on_delete=CASCADE)
+    entry_date = DateField()
+    entry_count = IntegerField(default=0)
+    max_intensity = IntegerField(default=0)
+    intensity_sum = IntegerField(default=0)
+    # {str(symptom_type_uuid): intensity}; there is at most one entry per symptom type and day.
+    type_intensities = JSONField(default=dict)
+
+    class Meta:
+        unique_together = ("user", "entry_date")
+        indexes = [
+            Index(
+                fields=["user", "entry_date"],
+                include=["entry_count", "max_intensity", "intensity_sum"],
+                name="dailysummary_user_date_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.entry_date} ({self.entry_count})"
+
+
+class UserSymptomStats(TimestampedModelMixin):
+    uuid = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = OneToOneField(User, on_delete=CASCADE, related_name="symptom_stats")
+    entry_count = IntegerField(default=0)
+    day_count = IntegerField(default=0)
+    intensity_sum = IntegerField(default=0)
+    latest_entry_date = DateField(null=True)
+    type_counts = JSONField(default=dict)
+
+    def __str__(self) -> str:
+        return f"{self.user} ({self.entry_count} entries)"
+
+    @property
+    def average_intensity(self) -> float | None:
+        return self.intensity_sum / self.entry_count if self.entry_count else None
+
+
+class DeletedRecord(TimestampedModelMixin):
+    class RecordType(TextChoices):
+        SYMPTOM_ENTRY = "symptom_entry", "Symptom Entry"
+        SYMPTOM_TYPE = "symptom_type", "Symptom Type"
+        MEDICATION = "medication", "Medication"
+
+    uuid = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Not a foreign key: tombstones must outlive the user whose deletion produced them.
+    user_id = IntegerField()
+    record_type = CharField(max_length=32, choices=RecordType.choices)
+    record_uuid = UUIDField()
+
+    class Meta:
+        indexes = [
+            Index(fields=["user_id", "created_at", "uuid"], name="deletedrecord_user_feed_idx"),
+            Index(fields=["created_at", "uuid"], name="deletedrecord_change_feed_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.record_type} {self.record_uuid} (user {self.user_id})"
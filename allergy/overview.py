@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from django.contrib.auth.models import User
+
+from allergy.models import SymptomEntry, SymptomType, UserSymptomStats
+
+OVERVIEW_LIST_SIZE = 5
+
+
+@dataclass(frozen=True)
+class EntryOverview:
+    days_with_symptoms: int
+    total_entries: int
+    average_intensity: float | None
+    latest_entry_date: date | None
+    recent_entries: list[SymptomEntry]
+    top_symptoms: list[dict[str, Any]]
+
+
+async def aget_entry_overview(user: User) -> EntryOverview:
+    stats = await UserSymptomStats.objects.filter(user=user).afirst() or UserSymptomStats(user=user)
+
+    recent_entries: list[SymptomEntry] = []
+    top_symptoms: list[dict[str, Any]] = []
+    if stats.entry_count:
+        recent_entries = [
+            entry
+            async for entry in SymptomEntry.objects.filter(user=user)
+            .select_related("symptom_type")
+            .order_by("-entry_date", "-created_at", "symptom_type__name")[:OVERVIEW_LIST_SIZE]
+        ]
+        # The counts come from the stats row, so only the names of the counted symptom types are read.
+        top_symptoms = [
+            {"symptom_type": type_uuid, "symptom_type__name": name, "count": stats.type_counts[str(type_uuid)]}
+            async for type_uuid, name in SymptomType.objects.filter(
+                user=user, uuid__in=list(stats.type_counts)
+            ).values_list("uuid", "name")
+        ]
+        top_symptoms.sort(key=lambda symptom: (-symptom["count"], symptom["symptom_type__name"]))
+        del top_symptoms[OVERVIEW_LIST_SIZE:]
+
+    return EntryOverview(
+        days_with_symptoms=stats.day_count,
+        total_entries=stats.entry_count,
+        average_intensity=stats.average_intensity,
+        latest_entry_date=stats.latest_entry_date,
+        recent_entries=recent_entries,
+        top_symptoms=top_symptoms,
+    )
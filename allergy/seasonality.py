@@ -0,0 +1,126 @@
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+
+from allergy.cache import cached_analysis
+from allergy.models import DailyEntrySummary, SymptomType
+from allergy.summaries import HEAT_CSS_CLASSES
+
+WEEKS_IN_YEAR = 53
+HIGH_FREQUENCY = 0.5
+MEDIUM_FREQUENCY = 0.2
+# A season starts in the first week reaching this share of the symptom's peak frequency.
+SEASON_START_SHARE = 0.5
+# 2020 has 53 ISO weeks, so every week number maps to a date.
+LABEL_YEAR = 2020
+
+
+@dataclass(frozen=True)
+class WeekProfile:
+    week: int
+    entry_count: int
+    intensity_sum: int
+    # Share of the days in this week, from the first to the latest logged day, with an entry for the symptom.
+    frequency: float
+
+    @property
+    def average_intensity(self) -> float | None:
+        return round(self.intensity_sum / self.entry_count, 1) if self.entry_count else None
+
+    @property
+    def label(self) -> str:
+        starts = date.fromisocalendar(LABEL_YEAR, self.week, 1).strftime("%b %d")
+        if not self.entry_count:
+            return f"Week {self.week} ({starts}): no entries"
+        return f"Week {self.week} ({starts}): {self.frequency:.0%} of days, mean intensity {self.average_intensity}"
+
+    @property
+    def heat_css_class(self) -> str:
+        if self.frequency >= HIGH_FREQUENCY:
+            return HEAT_CSS_CLASSES[3]
+        if self.frequency >= MEDIUM_FREQUENCY:
+            return HEAT_CSS_CLASSES[2]
+        if self.frequency > 0:
+            return HEAT_CSS_CLASSES[1]
+        return "bg-gray-100"
+
+
+@dataclass(frozen=True)
+class SymptomSeasonality:
+    symptom_type_uuid: uuid.UUID
+    name: str
+    weeks: list[WeekProfile]
+
+    @property
+    def peak_week(self) -> WeekProfile:
+        return max(self.weeks, key=lambda week: (week.frequency, week.intensity_sum))
+
+    @property
+    def season_start_week(self) -> WeekProfile:
+        threshold = self.peak_week.frequency * SEASON_START_SHARE
+        return next(week for week in self.weeks if week.frequency >= threshold)
+
+    @property
+    def season_start_label(self) -> str:
+        # ISO weeks belong to the month of their Thursday.
+        return date.fromisocalendar(LABEL_YEAR, self.season_start_week.week, 4).strftime("%B")
+
+
+@dataclass(frozen=True)
+class SeasonalityReport:
+    first_year: int | None
+    last_year: int | None
+    symptoms: list[SymptomSeasonality]
+
+
+def _days_per_week(first_date: date, last_date: date) -> Counter[int]:
+    days: Counter[int] = Counter()
+    day = first_date
+    while day <= last_date:
+        days[day.isocalendar().week] += 1
+        day += timedelta(days=1)
+    return days
+
+
+def compute_seasonality(user: User, today: date) -> SeasonalityReport:
+    # The day summaries hold one row per logged day with the intensity of every symptom type on it.
+    day_summaries = (
+        DailyEntrySummary.objects.filter(user=user, entry_date__lte=today)
+        .values_list("entry_date", "type_intensities")
+        .order_by("entry_date")
+    )
+    weeks_by_type: dict[str, dict[int, list[int]]] = {}
+    first_date = last_date = None
+    for entry_date, type_intensities in day_summaries:
+        first_date = first_date or entry_date
+        last_date = entry_date
+        week = entry_date.isocalendar().week
+        for type_uuid, intensity in type_intensities.items():
+            week_totals = weeks_by_type.setdefault(type_uuid, {}).setdefault(week, [0, 0])
+            week_totals[0] += 1
+            week_totals[1] += intensity
+    if first_date is None or last_date is None:
+        return SeasonalityReport(first_year=None, last_year=None, symptoms=[])
+
+    # Only days the user could have logged count, so weeks before the first entry or after today are not diluted.
+    days_per_week = _days_per_week(first_date, last_date)
+
+    symptoms = []
+    for type_uuid, name in SymptomType.objects.filter(user=user, uuid__in=weeks_by_type).values_list("uuid", "name"):
+        weeks = []
+        for week in range(1, WEEKS_IN_YEAR + 1):
+            entry_count, intensity_sum = weeks_by_type[str(type_uuid)].get(week, (0, 0))
+            frequency = entry_count / days_per_week[week] if days_per_week[week] else 0
+            weeks.append(
+                WeekProfile(week=week, entry_count=entry_count, intensity_sum=intensity_sum, frequency=frequency)
+            )
+        symptoms.append(SymptomSeasonality(symptom_type_uuid=type_uuid, name=name, weeks=weeks))
+    symptoms.sort(key=lambda symptom: (symptom.season_start_week.week, symptom.name))
+    return SeasonalityReport(first_year=first_date.year, last_year=last_date.year, symptoms=symptoms)
+
+
+def get_seasonality(user: User, today: date) -> SeasonalityReport:
+    return cached_analysis(user.pk, f"seasonality:{today.isoformat()}", lambda: compute_seasonality(user, today))
@@ -0,0 +1,120 @@
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from allergy.cache import bump_data_version_on_commit
+from allergy.models import DeletedRecord, Medication, MedicationIntake, SymptomEntry, SymptomType
+from allergy.summaries import refresh_entry_rollups
+
+
+def _deletion_started_from(origin: Model | QuerySet[Any] | None, model: type[Model]) -> bool:
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
+
+
+@receiver(post_save, sender=SymptomEntry)
+def symptom_entry_saved(sender: type[SymptomEntry], instance: SymptomEntry, **kwargs: Any) -> None:
+    loaded_values = getattr(instance, "_loaded_values", {})
+    refresh_entry_rollups(instance.user_id, [instance.entry_date, loaded_values.get("entry_date", instance.entry_date)])
+    bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(post_delete, sender=SymptomEntry)
+def symptom_entry_deleted(
+    sender: type[SymptomEntry], instance: SymptomEntry, origin: Model | QuerySet[Any] | None = None, **kwargs: Any
+) -> None:
+    # Cascades from a symptom type are refreshed and bumped once per type below, and cascades from a user
+    # remove the summaries together with the user.
+    if _deletion_started_from(origin, SymptomEntry):
+        refresh_entry_rollups(instance.user_id, [instance.entry_date])
+        DeletedRecord.objects.create(
+            user_id=instance.user_id, record_type=DeletedRecord.RecordType.SYMPTOM_ENTRY, record_uuid=instance.uuid
+        )
+        bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(pre_delete, sender=SymptomType)
+def symptom_type_deleting(sender: type[SymptomType], instance: SymptomType, **kwargs: Any) -> None:
+    instance._affected_entries = list(  # type: ignore[attr-defined]
+        SymptomEntry.objects.filter(symptom_type=instance).values_list("uuid", "entry_date")
+    )
+
+
+@receiver(post_delete, sender=SymptomType)
+def symptom_type_deleted(
+    sender: type[SymptomType], instance: SymptomType, origin: Model | QuerySet[Any] | None = None, **kwargs: Any
+) -> None:
+    if _deletion_started_from(origin, SymptomType):
+        affected_entries = getattr(instance, "_affected_entries", [])
+        refresh_entry_rollups(instance.user_id, [entry_date for _, entry_date in affected_entries])
+        DeletedRecord.objects.bulk_create(
+            [
+                DeletedRecord(
+                    user_id=instance.user_id,
+                    record_type=DeletedRecord.RecordType.SYMPTOM_ENTRY,
+                    record_uuid=entry_uuid,
+                )
+                for entry_uuid, _ in affected_entries
+            ]
+            + [
+                DeletedRecord(
+                    user_id=instance.user_id,
+                    record_type=DeletedRecord.RecordType.SYMPTOM_TYPE,
+                    record_uuid=instance.uuid,
+                )
+            ]
+        )
+    bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(post_delete, sender=Medication)
+def medication_deleted(
+    sender: type[Medication], instance: Medication, origin: Model | QuerySet[Any] | None = None, **kwargs: Any
+) -> None:
+    if _deletion_started_from(origin, Medication):
+        DeletedRecord.objects.create(
+            user_id=instance.user_id, record_type=DeletedRecord.RecordType.MEDICATION, record_uuid=instance.uuid
+        )
+        bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(pre_delete, sender=User)
+def user_deleting(sender: type[User], instance: User, **kwargs: Any) -> None:
+    # Cascaded rows skip their own tombstones above, so the whole history is tombstoned here in bulk.
+    deleted_records = [
+        DeletedRecord(user_id=instance.pk, record_type=record_type, record_uuid=record_uuid)
+        for record_type, model in (
+            (DeletedRecord.RecordType.SYMPTOM_ENTRY, SymptomEntry),
+            (DeletedRecord.RecordType.SYMPTOM_TYPE, SymptomType),
+            (DeletedRecord.RecordType.MEDICATION, Medication),
+        )
+        for record_uuid in model._default_manager.filter(user=instance).values_list("uuid", flat=True)
+    ]
+    DeletedRecord.objects.bulk_create(deleted_records, batch_size=1000)
+    # Cascaded rows do not bump the data version either; this keeps a reused user id from seeing stale caches.
+    bump_data_version_on_commit(instance.pk)
+
+
+@receiver(post_delete, sender=MedicationIntake)
+def medication_intake_deleted(
+    sender: type[MedicationIntake],
+    instance: MedicationIntake,
+    origin: Model | QuerySet[Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    # Intakes deleted with their medication or user are covered by the bump of the deletion they came from.
+    if _deletion_started_from(origin, MedicationIntake):
+        bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(post_save, sender=SymptomType)
+@receiver(post_save, sender=Medication)
+@receiver(post_save, sender=MedicationIntake)
+def user_data_changed(
+    sender: type[Model], instance: SymptomType | Medication | MedicationIntake, **kwargs: Any
+) -> None:
+    bump_data_version_on_commit(instance.user_id)
@@ -0,0 +1,324 @@
+import calendar
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import batched
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+
+from allergy.models import DailyEntrySummary, MonthlyEntrySummary, SymptomEntry, UserSymptomStats
+
+MEDIUM_HEAT_MIN_INTENSITY = 4
+HIGH_HEAT_MIN_INTENSITY = 7
+HEAT_CSS_CLASSES = {1: "bg-yellow-50", 2: "bg-orange-100", 3: "bg-red-200"}
+DAY_SUMMARY_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class DayStats:
+    entry_count: int
+    max_intensity: int
+    intensity_sum: int
+
+    @property
+    def mean_intensity(self) -> float:
+        return round(self.intensity_sum / self.entry_count, 1)
+
+    @property
+    def label(self) -> str:
+        symptoms = "symptom" if self.entry_count == 1 else "symptoms"
+        return f"{self.entry_count} {symptoms}, max intensity {self.max_intensity}, mean {self.mean_intensity}"
+
+    @property
+    def heat_level(self) -> int:
+        if self.max_intensity >= HIGH_HEAT_MIN_INTENSITY:
+            return 3
+        if self.max_intensity >= MEDIUM_HEAT_MIN_INTENSITY:
+            return 2
+        return 1
+
+    @property
+    def heat_css_class(self) -> str:
+        return HEAT_CSS_CLASSES[self.heat_level]
+
+
+@dataclass
+class UserStatsDelta:
+    entry_count: int = 0
+    day_count: int = 0
+    intensity_sum: int = 0
+    type_counts: Counter[str] = field(default_factory=Counter)
+    added_dates: list[date] = field(default_factory=list)
+    removed_dates: list[date] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.entry_count
+            or self.day_count
+            or self.intensity_sum
+            or any(self.type_counts.values())
+            or self.added_dates
+            or self.removed_dates
+        )
+
+
+@dataclass(frozen=True)
+class MonthEntries:
+    days_with_entries: list[int]
+    day_stats: dict[int, DayStats]
+
+
+def month_bounds(year: int, month: int) -> tuple[date, date]:
+    start = date(year, month, 1)
+    last_day = calendar.monthrange(year, month)[1]
+    end = date.fromordinal(start.toordinal() + last_day)
+    return start, end
+
+
+def refresh_day_summaries(user_id: int, dates: Iterable[date]) -> UserStatsDelta:
+    # Returns the difference between the old and new summaries of the refreshed days, which is what the user's
+    # stats row must be moved by.
+    delta = UserStatsDelta()
+    for batch in batched(sorted(set(dates)), DAY_SUMMARY_BATCH_SIZE, strict=False):
+        previous = DailyEntrySummary.objects.filter(user_id=user_id, entry_date__in=batch).values_list(
+            "entry_date", "entry_count", "intensity_sum", "type_intensities"
+        )
+        for entry_date, entry_count, intensity_sum, type_intensities in previous:
+            delta.entry_count -= entry_count
+            delta.day_count -= 1
+            delta.intensity_sum -= intensity_sum
+            delta.type_counts.subtract(type_intensities.keys())
+            delta.removed_dates.append(entry_date)
+
+        summaries: dict[date, DailyEntrySummary] = {}
+        entries = SymptomEntry.objects.filter(user_id=user_id, entry_date__in=batch).values_list(
+            "entry_date", "symptom_type_id", "intensity"
+        )
+        for entry_date, symptom_type_id, intensity in entries.order_by():
+            summary = summaries.get(entry_date)
+            if summary is None:
+                summary = summaries[entry_date] = DailyEntrySummary(
+                    user_id=user_id, entry_date=entry_date, entry_count=0, max_intensity=0, intensity_sum=0
+                )
+            summary.entry_count += 1
+            summary.max_intensity = max(summary.max_intensity, intensity)
+            summary.intensity_sum += intensity
+            summary.type_intensities[str(symptom_type_id)] = intensity
+
+        for summary in summaries.values():
+            delta.entry_count += summary.entry_count
+            delta.day_count += 1
+            delta.intensity_sum += summary.intensity_sum
+            delta.type_counts.update(summary.type_intensities.keys())
+            delta.added_dates.append(summary.entry_date)
+
+        empty_dates = [entry_date for entry_date in batch if entry_date not in summaries]
+        if empty_dates:
+            DailyEntrySummary.objects.filter(user_id=user_id, entry_date__in=empty_dates).delete()
+        DailyEntrySummary.objects.bulk_create(
+            summaries.values(),
+            update_conflicts=True,
+            unique_fields=["user", "entry_date"],
+            update_fields=["entry_count", "max_intensity", "intensity_sum", "type_intensities", "updated_at"],
+        )
+    # A day that still has entries appears on both sides, so only days that lost all of them count as removed.
+    delta.removed_dates = sorted(set(delta.removed_dates) - set(delta.added_dates))
+    return delta
+
+
+def refresh_month_summaries(user_id: int, dates: Iterable[date]) -> None:
+    # Built from the day summaries, so this must run after they were refreshed.
+    months = sorted({(entry_date.year, entry_date.month) for entry_date in dates})
+    if not months:
+        return
+
+    month_ranges = Q()
+    for year, month in months:
+        start, end = month_bounds(year, month)
+        month_ranges |= Q(entry_date__gte=start, entry_date__lt=end)
+
+    day_summaries = DailyEntrySummary.objects.filter(month_ranges, user_id=user_id).values_list(
+        "entry_date", "entry_count", "max_intensity", "intensity_sum"
+    )
+
+    summaries = {
+        (year, month): MonthlyEntrySummary(
+            user_id=user_id, year=year, month=month, day_mask=0, entry_count=0, day_stats={}
+        )
+        for year, month in months
+    }
+    for entry_date, entry_count, max_intensity, intensity_sum in day_summaries:
+        summary = summaries[(entry_date.year, entry_date.month)]
+        summary.day_mask |= 1 << (entry_date.day - 1)
+        summary.entry_count += entry_count
+        summary.day_stats[str(entry_date.day)] = [entry_count, max_intensity, intensity_sum]
+
+    MonthlyEntrySummary.objects.bulk_create(
+        summaries.values(),
+        update_conflicts=True,
+        unique_fields=["user", "year", "month"],
+        update_fields=["day_mask", "entry_count", "day_stats", "updated_at"],
+    )
+
+
+def _locked_user_stats(user_id: int) -> UserSymptomStats:
+    stats = UserSymptomStats.objects.select_for_update().filter(user_id=user_id).first()
+    if stats is None:
+        UserSymptomStats.objects.bulk_create([UserSymptomStats(user_id=user_id)], ignore_conflicts=True)
+        stats = UserSymptomStats.objects.select_for_update().get(user_id=user_id)
+    return stats
+
+
+def refresh_user_stats(user_id: int, delta: UserStatsDelta) -> None:
+    # Applied as a delta, so a write costs the same however long the user's history is.
+    if not delta:
+        return
+
+    stats = _locked_user_stats(user_id)
+    type_counts = Counter(stats.type_counts)
+    type_counts.update(delta.type_counts)
+
+    latest_entry_date = stats.latest_entry_date
+    if latest_entry_date in delta.removed_dates:
+        # Only removing the latest day needs a lookup, which the (user, entry_date) index answers directly.
+        latest_entry_date = DailyEntrySummary.objects.filter(user_id=user_id).aggregate(
+            latest_entry_date=Max("entry_date")
+        )["latest_entry_date"]
+    elif delta.added_dates and (latest_entry_date is None or max(delta.added_dates) > latest_entry_date):
+        latest_entry_date = max(delta.added_dates)
+
+    UserSymptomStats.objects.filter(pk=stats.pk).update(
+        entry_count=F("entry_count") + delta.entry_count,
+        day_count=F("day_count") + delta.day_count,
+        intensity_sum=F("intensity_sum") + delta.intensity_sum,
+        latest_entry_date=latest_entry_date,
+        type_counts={type_id: count for type_id, count in type_counts.items() if count > 0},
+        updated_at=timezone.now(),
+    )
+
+
+def rebuild_user_stats(user_id: int) -> None:
+    # Recounts everything from the day summaries, so this must run after they were rebuilt.
+    stats = _locked_user_stats(user_id)
+    stats.entry_count = stats.day_count = stats.intensity_sum = 0
+    stats.latest_entry_date = None
+    type_counts: Counter[str] = Counter()
+    day_summaries = DailyEntrySummary.objects.filter(user_id=user_id).values_list(
+        "entry_date", "entry_count", "intensity_sum", "type_intensities"
+    )
+    for entry_date, entry_count, intensity_sum, type_intensities in day_summaries.order_by():
+        stats.entry_count += entry_count
+        stats.day_count += 1
+        stats.intensity_sum += intensity_sum
+        type_counts.update(type_intensities.keys())
+        if stats.latest_entry_date is None or entry_date > stats.latest_entry_date:
+            stats.latest_entry_date = entry_date
+    stats.type_counts = dict(type_counts)
+    stats.save()
+
+
+def _lock_months(user_id: int, dates: Iterable[date]) -> None:
+    months = sorted({(entry_date.year, entry_date.month) for entry_date in dates})
+    if not months:
+        return
+
+    # Concurrent writers to the same month wait for each other here, so neither can overwrite the day and month
+    # summaries with a recompute that missed the other's entries. Missing rows are created first so they can be locked.
+    MonthlyEntrySummary.objects.bulk_create(
+        [MonthlyEntrySummary(user_id=user_id, year=year, month=month) for year, month in months],
+        ignore_conflicts=True,
+    )
+    month_filter = Q()
+    for year, month in months:
+        month_filter |= Q(year=year, month=month)
+    list(
+        MonthlyEntrySummary.objects.select_for_update()
+        .filter(month_filter, user_id=user_id)
+        .order_by("year", "month")
+        .values_list("pk", flat=True)
+    )
+
+
+def refresh_entry_rollups(user_id: int, dates: Iterable[date]) -> None:
+    dates = set(dates)
+    with transaction.atomic():
+        _lock_months(user_id, dates)
+        delta = refresh_day_summaries(user_id, dates)
+        refresh_month_summaries(user_id, dates)
+        refresh_user_stats(user_id, delta)
+
+
+def rebuild_entry_rollups(user_id: int) -> None:
+    with transaction.atomic():
+        DailyEntrySummary.objects.filter(user_id=user_id).delete()
+        MonthlyEntrySummary.objects.filter(user_id=user_id).delete()
+        entry_dates = set(
+            SymptomEntry.objects.filter(user_id=user_id).values_list("entry_date", flat=True).distinct().order_by()
+        )
+        refresh_day_summaries(user_id, entry_dates)
+        refresh_month_summaries(user_id, entry_dates)
+        rebuild_user_stats(user_id)
+
+
+def _build_month_entries(day_mask: int, day_stats: dict[str, list[int]]) -> MonthEntries:
+    return MonthEntries(
+        days_with_entries=MonthlyEntrySummary.days_from_mask(day_mask),
+        day_stats={int(day): DayStats(*stats) for day, stats in day_stats.items()},
+    )
+
+
+def get_month_entries_by_month(user: User, months: Iterable[tuple[int, int]]) -> dict[tuple[int, int], MonthEntries]:
+    months = list(months)
+    if not months:
+        return {}
+
+    month_filter = Q()
+    for year, month in months:
+        month_filter |= Q(year=year, month=month)
+
+    summaries = {
+        (year, month): (day_mask, day_stats)
+        for year, month, day_mask, day_stats in MonthlyEntrySummary.objects.filter(month_filter, user=user).values_list(
+            "year", "month", "day_mask", "day_stats"
+        )
+    }
+
+    return {(year, month): _build_month_entries(*summaries.get((year, month), (0, {}))) for year, month in months}
+
+
+def get_year_entries(user: User, year: int) -> dict[int, MonthEntries]:
+    summaries = {
+        month: (day_mask, day_stats)
+        for month, day_mask, day_stats in MonthlyEntrySummary.objects.filter(user=user, year=year).values_list(
+            "month", "day_mask", "day_stats"
+        )
+    }
+    return {month: _build_month_entries(*summaries.get(month, (0, {}))) for month in range(1, 13)}
+
+
+def get_month_entries(user: User, year: int, month: int) -> MonthEntries:
+    return get_month_entries_by_month(user, [(year, month)])[(year, month)]
+
+
+async def aget_month_entries(user: User, year: int, month: int) -> MonthEntries:
+    summary = (
+        await MonthlyEntrySummary.objects.filter(user=user, year=year, month=month)
+        .values_list("day_mask", "day_stats")
+        .afirst()
+    )
+    return _build_month_entries(*(summary or (0, {})))
+
+
+def get_days_stats(user: User, entry_dates: Iterable[date]) -> dict[date, DayStats]:
+    day_summaries = DailyEntrySummary.objects.filter(user=user, entry_date__in=set(entry_dates)).values_list(
+        "entry_date", "entry_count", "max_intensity", "intensity_sum"
+    )
+    return {entry_date: DayStats(*stats) for entry_date, *stats in day_summaries}
+
+
+def get_day_stats(user: User, entry_date: date) -> DayStats | None:
+    return get_days_stats(user, [entry_date]).get(entry_date)
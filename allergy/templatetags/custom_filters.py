@@ -1,3 +1,5 @@
+from typing import Any
+
 from django import template
 
 register = template.Library()
@@ -6,3 +8,8 @@ register = template.Library()
 @register.filter
 def range_filter(start: int, end: int) -> range:
     return range(start, end + 1)
+
+
+@register.filter
+def get_item(mapping: dict[Any, Any], key: Any) -> Any:
+    return mapping.get(key)
@@ -0,0 +1,144 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import connection
+
+from allergy.models import DailyEntrySummary, SymptomType
+
+TREND_PERIODS = (30, 90, 180, 365)
+DEFAULT_TREND_PERIOD = 90
+SHORT_ROLLING_DAYS = 7
+LONG_ROLLING_DAYS = 30
+MAX_INTENSITY = 10
+
+
+@dataclass(frozen=True)
+class SymptomTrend:
+    symptom_type_uuid: uuid.UUID
+    name: str
+    short_means: list[float]
+    long_means: list[float]
+
+    @staticmethod
+    def _points(means: list[float]) -> str:
+        return " ".join(f"{day},{MAX_INTENSITY - mean:.2f}" for day, mean in enumerate(means))
+
+    @property
+    def short_points(self) -> str:
+        return self._points(self.short_means)
+
+    @property
+    def long_points(self) -> str:
+        return self._points(self.long_means)
+
+    @property
+    def latest_short_mean(self) -> float:
+        return self.short_means[-1]
+
+    @property
+    def latest_long_mean(self) -> float:
+        return self.long_means[-1]
+
+
+@dataclass(frozen=True)
+class TrendSeries:
+    start_date: date
+    end_date: date
+    trends: list[SymptomTrend]
+
+    @property
+    def day_count(self) -> int:
+        return (self.end_date - self.start_date).days + 1
+
+
+def _rolling_trends_sql() -> str:
+    quote_name = connection.ops.quote_name
+    type_table = quote_name(SymptomType._meta.db_table)
+    summary_table = quote_name(DailyEntrySummary._meta.db_table)
+    # Days without an entry count as intensity 0, so the generated series keeps every window LONG_ROLLING_DAYS wide.
+    intensity = (
+        f"COALESCE((summary.{quote_name('type_intensities')} ->> symptom_type.{quote_name('uuid')}::text)::integer, 0)"
+    )
+    window = f"PARTITION BY symptom_type.{quote_name('uuid')} ORDER BY series.day"
+    return (
+        "SELECT symptom_type_id, symptom_name, "
+        "array_agg(short_mean ORDER BY day), array_agg(long_mean ORDER BY day) FROM ("
+        f"SELECT symptom_type.{quote_name('uuid')} AS symptom_type_id, "
+        f"symptom_type.{quote_name('name')} AS symptom_name, series.day::date AS day, "
+        f"AVG({intensity}) OVER ({window} ROWS BETWEEN {SHORT_ROLLING_DAYS - 1} PRECEDING AND CURRENT ROW)::float8 "
+        "AS short_mean, "
+        f"AVG({intensity}) OVER ({window} ROWS BETWEEN {LONG_ROLLING_DAYS - 1} PRECEDING AND CURRENT ROW)::float8 "
+        "AS long_mean "
+        f"FROM {type_table} AS symptom_type "
+        "CROSS JOIN generate_series(%s::date, %s::date, interval '1 day') AS series(day) "
+        f"LEFT JOIN {summary_table} AS summary "
+        f"ON summary.{quote_name('user_id')} = symptom_type.{quote_name('user_id')} "
+        f"AND summary.{quote_name('entry_date')} = series.day::date "
+        f"WHERE symptom_type.{quote_name('user_id')} = %s"
+        ") AS rolling WHERE day >= %s "
+        "GROUP BY symptom_type_id, symptom_name ORDER BY symptom_name"
+    )
+
+
+def _rolling_means(series: list[list[int]], window: int, day_count: int) -> list[list[float]]:
+    # Each series starts LONG_ROLLING_DAYS - 1 days before the first charted day, so every mean has a full window.
+    offset = LONG_ROLLING_DAYS - 1
+    rolling_means = []
+    for row in series:
+        sums = list(accumulate(row, initial=0))
+        rolling_means.append(
+            [(sums[day + 1] - sums[day + 1 - window]) / window for day in range(offset, offset + day_count)]
+        )
+    return rolling_means
+
+
+def _fallback_trends(user: User, series_start: date, start_date: date, end_date: date) -> list[SymptomTrend]:
+    symptom_types = list(SymptomType.objects.filter(user=user).values_list("uuid", "name").order_by("name"))
+    if not symptom_types:
+        return []
+
+    rows_by_type = {str(type_uuid): row for row, (type_uuid, _) in enumerate(symptom_types)}
+    series = [[0] * ((end_date - series_start).days + 1) for _ in symptom_types]
+    day_summaries = DailyEntrySummary.objects.filter(
+        user=user, entry_date__gte=series_start, entry_date__lte=end_date
+    ).values_list("entry_date", "type_intensities")
+    for entry_date, type_intensities in day_summaries:
+        day = (entry_date - series_start).days
+        for type_uuid, intensity in type_intensities.items():
+            if type_uuid in rows_by_type:
+                series[rows_by_type[type_uuid]][day] = intensity
+
+    day_count = (end_date - start_date).days + 1
+    short_means = _rolling_means(series, SHORT_ROLLING_DAYS, day_count)
+    long_means = _rolling_means(series, LONG_ROLLING_DAYS, day_count)
+    return [
+        SymptomTrend(symptom_type_uuid=type_uuid, name=name, short_means=short_means[row], long_means=long_means[row])
+        for row, (type_uuid, name) in enumerate(symptom_types)
+    ]
+
+
+def get_symptom_trends(user: User, end_date: date, days: int = DEFAULT_TREND_PERIOD) -> TrendSeries:
+    start_date = end_date - timedelta(days=days - 1)
+    series_start = start_date - timedelta(days=LONG_ROLLING_DAYS - 1)
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(_rolling_trends_sql(), [series_start, end_date, user.pk, start_date])
+            rows: list[tuple[Any, ...]] = cursor.fetchall()
+        trends = [
+            SymptomTrend(symptom_type_uuid=type_uuid, name=name, short_means=short_means, long_means=long_means)
+            for type_uuid, name, short_means, long_means in rows
+        ]
+    else:
+        trends = _fallback_trends(user, series_start, start_date, end_date)
+
+    # Symptoms without entries in any of the charted windows would only add flat lines at zero.
+    return TrendSeries(
+        start_date=start_date,
+        end_date=end_date,
+        trends=[trend for trend in trends if any(trend.long_means)],
+    )
@@ -5,16 +5,62 @@ from allergy import views
 urlpatterns = [
     path("", views.redirect_to_dashboard, name="index"),
     path("dashboard/", views.dashboard, name="dashboard"),
+    path("insights/", views.insights, name="insights"),
     re_path(
         r"^partial/calendar/(?P<year>\d{4})/(?P<month>\d{1,2})(?:/(?P<day>\d{1,2}))?/$",
         views.partial_calendar,
         name="partial_calendar",
     ),
+    path(
+        "partial/calendar/bundle/<int:year>/<int:month>/",
+        views.partial_calendar_bundle,
+        name="partial_calendar_bundle",
+    ),
+    path(
+        "partial/calendar/year/<int:year>/",
+        views.partial_calendar_year,
+        name="partial_calendar_year",
+    ),
+    path(
+        "partial/insights/cooccurrence/",
+        views.partial_cooccurrence,
+        name="partial_cooccurrence",
+    ),
+    path(
+        "partial/insights/seasonality/",
+        views.partial_seasonality,
+        name="partial_seasonality",
+    ),
+    path(
+        "partial/insights/medication-effects/",
+        views.partial_medication_effects,
+        name="partial_medication_effects",
+    ),
+    path(
+        "partial/medications/intake/",
+        views.partial_medication_intake,
+        name="partial_medication_intake",
+    ),
+    path(
+        "partial/medications/intake/save/",
+        views.medication_intake_save_partial,
+        name="medication_intake_save_partial",
+    ),
+    path(
+        "partial/trends/",
+        views.partial_trends,
+        name="partial_trends",
+    ),
     path(
         "partial/symptoms/<int:year>/<int:month>/<int:day>/",
         views.symptoms_container_partial,
         name="symptoms_container_partial",
     ),
+    path(
+        "partial/symptoms/<int:year>/<int:month>/<int:day>/copy-previous/",
+        views.symptoms_copy_previous_day_partial,
+        name="symptoms_copy_previous_day_partial",
+    ),
     path(
         "partial/symptom/add/<uuid:symptom_uuid>/",
         views.symptom_add_partial,
@@ -30,6 +76,22 @@ urlpatterns = [
         views.symptom_save_partial,
         name="symptom_save_partial",
     ),
+    path(
+        "partial/symptom/save/batch/",
+        views.symptom_save_batch_partial,
+        name="symptom_save_batch_partial",
+    ),
+    path(
+        "partial/symptom/save/edit-log/",
+        views.symptom_edit_log_partial,
+        name="symptom_edit_log_partial",
+    ),
+    path(
+        "partial/symptom/fill-range/",
+        views.symptom_fill_range_partial,
+        name="symptom_fill_range_partial",
+    ),
+    path("changes/", views.change_feed, name="change_feed"),
 ]
 
 app_name = "allergy"
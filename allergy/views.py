@@ -1,25 +1,58 @@
 import calendar
+import json
 import uuid
 from datetime import date, timedelta
 from typing import cast
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
+from django.forms import Form
+from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
-from allergy.forms import AddSymptomForm
-from allergy.models import SymptomEntry, SymptomType
-
-
-def _get_days_with_entries(user: User, year: int, month: int) -> list[int]:
-    return list(
-        SymptomEntry.objects.filter(user=user, entry_date__year=year, entry_date__month=month)
-        .values_list("entry_date__day", flat=True)
-        .distinct()
-    )
+from allergy.cache import (
+    acalendar_fragment_key,
+    aget_calendar_fragment,
+    aset_calendar_fragment,
+    calendar_fragment_key,
+    condition_on_user_data,
+    get_calendar_fragment,
+    set_calendar_fragment,
+    year_fragment_key,
+)
+from allergy.change_feed import CHANGE_FEED_PAGE_SIZE, get_changes
+from allergy.cooccurrence import get_cooccurrence
+from allergy.day_view import aget_day_view, get_day_view
+from allergy.entries import copy_day_entries
+from allergy.forms import (
+    AddSymptomForm,
+    MedicationIntakeForm,
+    SymptomEditLogForm,
+    SymptomEntryBatchForm,
+    SymptomRangeFillForm,
+)
+from allergy.medication_effects import EFFECT_WINDOW_DAYS, get_medication_effects
+from allergy.models import Medication, MedicationIntake, SymptomEntry, SymptomType
+from allergy.seasonality import get_seasonality
+from allergy.summaries import (
+    MonthEntries,
+    aget_month_entries,
+    get_day_stats,
+    get_days_stats,
+    get_month_entries_by_month,
+    get_year_entries,
+)
+from allergy.trends import (
+    DEFAULT_TREND_PERIOD,
+    LONG_ROLLING_DAYS,
+    MAX_INTENSITY,
+    SHORT_ROLLING_DAYS,
+    TREND_PERIODS,
+    get_symptom_trends,
+)
 
 
 def _get_explicit_selected_date(request: HttpRequest) -> date | None:
@@ -32,31 +65,44 @@ def _get_explicit_selected_date(request: HttpRequest) -> date | None:
         return None
 
 
+def _get_selected_day(
+    year: int, month: int, explicit_selected_date: date | None, fallback_selected_date: date | None
+) -> int | None:
+    if explicit_selected_date and explicit_selected_date.year == year and explicit_selected_date.month == month:
+        return explicit_selected_date.day
+    if fallback_selected_date and fallback_selected_date.year == year and fallback_selected_date.month == month:
+        return fallback_selected_date.day
+    return None
+
+
+def _get_adjacent_months(year: int, month: int) -> tuple[tuple[int, int], tuple[int, int]]:
+    prev_month_date = date(year, month, 1) - timedelta(days=1)
+    last_day_of_month = calendar.monthrange(year, month)[1]
+    next_month_date = date(year, month, last_day_of_month) + timedelta(days=1)
+    return (prev_month_date.year, prev_month_date.month), (next_month_date.year, next_month_date.month)
+
+
+def _calendar_url(year: int, month: int, explicit_selected_date: date | None) -> str:
+    url = reverse("allergy:partial_calendar", kwargs={"year": year, "month": month})
+    if explicit_selected_date:
+        url += f"?selected_date={explicit_selected_date.isoformat()}"
+    return url
+
+
 def _build_calendar_context(
-    user: User,
     year: int,
     month: int,
     explicit_selected_date: date | None,
     *,
     fallback_selected_date: date | None,
+    month_entries: MonthEntries,
 ) -> dict[str, object]:
     cal_matrix = calendar.monthcalendar(year, month)
     month_name = calendar.month_name[month]
-    days_with_entries = _get_days_with_entries(user, year, month)
 
-    prev_month_date = date(year, month, 1) - timedelta(days=1)
-    prev_month = prev_month_date.month
-    prev_year = prev_month_date.year
-    last_day_of_month = calendar.monthrange(year, month)[1]
-    next_month_date = date(year, month, last_day_of_month) + timedelta(days=1)
-    next_month = next_month_date.month
-    next_year = next_month_date.year
+    (prev_year, prev_month), (next_year, next_month) = _get_adjacent_months(year, month)
 
-    selected_day = None
-    if explicit_selected_date and explicit_selected_date.year == year and explicit_selected_date.month == month:
-        selected_day = explicit_selected_date.day
-    elif fallback_selected_date and fallback_selected_date.year == year and fallback_selected_date.month == month:
-        selected_day = fallback_selected_date.day
+    selected_day = _get_selected_day(year, month, explicit_selected_date, fallback_selected_date)
 
     selected_date_str = None
     if selected_day is not None:
@@ -77,7 +123,8 @@ def _build_calendar_context(
         "selected_day": selected_day,
         "selected_date_str": selected_date_str,
         "weekdays": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-        "days_with_entries": days_with_entries,
+        "days_with_entries": month_entries.days_with_entries,
+        "day_stats": month_entries.day_stats,
     }
 
 
@@ -98,7 +145,8 @@ def dashboard(request: HttpRequest) -> HttpResponse:
 
 
 @require_GET
-def partial_calendar(request: HttpRequest, year: str, month: str, day: str | None = None) -> HttpResponse:
+@condition_on_user_data
+async def partial_calendar(request: HttpRequest, year: str, month: str, day: str | None = None) -> HttpResponse:
     try:
         year_int = int(year)
         month_int = int(month)
@@ -113,44 +161,221 @@ def partial_calendar(request: HttpRequest, year: str, month: str, day: str | Non
     except ValueError, TypeError:
         return HttpResponseBadRequest("Invalid date parameters provided.")
 
-    user = cast(User, request.user)
+    user = cast(User, await request.auser())
     explicit_selected_date = _get_explicit_selected_date(request)
     if day_int is not None:
         explicit_selected_date = date(year_int, month_int, day_int)
 
+    fallback_selected_date = date.today() if explicit_selected_date is None else None
+
+    selected_day = _get_selected_day(year_int, month_int, explicit_selected_date, fallback_selected_date)
+    fragment_key = await acalendar_fragment_key(user.pk, year_int, month_int, selected_day, explicit_selected_date)
+    fragment = await aget_calendar_fragment(fragment_key)
+    if fragment is not None:
+        return HttpResponse(fragment)
+
     context = _build_calendar_context(
-        user,
         year_int,
         month_int,
         explicit_selected_date,
-        fallback_selected_date=date.today() if explicit_selected_date is None else None,
+        fallback_selected_date=fallback_selected_date,
+        month_entries=await aget_month_entries(user, year_int, month_int),
     )
 
-    return render(request, "allergy/partials/calendar/calendar.html", context)
+    response = render(request, "allergy/partials/calendar/calendar.html", context)
+    await aset_calendar_fragment(fragment_key, response.content.decode(response.charset))
+    return response
 
 
 @require_GET
-def symptoms_container_partial(request: HttpRequest, year: int, month: int, day: int) -> HttpResponse:
+@condition_on_user_data
+def partial_calendar_bundle(request: HttpRequest, year: int, month: int) -> HttpResponse:
     try:
-        selected_date = date(year, month, day)
+        date(year, month, 1)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid date parameters provided.")
+
+    user = cast(User, request.user)
+    explicit_selected_date = _get_explicit_selected_date(request)
+    fallback_selected_date = date.today() if explicit_selected_date is None else None
+
+    prev_month, next_month = _get_adjacent_months(year, month)
+    bundle_months = [prev_month, (year, month), next_month]
+
+    fragments: dict[tuple[int, int], str] = {}
+    fragment_keys: dict[tuple[int, int], str] = {}
+    for bundle_year, bundle_month in bundle_months:
+        selected_day = _get_selected_day(bundle_year, bundle_month, explicit_selected_date, fallback_selected_date)
+        fragment_key = calendar_fragment_key(user.pk, bundle_year, bundle_month, selected_day, explicit_selected_date)
+        fragment = get_calendar_fragment(fragment_key)
+        if fragment is None:
+            fragment_keys[(bundle_year, bundle_month)] = fragment_key
+        else:
+            fragments[(bundle_year, bundle_month)] = fragment
+
+    entries_by_month = get_month_entries_by_month(user, fragment_keys)
+    for (bundle_year, bundle_month), fragment_key in fragment_keys.items():
+        context = _build_calendar_context(
+            bundle_year,
+            bundle_month,
+            explicit_selected_date,
+            fallback_selected_date=fallback_selected_date,
+            month_entries=entries_by_month[(bundle_year, bundle_month)],
+        )
+        fragment = render_to_string("allergy/partials/calendar/calendar.html", context)
+        set_calendar_fragment(fragment_key, fragment)
+        fragments[(bundle_year, bundle_month)] = fragment
+
+    context = {
+        "months": [
+            {
+                "url": _calendar_url(bundle_year, bundle_month, explicit_selected_date),
+                "html": fragments[(bundle_year, bundle_month)],
+            }
+            for bundle_year, bundle_month in bundle_months
+        ]
+    }
+    return render(request, "allergy/partials/calendar/calendar_bundle.html", context)
+
+
+@require_GET
+@condition_on_user_data
+def partial_calendar_year(request: HttpRequest, year: int) -> HttpResponse:
+    try:
+        date(year, 1, 1)
     except ValueError:
         return HttpResponseBadRequest("Invalid date parameters provided.")
 
     user = cast(User, request.user)
+    fragment_key = year_fragment_key(user.pk, year)
+    fragment = get_calendar_fragment(fragment_key)
+    if fragment is not None:
+        return HttpResponse(fragment)
+
+    entries_by_month = get_year_entries(user, year)
+    context = {
+        "current_year": year,
+        "prev_year": year - 1,
+        "next_year": year + 1,
+        "weekdays": ["M", "T", "W", "T", "F", "S", "S"],
+        "months": [
+            {
+                "number": month,
+                "name": calendar.month_abbr[month],
+                "calendar_matrix": calendar.monthcalendar(year, month),
+                "day_stats": month_entries.day_stats,
+            }
+            for month, month_entries in entries_by_month.items()
+        ],
+    }
+
+    response = render(request, "allergy/partials/calendar/calendar_year.html", context)
+    set_calendar_fragment(fragment_key, response.content.decode(response.charset))
+    return response
+
+
+@require_GET
+def insights(request: HttpRequest) -> HttpResponse:
+    return render(request, "allergy/insights.html")
 
-    symptom_entries = (
-        SymptomEntry.objects.filter(user=user, entry_date=selected_date)
-        .select_related("symptom_type")
-        .order_by("symptom_type__name")
+
+@require_GET
+@condition_on_user_data
+def partial_cooccurrence(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    return render(request, "allergy/partials/insights/cooccurrence.html", {"matrix": get_cooccurrence(user)})
+
+
+@require_GET
+@condition_on_user_data
+def partial_seasonality(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    return render(
+        request, "allergy/partials/insights/seasonality.html", {"report": get_seasonality(user, date.today())}
     )
-    all_symptom_types = SymptomType.objects.filter(user=user).order_by("name")
 
-    selected_symptoms_map = {entry.symptom_type: entry for entry in symptom_entries}
 
+@require_GET
+@condition_on_user_data
+def partial_medication_effects(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
     context = {
-        "symptom_entries": symptom_entries,
-        "symptom_types": all_symptom_types,
-        "selected_symptoms_map": selected_symptoms_map,
+        "effects": get_medication_effects(user, date.today()),
+        "window_days": EFFECT_WINDOW_DAYS,
+    }
+    return render(request, "allergy/partials/insights/medication_effects.html", context)
+
+
+def _medication_intake_context(user: User, form: MedicationIntakeForm) -> dict[str, object]:
+    return {
+        "form": form,
+        "medications": Medication.objects.filter(user=user).order_by("medication_name", "medication_type"),
+        "taken_today": {
+            str(medication_uuid)
+            for medication_uuid in MedicationIntake.objects.filter(user=user, intake_date=date.today()).values_list(
+                "medication_id", flat=True
+            )
+        },
+    }
+
+
+@require_GET
+@condition_on_user_data
+def partial_medication_intake(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    context = _medication_intake_context(user, MedicationIntakeForm(user=user))
+    return render(request, "allergy/partials/medications/intake.html", context)
+
+
+@require_POST
+def medication_intake_save_partial(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    form = MedicationIntakeForm(request.POST, user=user)
+    if not form.is_valid():
+        return render(request, "allergy/partials/medications/intake.html", _medication_intake_context(user, form))
+
+    intakes = form.save(date.today())
+    context = _medication_intake_context(user, MedicationIntakeForm(user=user))
+    context["recorded_count"] = len(intakes)
+    return render(request, "allergy/partials/medications/intake.html", context)
+
+
+@require_GET
+@condition_on_user_data
+def partial_trends(request: HttpRequest) -> HttpResponse:
+    try:
+        days = int(request.GET.get("days", DEFAULT_TREND_PERIOD))
+    except ValueError:
+        return HttpResponseBadRequest("Invalid trend period provided.")
+    if days not in TREND_PERIODS:
+        return HttpResponseBadRequest("Invalid trend period provided.")
+
+    user = cast(User, request.user)
+    context = {
+        "series": get_symptom_trends(user, date.today(), days),
+        "periods": TREND_PERIODS,
+        "selected_period": days,
+        "short_rolling_days": SHORT_ROLLING_DAYS,
+        "long_rolling_days": LONG_ROLLING_DAYS,
+        "max_intensity": MAX_INTENSITY,
+    }
+    return render(request, "allergy/partials/trends/trends.html", context)
+
+
+@require_GET
+@condition_on_user_data
+async def symptoms_container_partial(request: HttpRequest, year: int, month: int, day: int) -> HttpResponse:
+    try:
+        selected_date = date(year, month, day)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid date parameters provided.")
+
+    user = cast(User, await request.auser())
+    day_view = await aget_day_view(user, selected_date)
+
+    context = {
+        "symptoms": day_view.symptoms,
+        "selected_symptoms": day_view.selected_symptoms,
         "selected_date": selected_date,
         "selected_date_str": selected_date.strftime("%Y-%m-%d"),
         "current_year": year,
@@ -159,18 +384,40 @@ def symptoms_container_partial(request: HttpRequest, year: int, month: int, day:
     }
     context.update(
         _build_calendar_context(
-            user,
             year,
             month,
             selected_date,
             fallback_selected_date=None,
+            month_entries=day_view.month_entries,
         )
     )
 
     return render(request, "allergy/partials/symptoms/symptoms_container.html", context)
 
 
+@require_POST
+def symptoms_copy_previous_day_partial(request: HttpRequest, year: int, month: int, day: int) -> HttpResponse:
+    try:
+        selected_date = date(year, month, day)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid date parameters provided.")
+
+    user = cast(User, request.user)
+    copy_day_entries(user, selected_date - timedelta(days=1), selected_date)
+    day_view = get_day_view(user, selected_date)
+
+    context = {
+        "symptoms": day_view.symptoms,
+        "selected_symptoms": day_view.selected_symptoms,
+        "selected_date": selected_date,
+        "selected_date_str": selected_date.strftime("%Y-%m-%d"),
+        "calendar_day_stats": day_view.month_entries.day_stats.get(day),
+    }
+    return render(request, "allergy/partials/symptoms/symptoms_copied.html", context)
+
+
 @require_GET
+@condition_on_user_data
 def symptom_add_partial(request: HttpRequest, symptom_uuid: str) -> HttpResponse:
     user = cast(User, request.user)
 
@@ -218,6 +465,8 @@ def symptom_remove_partial(
         "symptom_type": symptom_type,
         "selected_date": selected_date,
         "selected_date_str": selected_date.strftime("%Y-%m-%d"),
+        "calendar_day": selected_date,
+        "calendar_day_stats": get_day_stats(user, selected_date),
     }
 
     return render(request, "allergy/partials/symptoms/intensity/remove_selector.html", context)
@@ -238,6 +487,8 @@ def symptom_save_partial(request: HttpRequest) -> HttpResponse:
             "symptom_type": symptom_type,
             "entry": entry,
             "selected_date_str": entry.entry_date.strftime("%Y-%m-%d"),
+            "calendar_day": entry.entry_date,
+            "calendar_day_stats": get_day_stats(user, entry.entry_date),
         }
         return render(request, "allergy/partials/symptoms/intensity/select_intensity.html", context)
 
@@ -252,3 +503,87 @@ def symptom_save_partial(request: HttpRequest) -> HttpResponse:
     context = {"form": form, "symptom_type": symptom_type, "selected_date_str": request.POST.get("selected_date")}
 
     return render(request, "allergy/partials/symptoms/intensity/select_intensity.html", context)
+
+
+def _render_saved_entries(
+    request: HttpRequest, user: User, entries: list[SymptomEntry], selected_date: date | None
+) -> HttpResponse:
+    days_stats = get_days_stats(user, [entry.entry_date for entry in entries])
+    context = {
+        "selected_entries": [entry for entry in entries if entry.entry_date == selected_date],
+        "calendar_days": [
+            {
+                "date": entry_date,
+                "stats": days_stats.get(entry_date),
+                "selected_day": entry_date.day if entry_date == selected_date else None,
+            }
+            for entry_date in sorted({entry.entry_date for entry in entries})
+        ],
+    }
+    return render(request, "allergy/partials/symptoms/intensity/batch_saved.html", context)
+
+
+def _form_errors_response(form: Form) -> HttpResponseBadRequest:
+    return HttpResponseBadRequest(" ".join(str(message) for errors in form.errors.values() for message in errors))
+
+
+@require_POST
+def symptom_save_batch_partial(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    form = SymptomEntryBatchForm(request.POST, user=user)
+    if not form.is_valid():
+        return _form_errors_response(form)
+
+    return _render_saved_entries(request, user, form.save(), form.cleaned_data["selected_date"])
+
+
+@require_POST
+def symptom_edit_log_partial(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    form = SymptomEditLogForm(request.POST, user=user)
+    if not form.is_valid():
+        return _form_errors_response(form)
+
+    return _render_saved_entries(request, user, form.save(), form.cleaned_data["selected_date"])
+
+
+@require_POST
+def symptom_fill_range_partial(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    form = SymptomRangeFillForm(request.POST, user=user)
+    context: dict[str, object] = {
+        "form": form,
+        "symptoms": SymptomType.objects.filter(user=user).values("uuid", "name").order_by("name"),
+        "selected_date_str": "",
+    }
+
+    if not form.is_valid():
+        return render(request, "allergy/partials/symptoms/fill_range.html", context)
+
+    filled_days = form.save()
+    context["filled_days"] = len(filled_days)
+    response = render(request, "allergy/partials/symptoms/fill_range.html", context)
+    # Only the calendar months touched by the range are refreshed by the dashboard.
+    changed_months = sorted({f"{day.year}-{day.month:02d}" for day in filled_days})
+    response["HX-Trigger"] = json.dumps({"calendarMonthsChanged": {"months": changed_months}})
+    return response
+
+
+@require_GET
+def change_feed(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    try:
+        limit = int(request.GET.get("limit", CHANGE_FEED_PAGE_SIZE))
+        if not 1 <= limit <= CHANGE_FEED_PAGE_SIZE:
+            raise ValueError
+        page = get_changes(request.GET.get("since") or None, user=user, limit=limit)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid change feed parameters provided.")
+
+    return JsonResponse(
+        {
+            "changes": [change.as_dict() for change in page.changes],
+            "next_cursor": page.next_cursor,
+            "has_more": page.has_more,
+        }
+    )
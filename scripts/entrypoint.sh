@@ -2,6 +2,7 @@
 
 echo "Applying database migrations..."
 uv run manage.py migrate
+uv run manage.py createcachetable
 
 echo "Starting server..."
 exec "$@"
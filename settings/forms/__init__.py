@@ -1,4 +1,5 @@
+from settings.forms.diary_import import ImportDiaryForm
 from settings.forms.medication import AddMedicationForm
 from settings.forms.symptom_type import AddSymptomTypeForm
 
-__all__ = ["AddMedicationForm", "AddSymptomTypeForm"]
+__all__ = ["AddMedicationForm", "AddSymptomTypeForm", "ImportDiaryForm"]
@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.forms import FileField, Form
+from django.forms.widgets import ClearableFileInput
+
+from allergy.imports import import_format_for_filename
+
+
+class ImportDiaryForm(Form):
+    diary_file = FileField(
+        label="Diary file",
+        widget=ClearableFileInput(
+            attrs={
+                "class": "block w-full text-sm text-gray-700 file:mr-3 file:rounded-md file:border-0 "
+                "file:bg-purple-100 file:px-3 file:py-1 file:text-purple-700 hover:file:bg-purple-200",
+                "accept": ".csv,.ndjson,.jsonl",
+            }
+        ),
+    )
+
+    def clean_diary_file(self) -> UploadedFile[Any]:
+        diary_file: UploadedFile[Any] = self.cleaned_data["diary_file"]
+        if import_format_for_filename(diary_file.name or "") is None:
+            raise ValidationError("Upload a .csv or .ndjson file.")
+        return diary_file
@@ -2,21 +2,15 @@ import re
 from typing import Any
 
 from django import forms
-from django.core.validators import RegexValidator
 
+from allergy.forms import symptom_name_validator
 from allergy.models import SymptomType
 
 
 class AddSymptomTypeForm(forms.ModelForm[SymptomType]):
     name = forms.CharField(
         max_length=255,
-        validators=[
-            RegexValidator(
-                regex=r"^[A-Za-z\s]+$",
-                message="Symptom name should only contain letters and spaces",
-                code="invalid_symptom_name",
-            )
-        ],
+        validators=[symptom_name_validator],
         widget=forms.TextInput(
             attrs={
                 "class": (
@@ -1,9 +1,11 @@
-from django.urls import path
+from django.urls import path, re_path
 
-from settings.views import account, food_allergies, medications, overview, symptoms
+from settings.views import account, export, food_allergies, imports, medications, overview, symptoms
 
 overview_urls = [
     path("overview/", overview.overview_tab, name="overview_tab"),
+    re_path(r"^export/(?P<export_format>csv|ndjson)/$", export.export_history, name="export_history"),
+    path("import/", imports.import_history, name="import_history"),
 ]
 
 symptoms_urls = [
@@ -0,0 +1,28 @@
+from datetime import date
+from typing import cast
+
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from allergy.exports import aiter_csv_export, aiter_ndjson_export, iter_csv_export, iter_ndjson_export
+
+EXPORT_FORMATS = {
+    "csv": (iter_csv_export, aiter_csv_export, "text/csv"),
+    "ndjson": (iter_ndjson_export, aiter_ndjson_export, "application/x-ndjson"),
+}
+
+
+@require_GET
+def export_history(request: HttpRequest, export_format: str) -> HttpResponse | StreamingHttpResponse:
+    user = cast(User, request.user)
+    iter_export, aiter_export, content_type = EXPORT_FORMATS[export_format]
+
+    filename = f"allergy-history-{date.today().isoformat()}.{export_format}"
+    # Each handler streams its own kind of iterator; the other kind would be buffered in memory first.
+    return StreamingHttpResponse(
+        aiter_export(user) if isinstance(request, ASGIRequest) else iter_export(user),
+        content_type=content_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,31 @@
+import io
+from typing import cast
+
+from django.contrib.auth.models import User
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_POST
+
+from allergy.imports import DiaryImportError, import_diary, import_format_for_filename, parse_diary
+from settings.forms import ImportDiaryForm
+
+
+@require_POST
+def import_history(request: HttpRequest) -> HttpResponse:
+    user = cast(User, request.user)
+    form = ImportDiaryForm(request.POST, request.FILES)
+    context: dict[str, object] = {"form": form, "result": None}
+
+    if form.is_valid():
+        diary_file = form.cleaned_data["diary_file"]
+        import_format = cast(str, import_format_for_filename(diary_file.name))
+        # The upload is decoded and parsed line by line instead of being read into memory at once.
+        lines = io.TextIOWrapper(diary_file.file, encoding="utf-8-sig", newline="")
+        try:
+            context["result"] = import_diary(user, parse_diary(lines, import_format))
+            context["form"] = ImportDiaryForm()
+        except (DiaryImportError, UnicodeDecodeError) as e:
+            message = str(e) if isinstance(e, DiaryImportError) else "The file is not valid UTF-8."
+            form.add_error("diary_file", message)
+
+    return render(request, "settings/tabs/partials/overview/import_diary.html", context)
@@ -6,6 +6,7 @@ from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
 from django.shortcuts import render
 from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
+from allergy.cache import condition_on_user_data
 from allergy.models import Medication
 from settings.forms import AddMedicationForm
 from settings.views.enums import ActiveTab
@@ -20,15 +21,17 @@ def medications_tab(request: HttpRequest) -> HttpResponse:
 
 
 @require_GET
-def partial_existing_medications(request: HttpRequest) -> HttpResponse:
-    user = cast(User, request.user)
-    medications = Medication.objects.filter(user=user).order_by("medication_name")
+@condition_on_user_data
+async def partial_existing_medications(request: HttpRequest) -> HttpResponse:
+    user = cast(User, await request.auser())
+    medications = [medication async for medication in Medication.objects.filter(user=user).order_by("medication_name")]
 
     context = {"medications": medications}
     return render(request, "settings/tabs/partials/medications/existing_medications.html", context)
 
 
 @require_GET
+@condition_on_user_data
 def partial_new_medication_form(request: HttpRequest) -> HttpResponse:
     form = AddMedicationForm()
 
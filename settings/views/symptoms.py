@@ -1,17 +1,38 @@
 import uuid
-from typing import cast
+from collections.abc import Iterable, Mapping
+from typing import Any, cast
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth.models import User
-from django.db.models import Count
 from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
 from django.shortcuts import render
 from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
-from allergy.models import SymptomType
+from allergy.cache import condition_on_user_data
+from allergy.histograms import get_intensity_histograms
+from allergy.models import SymptomType, UserSymptomStats
 from settings.forms import AddSymptomTypeForm
 from settings.views.enums import ActiveTab
 
 
+def _with_entry_counts(
+    symptom_types: Iterable[Mapping[str, Any]], stats: UserSymptomStats | None
+) -> list[dict[str, Any]]:
+    # Entry counts come from the user's stats row instead of a join over all of their entries.
+    type_counts = stats.type_counts if stats else {}
+    return [
+        {**symptom_type, "entries_count": type_counts.get(str(symptom_type["uuid"]), 0)}
+        for symptom_type in symptom_types
+    ]
+
+
+def _symptom_types_with_entry_counts(user: User) -> list[dict[str, Any]]:
+    return _with_entry_counts(
+        SymptomType.objects.filter(user=user).values("uuid", "name").order_by("name"),
+        UserSymptomStats.objects.filter(user=user).first(),
+    )
+
+
 @require_GET
 def symptoms_tab(request: HttpRequest) -> HttpResponse:
     context = {
@@ -21,25 +42,30 @@ def symptoms_tab(request: HttpRequest) -> HttpResponse:
 
 
 @require_GET
-def partial_existing_symptoms(request: HttpRequest) -> HttpResponse:
-    user = cast(User, request.user)
-    symptom_types = (
-        SymptomType.objects.filter(user=user)
-        .values("uuid", "name")
-        .annotate(entries_count=Count("symptom_entries"))
-        .order_by("name")
+@condition_on_user_data
+async def partial_existing_symptoms(request: HttpRequest) -> HttpResponse:
+    user = cast(User, await request.auser())
+    symptom_types = _with_entry_counts(
+        [
+            symptom_type
+            async for symptom_type in SymptomType.objects.filter(user=user).values("uuid", "name").order_by("name")
+        ],
+        await UserSymptomStats.objects.filter(user=user).afirst(),
     )
+    intensity_histograms = await sync_to_async(get_intensity_histograms)(user)
 
     return render(
         request,
         "settings/tabs/partials/symptoms/existing_symptoms.html",
         {
             "symptom_types": symptom_types,
+            "intensity_histograms": intensity_histograms,
         },
     )
 
 
 @require_GET
+@condition_on_user_data
 def partial_new_symptom_type_form(request: HttpRequest) -> HttpResponse:
     form = AddSymptomTypeForm()
     return render(request, "settings/tabs/partials/symptoms/add_symptom_type.html", {"form": form})
@@ -52,15 +78,11 @@ def partial_new_symptom_type_save(request: HttpRequest) -> HttpResponse:
 
     if form.is_valid():
         form.save()
-        symptom_types = (
-            SymptomType.objects.filter(user=user)
-            .values("uuid", "name")
-            .annotate(entries_count=Count("symptom_entries"))
-            .order_by("name")
-        )
+        symptom_types = _symptom_types_with_entry_counts(user)
         context = {
             "form": AddSymptomTypeForm(),
             "symptom_types": symptom_types,
+            "intensity_histograms": get_intensity_histograms(user),
         }
         return render(request, "settings/tabs/partials/symptoms/add_symptom_type_oob.html", context)
 
@@ -84,17 +106,13 @@ def partial_symptom_remove(request: HttpRequest, symptom_type_uuid: uuid.UUID) -
 
     symptom.delete()
 
-    symptom_types = (
-        SymptomType.objects.filter(user=user)
-        .values("uuid", "name")
-        .annotate(entries_count=Count("symptom_entries"))
-        .order_by("name")
-    )
+    symptom_types = _symptom_types_with_entry_counts(user)
 
     return render(
         request,
         "settings/tabs/partials/symptoms/existing_symptoms.html",
         {
             "symptom_types": symptom_types,
+            "intensity_histograms": get_intensity_histograms(user),
         },
     )
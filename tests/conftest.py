@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import Client
 from django_recaptcha.client import RecaptchaResponse
 
@@ -57,3 +58,8 @@ def mock_recaptcha(monkeypatch: pytest.MonkeyPatch) -> None:
         return RecaptchaResponse(is_valid=recaptcha_response == "PASSED")
 
     monkeypatch.setattr("django_recaptcha.fields.client.submit", _mock_submit)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    cache.clear()
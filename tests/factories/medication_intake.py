@@ -0,0 +1,17 @@
+from datetime import date
+
+import factory
+
+from allergy.models import MedicationIntake
+from tests.factories.medication import MedicationFactory
+from tests.factories.user import UserFactory
+
+
+class MedicationIntakeFactory(factory.django.DjangoModelFactory[MedicationIntake]):
+    class Meta:
+        model = MedicationIntake
+
+    user = factory.SubFactory(UserFactory)
+    medication = factory.SubFactory(MedicationFactory, user=factory.SelfAttribute("..user"))
+    intake_date = factory.LazyFunction(date.today)
+    dose = 1
@@ -0,0 +1,110 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects, assertTemplateUsed
+
+from allergy.cache import get_calendar_fragment_stats
+from tests.factories.symptom_entry import SymptomEntryFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+PARTIAL_CALENDAR_BUNDLE_VIEW_NAME = "allergy:partial_calendar_bundle"
+LOGIN_VIEW_NAME = "login_view"
+
+
+def bundle_url(year: int, month: int) -> str:
+    return reverse(PARTIAL_CALENDAR_BUNDLE_VIEW_NAME, kwargs={"year": year, "month": month})
+
+
+def calendar_url(year: int, month: int) -> str:
+    return reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": year, "month": month})
+
+
+@pytest.mark.django_db
+def test_partial_calendar_bundle_anonymous_user(anonymous_client: Client) -> None:
+    # Given
+    url = bundle_url(2024, 5)
+
+    # When
+    response = anonymous_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_VIEW_NAME))
+
+
+@pytest.mark.django_db
+def test_partial_calendar_bundle_returns_adjacent_months(authenticated_client: Client, user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2023, 12, 24))
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 1, 10))
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 2, 29))
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(bundle_url(2024, 1))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/calendar/calendar_bundle.html")
+    assert len([query for query in queries.captured_queries if "allergy_" in query["sql"]]) == 1
+
+    selector = Selector(text=response.content.decode(response.charset))
+    months = selector.xpath("//template[@data-calendar-url]")
+    assert [month.attrib["data-calendar-url"] for month in months] == [
+        calendar_url(2023, 12),
+        calendar_url(2024, 1),
+        calendar_url(2024, 2),
+    ]
+    assert months[0].xpath("normalize-space(.//h2[@id='monthYear'])").get() == "December 2023"
+    assert months[1].xpath("normalize-space(.//h2[@id='monthYear'])").get() == "January 2024"
+    assert months[2].xpath("normalize-space(.//h2[@id='monthYear'])").get() == "February 2024"
+    assert "bottom-0.5 left-1/2" in months[2].get()
+
+
+@pytest.mark.django_db
+def test_partial_calendar_bundle_preserves_explicit_selected_date(authenticated_client: Client) -> None:
+    # Given
+    url = f"{bundle_url(2024, 5)}?selected_date=2024-05-15"
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode(response.charset))
+    months = selector.xpath("//template[@data-calendar-url]")
+    assert months[0].attrib["data-calendar-url"] == f"{calendar_url(2024, 4)}?selected_date=2024-05-15"
+    assert months[2].attrib["data-calendar-url"] == f"{calendar_url(2024, 6)}?selected_date=2024-05-15"
+
+
+@pytest.mark.django_db
+def test_partial_calendar_bundle_reuses_cached_months(authenticated_client: Client) -> None:
+    # Given
+    authenticated_client.get(calendar_url(2024, 5))
+
+    # When
+    response = authenticated_client.get(bundle_url(2024, 5))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert get_calendar_fragment_stats() == {"hits": 1, "misses": 3}
+
+
+@pytest.mark.django_db
+def test_partial_calendar_bundle_invalid_month_returns_400(authenticated_client: Client) -> None:
+    # Given
+    url = bundle_url(2024, 13)
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert b"Invalid date parameters provided." in response.content
@@ -0,0 +1,136 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django import DjangoCaptureOnCommitCallbacks
+
+from allergy.cache import get_calendar_fragment_stats, get_data_version
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+SYMPTOM_SAVE_URL = "allergy:symptom_save_partial"
+
+
+def calendar_url(year: int, month: int, day: int | None = None) -> str:
+    kwargs = {"year": year, "month": month}
+    if day is not None:
+        kwargs["day"] = day
+    return reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs=kwargs)
+
+
+@pytest.mark.django_db
+def test_partial_calendar_served_from_cache_on_repeat(authenticated_client: Client) -> None:
+    # Given
+    url = calendar_url(2024, 4, 15)
+    first_response = authenticated_client.get(url)
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        second_response = authenticated_client.get(url)
+
+    # Then
+    assert first_response.status_code == HTTPStatus.OK
+    assert second_response.status_code == HTTPStatus.OK
+    assert not [query for query in queries.captured_queries if "allergy_" in query["sql"]]
+    assert second_response.content == first_response.content
+    assert get_calendar_fragment_stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_partial_calendar_cache_keyed_by_selected_day(authenticated_client: Client) -> None:
+    # Given
+    authenticated_client.get(calendar_url(2024, 4, 15))
+
+    # When
+    response = authenticated_client.get(calendar_url(2024, 4, 16))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["selected_day"] == 16
+    assert get_calendar_fragment_stats() == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_partial_calendar_cache_invalidated_by_symptom_save(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    url = calendar_url(2024, 4, 15)
+    authenticated_client.get(url)
+    post_data = {"symptom_uuid": str(symptom_type.uuid), "intensity": 3, "selected_date": "2024-04-09"}
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.post(reverse(SYMPTOM_SAVE_URL), post_data)
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["days_with_entries"] == [9]
+    assert get_calendar_fragment_stats() == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_data_version_bumped_by_entry_writes(
+    user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    initial_version = get_data_version(user.pk)
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        entry = SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 9))
+    created_version = get_data_version(user.pk)
+    with django_capture_on_commit_callbacks(execute=True):
+        entry.delete()
+    deleted_version = get_data_version(user.pk)
+
+    # Then
+    assert initial_version < created_version < deleted_version
+
+
+@pytest.mark.django_db
+def test_data_version_bumped_only_after_commit(
+    user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    initial_version = get_data_version(user.pk)
+
+    # When
+    with django_capture_on_commit_callbacks() as callbacks:
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 4, 9))
+        uncommitted_version = get_data_version(user.pk)
+    for callback in callbacks:
+        callback()
+
+    # Then
+    assert uncommitted_version == initial_version
+    assert len(callbacks) == 1
+    assert get_data_version(user.pk) > initial_version
+
+
+@pytest.mark.django_db
+def test_data_version_bumped_once_by_cascading_deletes(
+    user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    for day in range(1, 6):
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 4, day))
+    initial_version = get_data_version(user.pk)
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        symptom_type.delete()
+
+    # Then
+    assert len(callbacks) == 1
+    assert get_data_version(user.pk) > initial_version
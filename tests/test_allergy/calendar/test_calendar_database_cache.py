@@ -0,0 +1,81 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import AsyncClient
+from django.urls import reverse
+from pytest_django import Settings
+
+from allergy.cache import get_calendar_fragment_stats
+from tests.factories.symptom_entry import SymptomEntryFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+SYMPTOMS_CONTAINER_URL = "allergy:symptoms_container_partial"
+EXISTING_SYMPTOMS_PARTIAL_URL_NAME = "settings:partial_existing_symptoms"
+
+
+@pytest.fixture
+def database_cache(settings: Settings) -> None:
+    # The database cache cannot be used synchronously from the event loop, unlike the local memory cache.
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "test_cache_table"}
+    }
+    call_command("createcachetable")
+
+
+@pytest.fixture
+def async_authenticated_client(user: User) -> AsyncClient:
+    client = AsyncClient()
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("database_cache")
+def test_partial_calendar_with_database_cache(async_authenticated_client: AsyncClient, user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 9))
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 5})
+
+    # When
+    first_response = async_to_sync(async_authenticated_client.get)(url)
+    cached_response = async_to_sync(async_authenticated_client.get)(url)
+    not_modified_response = async_to_sync(async_authenticated_client.get)(
+        url, headers={"if-none-match": first_response.headers["ETag"]}
+    )
+
+    # Then
+    assert first_response.status_code == HTTPStatus.OK
+    assert cached_response.status_code == HTTPStatus.OK
+    assert cached_response.content == first_response.content
+    assert not_modified_response.status_code == HTTPStatus.NOT_MODIFIED
+    assert get_calendar_fragment_stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("database_cache")
+@pytest.mark.parametrize(
+    "url",
+    [
+        reverse(SYMPTOMS_CONTAINER_URL, kwargs={"year": 2024, "month": 5, "day": 9}),
+        reverse(EXISTING_SYMPTOMS_PARTIAL_URL_NAME),
+    ],
+)
+def test_async_partials_with_database_cache(async_authenticated_client: AsyncClient, user: User, url: str) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 9))
+    # The first response sets the CSRF cookie, which is part of the ETag.
+    async_to_sync(async_authenticated_client.get)(url)
+
+    # When
+    response = async_to_sync(async_authenticated_client.get)(url)
+    not_modified_response = async_to_sync(async_authenticated_client.get)(
+        url, headers={"if-none-match": response.headers["ETag"]}
+    )
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert not_modified_response.status_code == HTTPStatus.NOT_MODIFIED
@@ -0,0 +1,72 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from tests.factories.symptom_entry import SymptomEntryFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+SYMPTOMS_CONTAINER_URL = "allergy:symptoms_container_partial"
+
+
+@pytest.mark.django_db
+def test_partial_calendar_sets_private_etag(authenticated_client: Client) -> None:
+    # Given
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.has_header("ETag")
+    assert "private" in response["Cache-Control"]
+    assert "no-cache" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_partial_calendar_matching_etag_returns_not_modified(authenticated_client: Client) -> None:
+    # Given
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+    etag = authenticated_client.get(url)["ETag"]
+
+    # When
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_symptoms_container_etag_changes_after_entry_write(authenticated_client: Client, user: User) -> None:
+    # Given
+    url = reverse(SYMPTOMS_CONTAINER_URL, kwargs={"year": 2024, "month": 4, "day": 9})
+    etag = authenticated_client.get(url)["ETag"]
+
+    # When
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 9))
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response["ETag"] != etag
+    assert len(response.context["selected_symptoms"]) == 1
+
+
+@pytest.mark.django_db
+def test_partial_etag_differs_between_users(
+    authenticated_client: Client, authenticated_second_user_client: Client
+) -> None:
+    # Given
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+    etag = authenticated_client.get(url)["ETag"]
+
+    # When
+    response = authenticated_second_user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
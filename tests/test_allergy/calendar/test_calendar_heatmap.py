@@ -0,0 +1,73 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from parsel import Selector
+
+from allergy.models import MonthlyEntrySummary
+from allergy.summaries import DayStats
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+
+
+@pytest.mark.django_db
+def test_month_summary_tracks_day_stats(user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+
+    # When
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 4, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 4, 1), intensity=9)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 4, 15), intensity=5)
+
+    # Then
+    summary = MonthlyEntrySummary.objects.get(user=user, year=2024, month=4)
+    assert summary.day_stats == {"1": [2, 9, 11], "15": [1, 5, 5]}
+
+
+@pytest.mark.django_db
+def test_partial_calendar_context_contains_day_stats(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 4, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 4, 1), intensity=9)
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    day_stats = response.context["day_stats"]
+    assert day_stats == {1: DayStats(entry_count=2, max_intensity=9, intensity_sum=11)}
+    assert day_stats[1].mean_intensity == 5.5
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("intensity", "expected_class"),
+    [(1, "bg-yellow-50"), (4, "bg-orange-100"), (7, "bg-red-200")],
+)
+def test_partial_calendar_renders_heat_levels(
+    authenticated_client: Client, user: User, intensity: int, expected_class: str
+) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 10), intensity=intensity)
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+
+    # When
+    response = authenticated_client.get(url, {"selected_date": "2024-04-20"})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode())
+    day_button = selector.xpath("//button[normalize-space(text())='10']")
+    assert expected_class in day_button.attrib["class"].split()
+    assert day_button.attrib["title"] == f"1 symptom, max intensity {intensity}, mean {float(intensity)}"
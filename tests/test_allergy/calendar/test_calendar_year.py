@@ -0,0 +1,115 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django import DjangoCaptureOnCommitCallbacks
+from pytest_django.asserts import assertRedirects, assertTemplateUsed
+
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_CALENDAR_YEAR_VIEW_NAME = "allergy:partial_calendar_year"
+LOGIN_VIEW_NAME = "login_view"
+
+
+def year_url(year: int) -> str:
+    return reverse(PARTIAL_CALENDAR_YEAR_VIEW_NAME, kwargs={"year": year})
+
+
+def count_allergy_queries(queries: CaptureQueriesContext) -> int:
+    return len([query for query in queries.captured_queries if "allergy_" in query["sql"]])
+
+
+@pytest.mark.django_db
+def test_partial_calendar_year_anonymous_user(anonymous_client: Client) -> None:
+    # Given
+    url = year_url(2024)
+
+    # When
+    response = anonymous_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_VIEW_NAME))
+
+
+@pytest.mark.django_db
+def test_partial_calendar_year_invalid_year(authenticated_client: Client) -> None:
+    # Given
+    url = year_url(0)
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_partial_calendar_year_renders_twelve_months(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2023, 12, 31), intensity=9)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 1, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 6, 15), intensity=8)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2025, 1, 1), intensity=5)
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(year_url(2024))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/calendar/calendar_year.html")
+    assert count_allergy_queries(queries) == 1
+
+    months = response.context["months"]
+    assert [month["number"] for month in months] == list(range(1, 13))
+    assert list(months[0]["day_stats"]) == [1]
+    assert list(months[5]["day_stats"]) == [15]
+    assert all(not month["day_stats"] for month in months[1:5] + months[6:])
+
+    selector = Selector(text=response.content.decode(response.charset))
+    assert len(selector.xpath("//div[@data-month]")) == 12
+    heat_cell_classes = selector.xpath("//div[@title='1 symptom, max intensity 8, mean 8.0']/@class").get(default="")
+    assert "bg-red-200" in heat_cell_classes.split()
+
+
+@pytest.mark.django_db
+def test_partial_calendar_year_served_from_cache(authenticated_client: Client, user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 3, 3))
+    first_response = authenticated_client.get(year_url(2024))
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(year_url(2024))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert count_allergy_queries(queries) == 0
+    assert response.content == first_response.content
+
+
+@pytest.mark.django_db
+def test_partial_calendar_year_cache_invalidated_by_new_entry(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    authenticated_client.get(year_url(2024))
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        SymptomEntryFactory.create(user=user, entry_date=date(2024, 3, 3), intensity=1)
+    response = authenticated_client.get(year_url(2024))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode(response.charset))
+    assert selector.xpath("//div[@data-month='3']//div[@title='1 symptom, max intensity 1, mean 1.0']")
@@ -0,0 +1,153 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from allergy.models import MonthlyEntrySummary, SymptomEntry
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_CALENDAR_VIEW_NAME = "allergy:partial_calendar"
+SYMPTOM_SAVE_URL = "allergy:symptom_save_partial"
+SYMPTOM_REMOVE_URL = "allergy:symptom_remove_partial"
+REMOVE_SYMPTOM_TYPE_URL = "settings:partial_symptom_type_remove"
+
+
+def get_summary(user: User, year: int, month: int) -> MonthlyEntrySummary:
+    return MonthlyEntrySummary.objects.get(user=user, year=year, month=month)
+
+
+@pytest.mark.django_db
+def test_month_summary_tracks_created_entries(user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+
+    # When
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 4, 1))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 4, 1))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 4, 30))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 1))
+
+    # Then
+    april = get_summary(user, 2024, 4)
+    assert april.days == [1, 30]
+    assert april.entry_count == 3
+
+    may = get_summary(user, 2024, 5)
+    assert may.days == [1]
+    assert may.entry_count == 1
+
+
+@pytest.mark.django_db
+def test_month_summary_updated_by_symptom_save(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    post_data = {"symptom_uuid": str(symptom_type.uuid), "intensity": 4, "selected_date": "2024-03-31"}
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_SAVE_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    summary = get_summary(user, 2024, 3)
+    assert summary.days == [31]
+    assert summary.entry_count == 1
+
+
+@pytest.mark.django_db
+def test_month_summary_updated_by_symptom_remove(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 20))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 5, 20))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 21))
+
+    url_kwargs = {"year": 2024, "month": 5, "day": 21, "symptom_uuid": symptom_type_1.uuid}
+
+    # When
+    response = authenticated_client.delete(reverse(SYMPTOM_REMOVE_URL, kwargs=url_kwargs))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    summary = get_summary(user, 2024, 5)
+    assert summary.days == [20]
+    assert summary.entry_count == 2
+
+
+@pytest.mark.django_db
+def test_month_summary_updated_by_symptom_type_cascade(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 20))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 6, 2))
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 6, 3))
+
+    url = reverse(REMOVE_SYMPTOM_TYPE_URL, kwargs={"symptom_type_uuid": symptom_type_1.uuid})
+
+    # When
+    response = authenticated_client.delete(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert not SymptomEntry.objects.filter(symptom_type_id=symptom_type_1.uuid).exists()
+
+    may = get_summary(user, 2024, 5)
+    assert may.days == []
+    assert may.entry_count == 0
+
+    june = get_summary(user, 2024, 6)
+    assert june.days == [3]
+    assert june.entry_count == 1
+
+
+@pytest.mark.django_db
+def test_month_summary_updated_for_both_dates_of_moved_entry(user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 20))
+    entry = SymptomEntry.objects.get(user=user)
+
+    # When
+    entry.entry_date = date(2024, 6, 2)
+    entry.save()
+
+    # Then
+    may = get_summary(user, 2024, 5)
+    assert may.days == []
+    assert may.entry_count == 0
+
+    june = get_summary(user, 2024, 6)
+    assert june.days == [2]
+    assert june.entry_count == 1
+
+
+@pytest.mark.django_db
+def test_month_summary_removed_with_user(user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 20))
+
+    # When
+    user.delete()
+
+    # Then
+    assert not MonthlyEntrySummary.objects.exists()
+
+
+@pytest.mark.django_db
+def test_partial_calendar_reads_days_from_month_summary(authenticated_client: Client, user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 9))
+    MonthlyEntrySummary.objects.filter(user=user, year=2024, month=4).update(day_mask=(1 << 2) | (1 << 17))
+    url = reverse(PARTIAL_CALENDAR_VIEW_NAME, kwargs={"year": 2024, "month": 4})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["days_with_entries"] == [3, 18]
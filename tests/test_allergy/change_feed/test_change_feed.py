@@ -0,0 +1,218 @@
+import json
+import uuid
+from datetime import date, timedelta
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from pytest_django.asserts import assertRedirects
+
+from allergy.change_feed import get_changes
+from allergy.models import DeletedRecord, SymptomEntry
+from tests.factories.medication import MedicationFactory
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+CHANGE_FEED_URL = "allergy:change_feed"
+SYMPTOM_REMOVE_URL = "allergy:symptom_remove_partial"
+REMOVE_SYMPTOM_TYPE_URL = "settings:partial_symptom_type_remove"
+DELETE_MEDICATION_URL = "settings:partial_delete_medication"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.fixture(autouse=True)
+def no_settle_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("allergy.change_feed.CHANGE_FEED_SETTLE_DELAY", timedelta(0))
+
+
+@pytest.mark.django_db
+def test_change_feed_pages_through_all_changes_once(user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    entries = [
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, day))
+        for day in range(1, 6)
+    ]
+    medication = MedicationFactory.create(user=user)
+
+    # When
+    seen: list[tuple[str, uuid.UUID]] = []
+    cursor = None
+    has_more = True
+    while has_more:
+        page = get_changes(cursor, limit=2)
+        seen.extend((change.record_type, change.uuid) for change in page.changes)
+        cursor, has_more = page.next_cursor, page.has_more
+
+    # Then
+    expected = {("symptom_type", symptom_type.uuid), ("medication", medication.uuid)}
+    expected |= {("symptom_entry", entry.uuid) for entry in entries}
+    assert len(seen) == len(expected)
+    assert set(seen) == expected
+    assert get_changes(cursor).changes == []
+
+
+@pytest.mark.django_db
+def test_change_feed_returns_only_rows_changed_after_cursor(user: User) -> None:
+    # Given
+    entry_1 = SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 2))
+    cursor = get_changes().next_cursor
+
+    # When
+    entry_1.intensity = 8
+    entry_1.save()
+    page = get_changes(cursor)
+
+    # Then
+    assert [(change.action, change.uuid) for change in page.changes] == [("upsert", entry_1.uuid)]
+    assert page.changes[0].data["intensity"] == 8
+    assert not page.has_more
+
+
+@pytest.mark.django_db
+def test_change_feed_holds_back_unsettled_changes(user: User, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Given
+    monkeypatch.setattr("allergy.change_feed.CHANGE_FEED_SETTLE_DELAY", timedelta(minutes=1))
+    SymptomEntryFactory.create(user=user)
+
+    # When
+    page = get_changes()
+    later_page = get_changes(until=timezone.now() + timedelta(minutes=1))
+
+    # Then
+    assert page.changes == []
+    assert len(later_page.changes) == 2
+
+
+@pytest.mark.django_db
+def test_symptom_remove_records_tombstone(authenticated_client: Client, user: User) -> None:
+    # Given
+    entry = SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 20))
+    cursor = get_changes().next_cursor
+    url_kwargs = {"year": 2024, "month": 5, "day": 20, "symptom_uuid": entry.symptom_type.uuid}
+
+    # When
+    authenticated_client.delete(reverse(SYMPTOM_REMOVE_URL, kwargs=url_kwargs))
+    page = get_changes(cursor)
+
+    # Then
+    assert [(change.record_type, change.action, change.uuid) for change in page.changes] == [
+        ("symptom_entry", "delete", entry.uuid)
+    ]
+
+
+@pytest.mark.django_db
+def test_symptom_type_remove_records_tombstones_for_cascaded_entries(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    entry_1 = SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, 1))
+    entry_2 = SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, 2))
+
+    # When
+    authenticated_client.delete(reverse(REMOVE_SYMPTOM_TYPE_URL, kwargs={"symptom_type_uuid": symptom_type.uuid}))
+
+    # Then
+    tombstones = set(DeletedRecord.objects.values_list("record_type", "record_uuid"))
+    assert tombstones == {
+        ("symptom_entry", entry_1.uuid),
+        ("symptom_entry", entry_2.uuid),
+        ("symptom_type", symptom_type.uuid),
+    }
+
+
+@pytest.mark.django_db
+def test_medication_delete_records_tombstone(authenticated_client: Client, user: User) -> None:
+    # Given
+    medication = MedicationFactory.create(user=user)
+
+    # When
+    authenticated_client.delete(reverse(DELETE_MEDICATION_URL, kwargs={"medication_uuid": medication.uuid}))
+
+    # Then
+    assert list(DeletedRecord.objects.values_list("record_type", "record_uuid")) == [("medication", medication.uuid)]
+
+
+@pytest.mark.django_db
+def test_user_delete_records_tombstones(user: User) -> None:
+    # Given
+    entry = SymptomEntryFactory.create(user=user)
+    medication = MedicationFactory.create(user=user)
+    user_id = user.pk
+
+    # When
+    user.delete()
+
+    # Then
+    assert not SymptomEntry.objects.exists()
+    tombstones = set(DeletedRecord.objects.filter(user_id=user_id).values_list("record_type", "record_uuid"))
+    assert tombstones == {
+        ("symptom_entry", entry.uuid),
+        ("symptom_type", entry.symptom_type.uuid),
+        ("medication", medication.uuid),
+    }
+
+
+@pytest.mark.django_db
+def test_change_feed_endpoint_anonymous(anonymous_client: Client) -> None:
+    # When
+    response = anonymous_client.get(reverse(CHANGE_FEED_URL))
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_change_feed_endpoint_is_scoped_to_user(authenticated_client: Client, user: User, second_user: User) -> None:
+    # Given
+    entry = SymptomEntryFactory.create(user=user, entry_date=date(2024, 5, 1), intensity=4)
+    SymptomEntryFactory.create(user=second_user)
+
+    # When
+    response = authenticated_client.get(reverse(CHANGE_FEED_URL), {"limit": 10})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    payload = response.json()
+    assert {change["record_type"] for change in payload["changes"]} == {"symptom_entry", "symptom_type"}
+    entry_change = next(change for change in payload["changes"] if change["record_type"] == "symptom_entry")
+    assert entry_change["uuid"] == str(entry.uuid)
+    assert entry_change["data"]["entry_date"] == "2024-05-01"
+    assert entry_change["data"]["intensity"] == 4
+    assert payload["has_more"] is False
+
+    next_response = authenticated_client.get(reverse(CHANGE_FEED_URL), {"since": payload["next_cursor"]})
+    assert next_response.json()["changes"] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [{"since": "not-a-cursor"}, {"limit": "0"}, {"limit": "many"}])
+def test_change_feed_endpoint_invalid_parameters(authenticated_client: Client, params: dict[str, str]) -> None:
+    # When
+    response = authenticated_client.get(reverse(CHANGE_FEED_URL), params)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_change_feed_command_writes_ndjson(user: User) -> None:
+    # Given
+    entry = SymptomEntryFactory.create(user=user)
+    stdout = StringIO()
+    stderr = StringIO()
+
+    # When
+    call_command("change_feed", "--page-size=1", stdout=stdout, stderr=stderr)
+
+    # Then
+    changes = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert {change["uuid"] for change in changes} == {str(entry.uuid), str(entry.symptom_type.uuid)}
+    cursor = stderr.getvalue().removeprefix("Next cursor: ").strip()
+    assert get_changes(cursor).changes == []
@@ -0,0 +1,29 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from allergy.models import DeletedRecord, Medication, SymptomEntry, SymptomType
+
+
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_async_views_reports_both_handlers_and_cleans_up() -> None:
+    # Given
+    stdout = StringIO()
+
+    # When
+    call_command("benchmark_async_views", "--clients=2", "--requests=5", "--days=10", stdout=stdout)
+
+    # Then
+    output = stdout.getvalue()
+    assert "WSGI (2 concurrent clients)" in output
+    assert "ASGI (2 concurrent clients)" in output
+    assert output.count("Requests: 10 (0 failed)") == 2
+    assert output.count("p99 latency:") == 2
+
+    assert not User.objects.exists()
+    assert not SymptomType.objects.exists()
+    assert not SymptomEntry.objects.exists()
+    assert not Medication.objects.exists()
+    assert not DeletedRecord.objects.exists()
@@ -0,0 +1,30 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+
+from allergy.models import SymptomEntry, SymptomType
+
+
+@pytest.mark.django_db
+def test_benchmark_entry_queries_reports_plans_and_rolls_back() -> None:
+    # Given
+    stdout = StringIO()
+
+    # When
+    call_command("benchmark_entry_queries", "--days=30", "--symptom-types=3", "--repeat=1", stdout=stdout)
+
+    # Then
+    output = stdout.getvalue()
+    assert "Before (without composite indexes)" in output
+    assert "After (with composite indexes)" in output
+    assert output.count("Month day aggregate: best") == 2
+
+    assert not User.objects.exists()
+    assert not SymptomType.objects.exists()
+    assert not SymptomEntry.objects.exists()
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, SymptomEntry._meta.db_table)
+    assert {"entry_user_date_idx", "entry_user_type_date_idx"} <= constraints.keys()
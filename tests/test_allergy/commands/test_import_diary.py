@@ -0,0 +1,153 @@
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from allergy.models import MonthlyEntrySummary, SymptomEntry, SymptomType
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+
+@pytest.mark.django_db
+def test_import_diary_csv_creates_types_and_upserts_entries(tmp_path: Path, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    existing = SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 1), intensity=2)
+    diary = tmp_path / "diary.csv"
+    diary.write_text(
+        "﻿date,symptom,intensity\n"
+        "2024-05-01,pollen,8\n"
+        "2024-05-01,Runny  nose,3\n"
+        "2024-05-02,Runny nose,5\n"
+        "2024-06-10,Pollen,4\n",
+        encoding="utf-8",
+    )
+    stdout, stderr = StringIO(), StringIO()
+
+    # When
+    call_command("import_diary", user.username, str(diary), "--batch-size=2", stdout=stdout, stderr=stderr)
+
+    # Then
+    assert "Imported 4 rows into 4 entries and created 1 symptom types." in stdout.getvalue()
+    assert stderr.getvalue().splitlines() == ["Imported 2 rows...", "Imported 4 rows..."]
+
+    assert sorted(SymptomType.objects.filter(user=user).values_list("name", flat=True)) == ["Pollen", "Runny nose"]
+    existing.refresh_from_db()
+    assert existing.intensity == 8
+    assert sorted(
+        SymptomEntry.objects.filter(user=user).values_list("entry_date", "symptom_type__name", "intensity")
+    ) == [
+        (date(2024, 5, 1), "Pollen", 8),
+        (date(2024, 5, 1), "Runny nose", 3),
+        (date(2024, 5, 2), "Runny nose", 5),
+        (date(2024, 6, 10), "Pollen", 4),
+    ]
+    assert set(MonthlyEntrySummary.objects.filter(user=user).values_list("year", "month")) == {(2024, 5), (2024, 6)}
+
+
+@pytest.mark.django_db
+def test_import_diary_counts_entries_repeated_across_batches_once(tmp_path: Path, user: User) -> None:
+    # Given
+    diary = tmp_path / "diary.csv"
+    diary.write_text(
+        "date,symptom,intensity\n2024-05-01,Pollen,2\n2024-05-02,Pollen,3\n2024-05-01,Pollen,7\n", encoding="utf-8"
+    )
+    stdout = StringIO()
+
+    # When
+    call_command("import_diary", user.username, str(diary), "--batch-size=2", stdout=stdout, stderr=StringIO())
+
+    # Then
+    assert "Imported 3 rows into 2 entries and created 1 symptom types." in stdout.getvalue()
+    assert SymptomEntry.objects.get(user=user, entry_date=date(2024, 5, 1)).intensity == 7
+
+
+@pytest.mark.django_db
+def test_import_diary_ndjson_skips_medication_rows(tmp_path: Path, user: User) -> None:
+    # Given
+    diary = tmp_path / "history.ndjson"
+    diary.write_text(
+        '{"record_type": "symptom_entry", "entry_date": "2024-05-01", "symptom": "Pollen", "intensity": 6}\n'
+        "\n"
+        '{"record_type": "medication", "medication_name": "Cetirizine", "medication_type": "pills"}\n',
+        encoding="utf-8",
+    )
+
+    # When
+    call_command("import_diary", user.username, str(diary), stdout=StringIO(), stderr=StringIO())
+
+    # Then
+    assert list(SymptomEntry.objects.filter(user=user).values_list("entry_date", "intensity")) == [
+        (date(2024, 5, 1), 6)
+    ]
+
+
+@pytest.mark.django_db
+def test_import_diary_invalid_row_rolls_back_its_batch(tmp_path: Path, user: User) -> None:
+    # Given
+    diary = tmp_path / "diary.csv"
+    diary.write_text("date,symptom,intensity\n2024-05-01,Pollen,8\n2024-05-02,Pollen,11\n", encoding="utf-8")
+
+    # When / Then
+    with pytest.raises(CommandError, match=r"Line 3: intensity must be between 1 and 10."):
+        call_command("import_diary", user.username, str(diary), "--batch-size=2", stdout=StringIO(), stderr=StringIO())
+
+    assert not SymptomType.objects.filter(user=user).exists()
+    assert not SymptomEntry.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_import_diary_invalid_row_keeps_committed_batches(tmp_path: Path, user: User) -> None:
+    # Given
+    diary = tmp_path / "diary.csv"
+    diary.write_text("date,symptom,intensity\n2024-05-01,Pollen,8\n2024-05-02,Pollen,11\n", encoding="utf-8")
+
+    # When / Then
+    with pytest.raises(
+        CommandError, match=r"Line 3: intensity must be between 1 and 10. The 1 rows before it were imported."
+    ):
+        call_command("import_diary", user.username, str(diary), "--batch-size=1", stdout=StringIO(), stderr=StringIO())
+
+    assert list(SymptomEntry.objects.filter(user=user).values_list("entry_date", "intensity")) == [
+        (date(2024, 5, 1), 8)
+    ]
+
+
+@pytest.mark.django_db
+def test_import_diary_unknown_user(tmp_path: Path) -> None:
+    # Given
+    diary = tmp_path / "diary.csv"
+    diary.write_text("date,symptom,intensity\n", encoding="utf-8")
+
+    # When / Then
+    with pytest.raises(CommandError, match=r"User nobody does not exist."):
+        call_command("import_diary", "nobody", str(diary))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("line", "error"),
+    [
+        ('{"entry_date": "2024-05-01", "symptom": "Pollen", "intensity": 3.7}', "Line 1: invalid date or intensity."),
+        ('{"entry_date": "2024-05-01", "symptom": "Pollen", "intensity": true}', "Line 1: invalid date or intensity."),
+        ('{"entry_date": "2024-05-01", "symptom": "Pollen", "intensity": "1_0"}', "Line 1: invalid date or intensity."),
+        (
+            '{"entry_date": "2024-05-01", "symptom": "<b>Pollen</b>", "intensity": 3}',
+            "Line 1: Symptom name should only contain letters and spaces.",
+        ),
+    ],
+)
+def test_import_diary_rejects_values_the_forms_reject(tmp_path: Path, user: User, line: str, error: str) -> None:
+    # Given
+    diary = tmp_path / "diary.ndjson"
+    diary.write_text(line + "\n", encoding="utf-8")
+
+    # When / Then
+    with pytest.raises(CommandError, match=error):
+        call_command("import_diary", user.username, str(diary), stdout=StringIO(), stderr=StringIO())
+
+    assert not SymptomType.objects.filter(user=user).exists()
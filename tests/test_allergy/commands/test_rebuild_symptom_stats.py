@@ -0,0 +1,60 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from allergy.models import MonthlyEntrySummary, UserSymptomStats
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+
+@pytest.mark.django_db
+def test_rebuild_symptom_stats_recomputes_from_entries(user: User, second_user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=4)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 2), intensity=6)
+    SymptomEntryFactory.create(user=second_user, entry_date=date(2024, 4, 1), intensity=1)
+    UserSymptomStats.objects.filter(user=user).update(entry_count=99, intensity_sum=0, type_counts={})
+    MonthlyEntrySummary.objects.create(user=user, year=2023, month=1, day_mask=1, entry_count=1)
+    stdout = StringIO()
+
+    # When
+    call_command("rebuild_symptom_stats", stdout=stdout)
+
+    # Then
+    assert "Rebuilt symptom stats for 2 users." in stdout.getvalue()
+    stats = UserSymptomStats.objects.get(user=user)
+    assert stats.entry_count == 2
+    assert stats.day_count == 2
+    assert stats.intensity_sum == 10
+    assert stats.latest_entry_date == date(2024, 5, 2)
+    assert stats.type_counts == {str(pollen.uuid): 2}
+    assert not MonthlyEntrySummary.objects.filter(user=user, year=2023).exists()
+
+
+@pytest.mark.django_db
+def test_rebuild_symptom_stats_for_one_user(user: User, second_user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 1))
+    SymptomEntryFactory.create(user=second_user, entry_date=date(2024, 4, 1))
+    UserSymptomStats.objects.update(entry_count=0)
+    stdout = StringIO()
+
+    # When
+    call_command("rebuild_symptom_stats", f"--user={user.username}", stdout=stdout)
+
+    # Then
+    assert "Rebuilt symptom stats for 1 users." in stdout.getvalue()
+    assert UserSymptomStats.objects.get(user=user).entry_count == 1
+    assert UserSymptomStats.objects.get(user=second_user).entry_count == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_symptom_stats_unknown_user() -> None:
+    # When / Then
+    with pytest.raises(CommandError, match=r"User missing does not exist\."):
+        call_command("rebuild_symptom_stats", "--user=missing")
@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django import DjangoCaptureOnCommitCallbacks
+from pytest_django.asserts import assertContains, assertTemplateUsed
+
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+INSIGHTS_VIEW_NAME = "allergy:insights"
+PARTIAL_COOCCURRENCE_VIEW_NAME = "allergy:partial_cooccurrence"
+
+
+def count_allergy_queries(queries: CaptureQueriesContext) -> int:
+    return len([query for query in queries.captured_queries if "allergy_" in query["sql"]])
+
+
+@pytest.mark.django_db
+def test_insights_page(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(INSIGHTS_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/insights.html")
+    assertContains(response, reverse(PARTIAL_COOCCURRENCE_VIEW_NAME))
+
+
+@pytest.mark.django_db
+def test_partial_cooccurrence_counts_and_correlation(authenticated_client: Client, user: User) -> None:
+    # Given
+    eyes = SymptomTypeFactory.create(user=user, name="Itchy eyes")
+    sneezing = SymptomTypeFactory.create(user=user, name="Sneezing")
+    cough = SymptomTypeFactory.create(user=user, name="Cough")
+    SymptomTypeFactory.create(user=user, name="Never logged")
+    first_day = date(2024, 5, 1)
+    for offset, (eyes_intensity, sneezing_intensity) in enumerate([(2, 3), (4, 5), (6, 7), (8, 0)]):
+        entry_date = first_day + timedelta(days=offset)
+        SymptomEntryFactory.create(user=user, symptom_type=eyes, entry_date=entry_date, intensity=eyes_intensity)
+        if sneezing_intensity:
+            SymptomEntryFactory.create(
+                user=user, symptom_type=sneezing, entry_date=entry_date, intensity=sneezing_intensity
+            )
+    SymptomEntryFactory.create(user=user, symptom_type=cough, entry_date=first_day + timedelta(days=9), intensity=5)
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_COOCCURRENCE_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/insights/cooccurrence.html")
+    matrix = response.context["matrix"]
+    assert matrix.day_count == 5
+    assert matrix.symptom_names == ["Cough", "Itchy eyes", "Sneezing"]
+    assert matrix.counts == [[1, 0, 0], [0, 4, 3], [0, 3, 3]]
+    assert matrix.correlations[1][1] == pytest.approx(1.0)
+    assert matrix.correlations[0][1] == pytest.approx(-0.707, abs=1e-3)
+    assert matrix.correlations[1][2] == pytest.approx(0.205, abs=1e-3)
+    assert [(pair.first_name, pair.second_name, pair.days_together) for pair in matrix.top_pairs] == [
+        ("Itchy eyes", "Sneezing", 3)
+    ]
+
+    selector = Selector(text=response.content.decode())
+    assert len(selector.css("#cooccurrence-pairs li")) == 1
+    assert len(selector.css("#cooccurrence-matrix tbody tr")) == 3
+
+
+@pytest.mark.django_db
+def test_partial_cooccurrence_cached_until_data_changes(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user, name="Sneezing")
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, 1))
+    url = reverse(PARTIAL_COOCCURRENCE_VIEW_NAME)
+    authenticated_client.get(url)
+
+    # When
+    with CaptureQueriesContext(connection) as cached_queries:
+        cached_response = authenticated_client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, 2))
+    refreshed_response = authenticated_client.get(url)
+
+    # Then
+    assert count_allergy_queries(cached_queries) == 0
+    assert cached_response.context["matrix"].day_count == 1
+    assert refreshed_response.context["matrix"].day_count == 2
@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertContains, assertTemplateUsed
+
+from tests.factories.medication import MedicationFactory
+from tests.factories.medication_intake import MedicationIntakeFactory
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_MEDICATION_EFFECTS_VIEW_NAME = "allergy:partial_medication_effects"
+
+
+@pytest.mark.django_db
+def test_partial_medication_effects_compares_windows(authenticated_client: Client, user: User) -> None:
+    # Given
+    today = date.today()
+    intake_day = today - timedelta(days=10)
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    eyes = SymptomTypeFactory.create(user=user, name="Itchy eyes")
+    for offset, (pollen_intensity, eyes_intensity) in zip(
+        [-3, -2, -1, 1, 2, 3], [(6, 3), (6, 0), (9, 3), (3, 0), (0, 0), (3, 3)], strict=True
+    ):
+        entry_date = intake_day + timedelta(days=offset)
+        if pollen_intensity:
+            SymptomEntryFactory.create(
+                user=user, symptom_type=pollen, entry_date=entry_date, intensity=pollen_intensity
+            )
+        if eyes_intensity:
+            SymptomEntryFactory.create(user=user, symptom_type=eyes, entry_date=entry_date, intensity=eyes_intensity)
+    antihistamine = MedicationFactory.create(user=user, medication_name="Antihistamine")
+    MedicationFactory.create(user=user, medication_name="Never taken")
+    MedicationIntakeFactory.create(user=user, medication=antihistamine, intake_date=intake_day)
+    MedicationIntakeFactory.create(user=user, medication=antihistamine, intake_date=today - timedelta(days=1))
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_MEDICATION_EFFECTS_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/insights/medication_effects.html")
+    effects = response.context["effects"]
+    assert [(effect.name, effect.intake_count) for effect in effects] == [("Antihistamine", 1)]
+    assert effects[0].mean_before == 9
+    assert effects[0].mean_after == 3
+    assert effects[0].change == -6
+    assert effects[0].improved_share == 1
+
+    selector = Selector(text=response.content.decode())
+    assert selector.css("#medication-effects tbody tr::attr(data-medication)").getall() == [str(antihistamine.uuid)]
+    assert selector.css("#medication-effects tbody tr td:last-child::text").get(default="").strip() == "100%"
+
+
+@pytest.mark.django_db
+def test_partial_medication_effects_without_intakes(authenticated_client: Client, user: User) -> None:
+    # Given
+    MedicationFactory.create(user=user)
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_MEDICATION_EFFECTS_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["effects"] == []
+    assertContains(response, "Log when you take your medications")
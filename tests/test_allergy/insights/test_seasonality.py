@@ -0,0 +1,119 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django import DjangoCaptureOnCommitCallbacks
+from pytest_django.asserts import assertContains, assertTemplateUsed
+
+from allergy.seasonality import compute_seasonality
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_SEASONALITY_VIEW_NAME = "allergy:partial_seasonality"
+
+
+def count_allergy_queries(queries: CaptureQueriesContext) -> int:
+    return len([query for query in queries.captured_queries if "allergy_" in query["sql"]])
+
+
+@pytest.mark.django_db
+def test_partial_seasonality_by_week_of_year(authenticated_client: Client, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomTypeFactory.create(user=user, name="Never logged")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2023, 4, 3), intensity=4)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2023, 4, 4), intensity=6)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=8)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 3, 4), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 9, 2), intensity=5)
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_SEASONALITY_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/insights/seasonality.html")
+    report = response.context["report"]
+    assert (report.first_year, report.last_year) == (2023, 2024)
+    assert [symptom.name for symptom in report.symptoms] == ["Pollen", "Mold"]
+
+    pollen_season = report.symptoms[0]
+    assert len(pollen_season.weeks) == 53
+    week_14 = pollen_season.weeks[13]
+    assert week_14.entry_count == 3
+    assert week_14.average_intensity == 6
+    assert week_14.frequency == pytest.approx(3 / 14)
+    # Week 10 of 2023 lies before the first logged day, so only the 7 days of 2024 count.
+    assert pollen_season.weeks[9].entry_count == 1
+    assert pollen_season.weeks[9].frequency == pytest.approx(1 / 7)
+    assert pollen_season.peak_week.week == 14
+    assert pollen_season.season_start_week.week == 10
+    assert pollen_season.season_start_label == "March"
+    assert report.symptoms[1].season_start_week.week == 36
+
+    selector = Selector(text=response.content.decode())
+    assert selector.css("#seasonality-list > div::attr(data-symptom-type)").getall() == [
+        str(pollen.uuid),
+        str(mold.uuid),
+    ]
+    assert len(selector.css("#seasonality-list > div:first-child div[title^=Week]")) == 53
+
+
+@pytest.mark.django_db
+def test_seasonality_counts_only_days_from_first_log_until_today(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 6, 3), intensity=4)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 6, 4), intensity=6)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 6, 20), intensity=3)
+
+    # When
+    report = compute_seasonality(user, today=date(2024, 6, 5))
+
+    # Then
+    assert (report.first_year, report.last_year) == (2024, 2024)
+    week_23 = report.symptoms[0].weeks[22]
+    assert week_23.entry_count == 2
+    assert week_23.frequency == 1
+    assert report.symptoms[0].weeks[24].entry_count == 0
+    assert report.symptoms[0].weeks[0].frequency == 0
+
+
+@pytest.mark.django_db
+def test_partial_seasonality_without_entries(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_SEASONALITY_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["report"].symptoms == []
+    assertContains(response, "Log symptoms to see when your season starts.")
+
+
+@pytest.mark.django_db
+def test_partial_seasonality_memoized_until_new_entries(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 4, 1))
+    url = reverse(PARTIAL_SEASONALITY_VIEW_NAME)
+    authenticated_client.get(url)
+
+    # When
+    with CaptureQueriesContext(connection) as cached_queries:
+        authenticated_client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 6, 3))
+    refreshed_response = authenticated_client.get(url)
+
+    # Then
+    assert count_allergy_queries(cached_queries) == 0
+    assert refreshed_response.context["report"].symptoms[0].weeks[22].entry_count == 1
@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from parsel import Selector
+from pytest_django import DjangoCaptureOnCommitCallbacks
+from pytest_django.asserts import assertContains, assertTemplateUsed
+
+from allergy.cache import get_data_version
+from allergy.models import MedicationIntake
+from tests.factories.medication import MedicationFactory
+from tests.factories.medication_intake import MedicationIntakeFactory
+
+PARTIAL_MEDICATION_INTAKE_VIEW_NAME = "allergy:partial_medication_intake"
+MEDICATION_INTAKE_SAVE_VIEW_NAME = "allergy:medication_intake_save_partial"
+
+
+@pytest.mark.django_db
+def test_partial_medication_intake_lists_medications(
+    authenticated_client: Client, user: User, second_user: User
+) -> None:
+    # Given
+    antihistamine = MedicationFactory.create(user=user, medication_name="Antihistamine")
+    spray = MedicationFactory.create(user=user, medication_name="Nasal spray")
+    MedicationFactory.create(user=second_user, medication_name="Other user's medication")
+    MedicationIntakeFactory.create(user=user, medication=spray)
+    MedicationIntakeFactory.create(user=user, medication=antihistamine, intake_date=date.today() - timedelta(days=1))
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_MEDICATION_INTAKE_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/medications/intake.html")
+    assert response.context["taken_today"] == {str(spray.uuid)}
+    selector = Selector(text=response.content.decode())
+    assert selector.css("input[name=medications]::attr(value)").getall() == [str(antihistamine.uuid), str(spray.uuid)]
+    assert selector.css("#medication-intake li:nth-child(2) .text-green-700::text").get(default="").strip() == "Taken"
+    assert not selector.css("#medication-intake li:nth-child(1) .text-green-700")
+
+
+@pytest.mark.django_db
+def test_partial_medication_intake_without_medications(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_MEDICATION_INTAKE_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertContains(response, reverse("settings:medications_tab"))
+
+
+@pytest.mark.django_db
+def test_medication_intake_save_records_selected_medications(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    antihistamine = MedicationFactory.create(user=user, medication_name="Antihistamine")
+    spray = MedicationFactory.create(user=user, medication_name="Nasal spray")
+    MedicationFactory.create(user=user, medication_name="Eye drops")
+    MedicationIntakeFactory.create(user=user, medication=spray, dose=1)
+    version = get_data_version(user.pk)
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        response = authenticated_client.post(
+            reverse(MEDICATION_INTAKE_SAVE_VIEW_NAME),
+            {"medications": [str(antihistamine.uuid), str(spray.uuid)], "dose": "2"},
+        )
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["recorded_count"] == 2
+    assert response.context["taken_today"] == {str(antihistamine.uuid), str(spray.uuid)}
+    assertContains(response, "Recorded 2 medications.")
+    assert sorted(
+        MedicationIntake.objects.filter(user=user).values_list("medication__medication_name", "intake_date", "dose")
+    ) == [("Antihistamine", date.today(), 2), ("Nasal spray", date.today(), 2)]
+    assert get_data_version(user.pk) != version
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("medications", "dose", "error"),
+    [
+        ([], "1", "Select at least one medication."),
+        (["foreign"], "1", "Select a valid choice."),
+        (["own"], "11", "Ensure this value is less than or equal to 10."),
+    ],
+)
+def test_medication_intake_save_invalid(
+    authenticated_client: Client, user: User, medications: list[str], dose: str, error: str
+) -> None:
+    # Given
+    uuids = {
+        "own": str(MedicationFactory.create(user=user).uuid),
+        "foreign": str(MedicationFactory.create().uuid),
+    }
+
+    # When
+    response = authenticated_client.post(
+        reverse(MEDICATION_INTAKE_SAVE_VIEW_NAME),
+        {"medications": [uuids[medication] for medication in medications], "dose": dose},
+    )
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertContains(response, error)
+    assert not MedicationIntake.objects.exists()
@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+
+from allergy.entries import EntryWrite, upsert_symptom_entries
+from allergy.models import DailyEntrySummary, MonthlyEntrySummary
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+
+@pytest.mark.django_db
+def test_day_summary_tracks_entries(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+
+    # When
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=3)
+    entry = SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 4, 1), intensity=5)
+    entry.intensity = 8
+    entry.save()
+
+    # Then
+    summary = DailyEntrySummary.objects.get(user=user, entry_date=date(2024, 4, 1))
+    assert summary.entry_count == 2
+    assert summary.max_intensity == 8
+    assert summary.intensity_sum == 11
+    assert summary.type_intensities == {str(pollen.uuid): 3, str(mold.uuid): 8}
+
+
+@pytest.mark.django_db
+def test_day_summary_removed_with_last_entry(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+    entry = SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=3)
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 4, 2), intensity=5)
+
+    # When
+    entry.delete()
+    mold.delete()
+
+    # Then
+    assert not DailyEntrySummary.objects.filter(user=user).exists()
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=4).entry_count == 0
+
+
+@pytest.mark.django_db
+def test_day_summaries_feed_month_summary_after_bulk_write(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 30), intensity=2)
+
+    # When
+    upsert_symptom_entries(
+        user,
+        [
+            EntryWrite(entry_date=date(2024, 4, 1), symptom_type=pollen, intensity=6),
+            EntryWrite(entry_date=date(2024, 5, 1), symptom_type=pollen, intensity=4),
+        ],
+    )
+
+    # Then
+    assert list(
+        DailyEntrySummary.objects.filter(user=user)
+        .order_by("entry_date")
+        .values_list("entry_date", "entry_count", "max_intensity", "intensity_sum")
+    ) == [
+        (date(2024, 4, 1), 1, 6, 6),
+        (date(2024, 4, 30), 1, 2, 2),
+        (date(2024, 5, 1), 1, 4, 4),
+    ]
+    april = MonthlyEntrySummary.objects.get(user=user, year=2024, month=4)
+    assert april.days == [1, 30]
+    assert april.day_stats == {"1": [1, 6, 6], "30": [1, 2, 2]}
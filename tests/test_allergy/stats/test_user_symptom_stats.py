@@ -0,0 +1,172 @@
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from allergy.entries import EntryWrite, copy_day_entries, upsert_symptom_entries
+from allergy.models import SymptomEntry, UserSymptomStats
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+
+def get_stats(user: User) -> UserSymptomStats:
+    return UserSymptomStats.objects.get(user=user)
+
+
+@pytest.mark.django_db
+def test_user_stats_track_created_and_updated_entries(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+
+    # When
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 4, 1), intensity=4)
+    entry = SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 3), intensity=5)
+    entry.intensity = 9
+    entry.save()
+
+    # Then
+    stats = get_stats(user)
+    assert stats.entry_count == 3
+    assert stats.day_count == 2
+    assert stats.intensity_sum == 15
+    assert stats.average_intensity == 5
+    assert stats.latest_entry_date == date(2024, 5, 3)
+    assert stats.type_counts == {str(pollen.uuid): 2, str(mold.uuid): 1}
+
+
+@pytest.mark.django_db
+def test_user_stats_track_deleted_entries(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=2)
+    latest = SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 9), intensity=6)
+
+    # When
+    latest.delete()
+
+    # Then
+    stats = get_stats(user)
+    assert stats.entry_count == 1
+    assert stats.day_count == 1
+    assert stats.intensity_sum == 2
+    assert stats.latest_entry_date == date(2024, 4, 1)
+    assert stats.type_counts == {str(pollen.uuid): 1}
+
+
+@pytest.mark.django_db
+def test_user_stats_drop_deleted_symptom_type(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 4, 2), intensity=7)
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 4, 3), intensity=3)
+
+    # When
+    mold.delete()
+
+    # Then
+    stats = get_stats(user)
+    assert stats.entry_count == 1
+    assert stats.day_count == 1
+    assert stats.intensity_sum == 2
+    assert stats.latest_entry_date == date(2024, 4, 1)
+    assert stats.type_counts == {str(pollen.uuid): 1}
+
+
+@pytest.mark.django_db
+def test_user_stats_track_bulk_writes(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomEntryFactory.create(user=user, symptom_type=mold, entry_date=date(2024, 3, 1), intensity=1)
+
+    # When
+    upsert_symptom_entries(
+        user,
+        [
+            EntryWrite(entry_date=date(2024, 4, 1), symptom_type=pollen, intensity=3),
+            EntryWrite(entry_date=date(2024, 4, 1), symptom_type=mold, intensity=5),
+        ],
+    )
+    copied = copy_day_entries(user, date(2024, 4, 1), date(2024, 4, 2))
+
+    # Then
+    assert copied == 2
+    stats = get_stats(user)
+    assert stats.entry_count == 5
+    assert stats.day_count == 3
+    assert stats.intensity_sum == 17
+    assert stats.latest_entry_date == date(2024, 4, 2)
+    assert stats.type_counts == {str(pollen.uuid): 2, str(mold.uuid): 3}
+
+
+@pytest.mark.django_db
+def test_user_stats_track_entry_moved_to_another_type(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    mold = SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 9), intensity=6)
+    entry = SymptomEntry.objects.get(user=user, entry_date=date(2024, 4, 9))
+
+    # When
+    entry.symptom_type = mold
+    entry.entry_date = date(2024, 3, 1)
+    entry.save()
+
+    # Then
+    stats = get_stats(user)
+    assert stats.entry_count == 2
+    assert stats.day_count == 2
+    assert stats.intensity_sum == 8
+    assert stats.latest_entry_date == date(2024, 4, 1)
+    assert stats.type_counts == {str(pollen.uuid): 1, str(mold.uuid): 1}
+
+
+@pytest.mark.django_db
+def test_user_stats_write_cost_independent_of_history(user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2022, 1, 1))
+    with CaptureQueriesContext(connection) as short_history_queries:
+        SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 6, 1))
+
+    for offset in range(1, 400, 3):
+        SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2022, 1, 1) + timedelta(days=offset))
+
+    # When
+    with CaptureQueriesContext(connection) as long_history_queries:
+        SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 6, 2))
+
+    # Then
+    assert len(long_history_queries) == len(short_history_queries)
+    history_scans = [
+        query["sql"]
+        for query in long_history_queries
+        if "COUNT(" in query["sql"]
+        or (
+            query["sql"].startswith("SELECT")
+            and "monthlyentrysummary" in query["sql"]
+            and '"month" = ' not in query["sql"]
+        )
+    ]
+    assert history_scans == []
+    assert get_stats(user).entry_count == 136
+    assert get_stats(user).type_counts == {str(pollen.uuid): 136}
+
+
+@pytest.mark.django_db
+def test_user_stats_removed_with_user(user: User) -> None:
+    # Given
+    SymptomEntryFactory.create(user=user, entry_date=date(2024, 4, 1))
+
+    # When
+    user.delete()
+
+    # Then
+    assert not UserSymptomStats.objects.exists()
@@ -0,0 +1,103 @@
+import json
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import SymptomEntry
+from tests.factories.symptom_type import SymptomTypeFactory
+
+SYMPTOM_EDIT_LOG_URL = "allergy:symptom_edit_log_partial"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_symptom_edit_log_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(SYMPTOM_EDIT_LOG_URL)
+
+    # When
+    response = anonymous_client.post(url, {})
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_symptom_edit_log_applies_burst_in_one_write(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    edits = [
+        {"date": "2024-05-20", "symptom_uuid": str(symptom_type_1.uuid), "intensity": intensity}
+        for intensity in range(1, 8)
+    ]
+    edits.append({"date": "2024-05-20", "symptom_uuid": str(symptom_type_2.uuid), "intensity": 4})
+    edits.append({"date": "2024-05-20", "symptom_uuid": str(symptom_type_1.uuid), "intensity": 3})
+    post_data = {"entries": json.dumps(edits), "selected_date": "2024-05-20"}
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.post(reverse(SYMPTOM_EDIT_LOG_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    entry_inserts = [
+        query for query in queries.captured_queries if 'INSERT INTO "allergy_symptomentry"' in query["sql"]
+    ]
+    assert len(entry_inserts) == 1
+
+    intensities = dict(
+        SymptomEntry.objects.filter(user=user, entry_date=date(2024, 5, 20)).values_list("symptom_type", "intensity")
+    )
+    assert intensities == {symptom_type_1.uuid: 3, symptom_type_2.uuid: 4}
+
+    selector = Selector(text=response.content.decode(response.charset))
+    selectors = selector.xpath('//div[starts-with(@id, "intensity-")]')
+    assert len(selectors) == 2
+    selected_intensity = selector.xpath(
+        f'//div[@id="intensity-{symptom_type_1.uuid}"]//button[contains(@class, "bg-blue-500")]/text()'
+    ).get()
+    assert selected_intensity == "3"
+    assert selectors.xpath("@data-entry-date").getall() == ["2024-05-20", "2024-05-20"]
+
+
+@pytest.mark.django_db
+def test_symptom_edit_log_rejects_edits_for_other_dates(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    edits = [
+        {"date": "2024-05-20", "symptom_uuid": str(symptom_type.uuid), "intensity": 2},
+        {"date": "2024-05-21", "symptom_uuid": str(symptom_type.uuid), "intensity": 5},
+    ]
+    post_data = {"entries": json.dumps(edits), "selected_date": "2024-05-20"}
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_EDIT_LOG_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert b"All edits must be for the selected date." in response.content
+    assert not SymptomEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_symptom_edit_log_requires_selected_date(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    edits = [{"date": "2024-05-20", "symptom_uuid": str(symptom_type.uuid), "intensity": 2}]
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_EDIT_LOG_URL), {"entries": json.dumps(edits)})
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert not SymptomEntry.objects.exists()
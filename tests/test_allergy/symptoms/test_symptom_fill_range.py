@@ -0,0 +1,144 @@
+import json
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import MonthlyEntrySummary, SymptomEntry
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+SYMPTOM_FILL_RANGE_URL = "allergy:symptom_fill_range_partial"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_symptom_fill_range_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(SYMPTOM_FILL_RANGE_URL)
+
+    # When
+    response = anonymous_client.post(url, {})
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_symptom_fill_range_get_not_allowed(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(SYMPTOM_FILL_RANGE_URL))
+
+    # Then
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+def test_symptom_fill_range_upserts_every_day(authenticated_client: Client, user: User) -> None:
+    # Given
+    hay_fever = SymptomTypeFactory.create(user=user, name="Hay fever")
+    existing = SymptomEntryFactory.create(user=user, symptom_type=hay_fever, entry_date=date(2024, 5, 30), intensity=2)
+    untouched = SymptomEntryFactory.create(user=user, symptom_type=hay_fever, entry_date=date(2024, 6, 3), intensity=9)
+    post_data = {
+        "symptom_uuid": str(hay_fever.uuid),
+        "start_date": "2024-05-29",
+        "end_date": "2024-06-02",
+        "intensity": "6",
+    }
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_FILL_RANGE_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert json.loads(response["HX-Trigger"]) == {"calendarMonthsChanged": {"months": ["2024-05", "2024-06"]}}
+
+    assert list(
+        SymptomEntry.objects.filter(user=user, symptom_type=hay_fever)
+        .order_by("entry_date")
+        .values_list("entry_date", "intensity")
+    ) == [
+        (date(2024, 5, 29), 6),
+        (date(2024, 5, 30), 6),
+        (date(2024, 5, 31), 6),
+        (date(2024, 6, 1), 6),
+        (date(2024, 6, 2), 6),
+        (date(2024, 6, 3), 9),
+    ]
+    assert SymptomEntry.objects.get(pk=existing.pk).intensity == 6
+    assert SymptomEntry.objects.get(pk=untouched.pk).intensity == 9
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=5).days == [29, 30, 31]
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=6).days == [1, 2, 3]
+
+    selector = Selector(text=response.content.decode(response.charset))
+    assert selector.css("p[role='status']::text").get(default="").strip() == "Filled 5 days."
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("start_date", "end_date", "error"),
+    [
+        ("2024-06-02", "2024-06-01", "The end date must not be before the start date."),
+        ("2023-01-01", "2024-01-02", "Fill at most 366 days at once."),
+    ],
+)
+def test_symptom_fill_range_invalid_range(
+    authenticated_client: Client, user: User, start_date: str, end_date: str, error: str
+) -> None:
+    # Given
+    hay_fever = SymptomTypeFactory.create(user=user)
+    post_data = {"symptom_uuid": str(hay_fever.uuid), "start_date": start_date, "end_date": end_date, "intensity": "6"}
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_FILL_RANGE_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert "HX-Trigger" not in response
+    assert error in response.content.decode(response.charset)
+    assert not SymptomEntry.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_symptom_fill_range_other_users_symptom(authenticated_client: Client, user: User, second_user: User) -> None:
+    # Given
+    other_symptom = SymptomTypeFactory.create(user=second_user)
+    post_data = {
+        "symptom_uuid": str(other_symptom.uuid),
+        "start_date": "2024-06-01",
+        "end_date": "2024-06-02",
+        "intensity": "6",
+    }
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_FILL_RANGE_URL), post_data)
+
+    # Then
+    assert "HX-Trigger" not in response
+    assert "Invalid symptom type" in response.content.decode(response.charset)
+    assert not SymptomEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_symptoms_container_renders_fill_range_form(authenticated_client: Client, user: User) -> None:
+    # Given
+    hay_fever = SymptomTypeFactory.create(user=user)
+    url = reverse("allergy:symptoms_container_partial", kwargs={"year": 2024, "month": 5, "day": 29})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    selector = Selector(text=response.content.decode(response.charset))
+    form = selector.css("form#symptom-fill-range")
+    assert form.attrib["hx-post"] == reverse(SYMPTOM_FILL_RANGE_URL)
+    assert form.css("select[name='symptom_uuid'] option::attr(value)").getall() == [str(hay_fever.uuid)]
+    assert form.css("input[name='start_date']::attr(value)").get() == "2024-05-29"
+    assert form.css("input[name='end_date']::attr(value)").get() == "2024-05-29"
+    assert selector.css("#selected-date::attr(data-month)").get() == "2024-05"
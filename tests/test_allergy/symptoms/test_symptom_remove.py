@@ -6,6 +6,7 @@ import pytest
 from django.contrib.auth.models import User
 from django.test import Client
 from django.urls import reverse
+from parsel import Selector
 from pytest_django.asserts import assertContains, assertRedirects, assertTemplateUsed
 
 from allergy.models import SymptomEntry
@@ -75,6 +76,45 @@ def test_symptom_remove_authenticated_valid(authenticated_client: Client, user:
     assertContains(response, "hx-get=")
 
 
+@pytest.mark.django_db
+def test_symptom_remove_last_entry_clears_calendar_day_out_of_band(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 5, 20))
+    url_kwargs = {"year": 2024, "month": 5, "day": 20, "symptom_uuid": symptom_type.uuid}
+
+    # When
+    response = authenticated_client.delete(reverse(SYMPTOM_REMOVE_URL, kwargs=url_kwargs))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode(response.charset))
+    day_cell = selector.xpath('//div[@id="calendar-day-2024-5-20"]')
+    assert day_cell.attrib["hx-swap-oob"] == "true"
+    assert day_cell.xpath(".//button/@title").get() == ""
+    assert not day_cell.xpath(".//span")
+
+
+@pytest.mark.django_db
+def test_symptom_remove_keeps_calendar_day_with_remaining_entries(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 20), intensity=2)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=date(2024, 5, 20), intensity=6)
+    url_kwargs = {"year": 2024, "month": 5, "day": 20, "symptom_uuid": symptom_type_1.uuid}
+
+    # When
+    response = authenticated_client.delete(reverse(SYMPTOM_REMOVE_URL, kwargs=url_kwargs))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode(response.charset))
+    day_cell = selector.xpath('//div[@id="calendar-day-2024-5-20"]')
+    assert day_cell.xpath(".//button/@title").get() == "1 symptom, max intensity 6, mean 6.0"
+    assert day_cell.xpath(".//span")
+
+
 @pytest.mark.django_db
 def test_symptom_remove_authenticated_already_removed(authenticated_client: Client, user: User) -> None:
     # Given
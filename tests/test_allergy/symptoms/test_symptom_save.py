@@ -69,6 +69,25 @@ def test_symptom_save_authenticated_create_valid(authenticated_client: Client, u
     assert "bg-blue-500" in button_classes_str.split()
 
 
+@pytest.mark.django_db
+def test_symptom_save_first_entry_updates_calendar_day_out_of_band(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    post_data = {"symptom_uuid": str(symptom_type.uuid), "intensity": 8, "selected_date": "2024-05-22"}
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_SAVE_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/calendar/calendar_day.html")
+    selector = Selector(text=response.content.decode(response.charset))
+    day_cell = selector.xpath('//div[@id="calendar-day-2024-5-22"]')
+    assert day_cell.attrib["hx-swap-oob"] == "true"
+    assert day_cell.xpath(".//button/@title").get() == "1 symptom, max intensity 8, mean 8.0"
+    assert day_cell.xpath(".//span[contains(@class, 'rounded-full')]")
+
+
 @pytest.mark.django_db
 def test_symptom_save_authenticated_update_valid(authenticated_client: Client, user: User) -> None:
     # Given
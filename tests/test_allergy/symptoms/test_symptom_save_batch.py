@@ -0,0 +1,151 @@
+import json
+import uuid
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import MonthlyEntrySummary, SymptomEntry
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+SYMPTOM_SAVE_BATCH_URL = "allergy:symptom_save_batch_partial"
+LOGIN_URL_NAME = "login_view"
+
+
+def batch_post_data(entries: list[dict[str, object]], selected_date: str = "") -> dict[str, str]:
+    return {"entries": json.dumps(entries), "selected_date": selected_date}
+
+
+@pytest.mark.django_db
+def test_symptom_save_batch_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(SYMPTOM_SAVE_BATCH_URL)
+
+    # When
+    response = anonymous_client.post(url, {})
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_symptom_save_batch_creates_and_updates_entries(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type_1 = SymptomTypeFactory.create(user=user)
+    symptom_type_2 = SymptomTypeFactory.create(user=user)
+    existing_entry = SymptomEntryFactory.create(
+        user=user, symptom_type=symptom_type_1, entry_date=date(2024, 5, 20), intensity=2
+    )
+    post_data = batch_post_data(
+        [
+            {"date": "2024-05-20", "symptom_uuid": str(symptom_type_1.uuid), "intensity": 6},
+            {"date": "2024-05-20", "symptom_uuid": str(symptom_type_2.uuid), "intensity": 3},
+            {"date": "2024-06-01", "symptom_uuid": str(symptom_type_2.uuid), "intensity": 9},
+        ],
+        selected_date="2024-05-20",
+    )
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.post(reverse(SYMPTOM_SAVE_BATCH_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    entry_inserts = [
+        query for query in queries.captured_queries if 'INSERT INTO "allergy_symptomentry"' in query["sql"]
+    ]
+    type_lookups = [query for query in queries.captured_queries if 'FROM "allergy_symptomtype"' in query["sql"]]
+    assert len(entry_inserts) == 1
+    assert len(type_lookups) == 1
+
+    assert SymptomEntry.objects.get(pk=existing_entry.pk).intensity == 6
+    assert SymptomEntry.objects.get(symptom_type=symptom_type_2, entry_date=date(2024, 5, 20)).intensity == 3
+    assert SymptomEntry.objects.get(symptom_type=symptom_type_2, entry_date=date(2024, 6, 1)).intensity == 9
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=6).days == [1]
+
+    selector = Selector(text=response.content.decode(response.charset))
+    selectors = selector.xpath('//div[starts-with(@id, "intensity-")]')
+    assert {element.attrib["id"] for element in selectors} == {
+        f"intensity-{symptom_type_1.uuid}",
+        f"intensity-{symptom_type_2.uuid}",
+    }
+    assert all(element.attrib["hx-swap-oob"] == "true" for element in selectors)
+    day_cells = selector.xpath('//div[starts-with(@id, "calendar-day-")]')
+    assert [element.attrib["id"] for element in day_cells] == ["calendar-day-2024-5-20", "calendar-day-2024-6-1"]
+
+
+@pytest.mark.django_db
+def test_symptom_save_batch_last_write_wins(authenticated_client: Client, user: User) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user)
+    post_data = batch_post_data(
+        [
+            {"date": "2024-05-20", "symptom_uuid": str(symptom_type.uuid), "intensity": intensity}
+            for intensity in range(1, 8)
+        ]
+    )
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_SAVE_BATCH_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    entry = SymptomEntry.objects.get(user=user, symptom_type=symptom_type)
+    assert entry.intensity == 7
+
+
+@pytest.mark.django_db
+def test_symptom_save_batch_rejects_other_users_symptom_type(
+    authenticated_client: Client, user: User, second_user: User
+) -> None:
+    # Given
+    own_symptom_type = SymptomTypeFactory.create(user=user)
+    foreign_symptom_type = SymptomTypeFactory.create(user=second_user)
+    post_data = batch_post_data(
+        [
+            {"date": "2024-05-20", "symptom_uuid": str(own_symptom_type.uuid), "intensity": 4},
+            {"date": "2024-05-20", "symptom_uuid": str(foreign_symptom_type.uuid), "intensity": 4},
+        ]
+    )
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_SAVE_BATCH_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert b"Invalid symptom type" in response.content
+    assert not SymptomEntry.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("entries", "expected_error"),
+    [
+        ([], b"This field is required."),
+        ({"date": "2024-05-20"}, b"Provide a non-empty list of entries."),
+        (["2024-05-20"], b"Entry 1 is not an object."),
+        ([{"date": "2024-02-30", "symptom_uuid": str(uuid.uuid4()), "intensity": 4}], b"Entry 1: Enter a valid date."),
+        ([{"date": "2024-05-20", "symptom_uuid": str(uuid.uuid4()), "intensity": 11}], b"Entry 1: Ensure this value"),
+    ],
+)
+def test_symptom_save_batch_invalid_entries(
+    authenticated_client: Client, entries: object, expected_error: bytes
+) -> None:
+    # Given
+    post_data = {"entries": json.dumps(entries)}
+
+    # When
+    response = authenticated_client.post(reverse(SYMPTOM_SAVE_BATCH_URL), post_data)
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert expected_error in response.content
@@ -3,11 +3,14 @@ from http import HTTPStatus
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from parsel import Selector
 from pytest_django.asserts import assertContains, assertNotContains, assertRedirects, assertTemplateUsed
 
+from allergy.day_view import DaySymptom
 from tests.factories.symptom_entry import SymptomEntryFactory
 from tests.factories.symptom_type import SymptomTypeFactory
 
@@ -81,17 +84,13 @@ def test_symptoms_container_authenticated(authenticated_client: Client, user: Us
     assert context["selected_date"] == entry_date
     assert context["selected_date_str"] == entry_date.strftime("%Y-%m-%d")
 
-    symptom_types_in_context = context["symptom_types"]
-    assert len(symptom_types_in_context) == 2
-    assert set(symptom_types_in_context) == {symptom_type_1, symptom_type_2}
-
-    symptom_entries_in_context = context["symptom_entries"]
-    assert len(symptom_entries_in_context) == 1
-    assert symptom_entries_in_context[0] == entry_1
-
-    assert symptom_type_1 in context["selected_symptoms_map"]
-    assert symptom_type_2 not in context["selected_symptoms_map"]
-    assert context["selected_symptoms_map"][symptom_type_1] == entry_1
+    assert context["symptoms"] == [
+        DaySymptom(uuid=symptom_type_2.uuid, name="Dust Mites", intensity=None),
+        DaySymptom(uuid=symptom_type_1.uuid, name="Pollen", intensity=entry_1.intensity),
+    ]
+    assert context["selected_symptoms"] == [
+        DaySymptom(uuid=symptom_type_1.uuid, name="Pollen", intensity=entry_1.intensity),
+    ]
     assert "calendar_matrix" in context
     assert context["current_year"] == entry_date.year
     assert context["selected_day"] == entry_date.day
@@ -113,6 +112,34 @@ def test_symptoms_container_authenticated(authenticated_client: Client, user: Us
     assert "bg-blue-500" in button_classes.split()
 
 
+@pytest.mark.django_db
+def test_symptoms_container_query_budget(authenticated_client: Client, user: User) -> None:
+    # Given
+    entry_date = date(2024, 5, 20)
+    other_date = date(2024, 5, 21)
+    symptom_type_1 = SymptomTypeFactory.create(user=user, name="Pollen")
+    symptom_type_2 = SymptomTypeFactory.create(user=user, name="Dust Mites")
+    SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=entry_date, intensity=3)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_2, entry_date=entry_date, intensity=7)
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type_1, entry_date=other_date, intensity=9)
+    url = reverse(SYMPTOMS_CONTAINER_URL, kwargs={"year": 2024, "month": 5, "day": 20})
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert len([query for query in queries.captured_queries if "allergy_" in query["sql"]]) == 2
+    assert [(symptom.name, symptom.intensity) for symptom in response.context["symptoms"]] == [
+        ("Dust Mites", 7),
+        ("Mold", None),
+        ("Pollen", 3),
+    ]
+    assert response.context["days_with_entries"] == [20, 21]
+
+
 @pytest.mark.django_db
 def test_symptoms_container_no_entries_for_date(authenticated_client: Client, user: User) -> None:
     # Given
@@ -138,13 +165,9 @@ def test_symptoms_container_no_entries_for_date(authenticated_client: Client, us
     context = response.context
     assert context["selected_date"] == entry_date
 
-    symptom_types_in_context = context["symptom_types"]
-    assert len(symptom_types_in_context) == 2
-    assert set(symptom_types_in_context) == {symptom_type_1, symptom_type_2}
-
-    symptom_entries_in_context = context["symptom_entries"]
-    assert len(symptom_entries_in_context) == 0
-    assert len(context["selected_symptoms_map"]) == 0
+    assert {symptom.uuid for symptom in context["symptoms"]} == {symptom_type_1.uuid, symptom_type_2.uuid}
+    assert not any(symptom.selected for symptom in context["symptoms"])
+    assert context["selected_symptoms"] == []
 
     assertContains(response, f'id="symptom-{symptom_type_1.uuid}"')
     assertContains(response, f'hx-get="{reverse(SYMPTOM_ADD_URL, kwargs={"symptom_uuid": symptom_type_1.uuid})}"')
@@ -181,12 +204,8 @@ def test_symptoms_container_no_symptoms_defined(authenticated_client: Client, us
     context = response.context
     assert context["selected_date"] == entry_date
 
-    symptom_types_in_context = context["symptom_types"]
-    assert len(symptom_types_in_context) == 0
-
-    symptom_entries_in_context = context["symptom_entries"]
-    assert len(symptom_entries_in_context) == 0
-    assert len(context["selected_symptoms_map"]) == 0
+    assert context["symptoms"] == []
+    assert context["selected_symptoms"] == []
 
     assertContains(response, '<div class="grid grid-cols-2')
     assertNotContains(response, '<button id="symptom-')
@@ -0,0 +1,143 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import MonthlyEntrySummary, SymptomEntry
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+COPY_PREVIOUS_DAY_URL = "allergy:symptoms_copy_previous_day_partial"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 5, "day": 2})
+
+    # When
+    response = anonymous_client.post(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_get_not_allowed(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 5, "day": 2}))
+
+    # Then
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_invalid_date(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.post(reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 2, "day": 30}))
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_clones_entries_in_one_statement(
+    authenticated_client: Client, user: User, second_user: User
+) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    sneezing = SymptomTypeFactory.create(user=user, name="Sneezing")
+    itching = SymptomTypeFactory.create(user=user, name="Itching")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 30), intensity=6)
+    SymptomEntryFactory.create(user=user, symptom_type=sneezing, entry_date=date(2024, 4, 30), intensity=3)
+    overwritten = SymptomEntryFactory.create(user=user, symptom_type=sneezing, entry_date=date(2024, 5, 1), intensity=9)
+    kept = SymptomEntryFactory.create(user=user, symptom_type=itching, entry_date=date(2024, 5, 1), intensity=2)
+    SymptomEntryFactory.create(user=second_user, entry_date=date(2024, 4, 30))
+    url = reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 5, "day": 1})
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.post(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    entry_inserts = [
+        query for query in queries.captured_queries if 'INSERT INTO "allergy_symptomentry"' in query["sql"]
+    ]
+    assert len(entry_inserts) == 1
+    assert "SELECT" in entry_inserts[0]["sql"]
+
+    assert sorted(
+        SymptomEntry.objects.filter(user=user, entry_date=date(2024, 5, 1)).values_list(
+            "symptom_type__name", "intensity"
+        )
+    ) == [("Itching", 2), ("Pollen", 6), ("Sneezing", 3)]
+    assert SymptomEntry.objects.get(symptom_type=sneezing, entry_date=date(2024, 5, 1)).pk == overwritten.pk
+    assert SymptomEntry.objects.get(symptom_type=itching, entry_date=date(2024, 5, 1)).pk == kept.pk
+    assert SymptomEntry.objects.filter(user=second_user).count() == 1
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=5).days == [1]
+
+    selector = Selector(text=response.content.decode(response.charset))
+    assert {element.attrib["id"] for element in selector.css("#intensity-container > div")} == {
+        f"intensity-{pollen.uuid}",
+        f"intensity-{sneezing.uuid}",
+        f"intensity-{itching.uuid}",
+    }
+    assert selector.css(f"#symptom-{pollen.uuid}::attr(hx-delete)").get() is not None
+    day_cell = selector.css("#calendar-day-2024-5-1")
+    assert day_cell.attrib["hx-swap-oob"] == "true"
+    assert day_cell.css("button::attr(title)").get() == "3 symptoms, max intensity 6, mean 3.7"
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_without_entries_changes_nothing(authenticated_client: Client, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    url = reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 5, "day": 1})
+
+    # When
+    response = authenticated_client.post(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert not SymptomEntry.objects.filter(user=user).exists()
+    selector = Selector(text=response.content.decode(response.charset))
+    assert selector.css(f"#symptom-{pollen.uuid}::attr(hx-get)").get() is not None
+    assert not selector.css("#intensity-container > div")
+
+
+@pytest.mark.django_db
+def test_copy_previous_day_without_sql_uuid_function(
+    authenticated_client: Client, user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given
+    monkeypatch.setattr("allergy.entries._new_uuid_sql", lambda: None)
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    sneezing = SymptomTypeFactory.create(user=user, name="Sneezing")
+    copied = SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 30), intensity=6)
+    SymptomEntryFactory.create(user=user, symptom_type=sneezing, entry_date=date(2024, 4, 30), intensity=3)
+    overwritten = SymptomEntryFactory.create(user=user, symptom_type=sneezing, entry_date=date(2024, 5, 1), intensity=9)
+    url = reverse(COPY_PREVIOUS_DAY_URL, kwargs={"year": 2024, "month": 5, "day": 1})
+
+    # When
+    response = authenticated_client.post(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert sorted(
+        SymptomEntry.objects.filter(user=user, entry_date=date(2024, 5, 1)).values_list(
+            "symptom_type__name", "intensity"
+        )
+    ) == [("Pollen", 6), ("Sneezing", 3)]
+    assert SymptomEntry.objects.get(symptom_type=sneezing, entry_date=date(2024, 5, 1)).pk == overwritten.pk
+    assert SymptomEntry.objects.get(symptom_type=pollen, entry_date=date(2024, 5, 1)).pk != copied.pk
+    assert MonthlyEntrySummary.objects.get(user=user, year=2024, month=5).days == [1]
@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects, assertTemplateUsed
+
+from allergy import trends
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+PARTIAL_TRENDS_VIEW_NAME = "allergy:partial_trends"
+LOGIN_VIEW_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_partial_trends_anonymous_user(anonymous_client: Client) -> None:
+    # When
+    response = anonymous_client.get(reverse(PARTIAL_TRENDS_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_VIEW_NAME))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("days", ["7", "abc", "400"])
+def test_partial_trends_invalid_period(authenticated_client: Client, days: str) -> None:
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_TRENDS_VIEW_NAME), {"days": days})
+
+    # Then
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_partial_trends_rolling_means(authenticated_client: Client, user: User) -> None:
+    # Given
+    today = date.today()
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomTypeFactory.create(user=user, name="Mold")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=today, intensity=7)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=today - timedelta(days=10), intensity=8)
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(reverse(PARTIAL_TRENDS_VIEW_NAME), {"days": "30"})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assertTemplateUsed(response, "allergy/partials/trends/trends.html")
+    assert len([query for query in queries.captured_queries if "allergy_" in query["sql"]]) <= 2
+
+    series = response.context["series"]
+    assert series.start_date == today - timedelta(days=29)
+    assert series.end_date == today
+    assert [trend.name for trend in series.trends] == ["Pollen"]
+    trend = series.trends[0]
+    assert len(trend.short_means) == len(trend.long_means) == 30
+    assert trend.short_means[-1] == pytest.approx(1.0)
+    assert trend.short_means[-2] == 0
+    assert trend.short_means[-11] == pytest.approx(8 / 7)
+    assert trend.long_means[-1] == pytest.approx(0.5)
+
+    selector = Selector(text=response.content.decode())
+    assert selector.css("#trends-list > div::attr(data-symptom-type)").getall() == [str(pollen.uuid)]
+    assert len(selector.css("#trends-list polyline")) == 2
+
+
+@pytest.mark.django_db
+def test_partial_trends_without_entries(authenticated_client: Client, user: User) -> None:
+    # Given
+    SymptomTypeFactory.create(user=user, name="Pollen")
+
+    # When
+    response = authenticated_client.get(reverse(PARTIAL_TRENDS_VIEW_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["selected_period"] == trends.DEFAULT_TREND_PERIOD
+    assert response.context["series"].trends == []
+    assert b"No symptoms recorded in this period." in response.content
@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from tests.factories.medication import MedicationFactory
+
+MEDICATIONS_TAB_URL_NAME = "settings:medications_tab"
+LIST_MEDICATIONS_PARTIAL_URL_NAME = "settings:partial_medication_list"
+DELETE_MEDICATION_PARTIAL_URL_NAME = "settings:partial_delete_medication"
+
+
+@pytest.mark.django_db
+def test_list_medications_matching_etag_returns_not_modified(authenticated_client: Client, user: User) -> None:
+    # Given
+    MedicationFactory.create(user=user)
+    authenticated_client.get(reverse(MEDICATIONS_TAB_URL_NAME))
+    url = reverse(LIST_MEDICATIONS_PARTIAL_URL_NAME)
+    etag = authenticated_client.get(url)["ETag"]
+
+    # When
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_list_medications_etag_changes_after_delete(authenticated_client: Client, user: User) -> None:
+    # Given
+    medication = MedicationFactory.create(user=user)
+    url = reverse(LIST_MEDICATIONS_PARTIAL_URL_NAME)
+    etag = authenticated_client.get(url)["ETag"]
+    authenticated_client.delete(
+        reverse(DELETE_MEDICATION_PARTIAL_URL_NAME, kwargs={"medication_uuid": medication.uuid})
+    )
+
+    # When
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.context["medications"]) == 0
@@ -0,0 +1,125 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parsel import Selector
+from pytest_django import DjangoCaptureOnCommitCallbacks
+
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+EXISTING_SYMPTOMS_PARTIAL_URL_NAME = "settings:partial_existing_symptoms"
+REMOVE_SYMPTOM_PARTIAL_URL_NAME = "settings:partial_symptom_type_remove"
+
+
+def count_histogram_queries(queries: CaptureQueriesContext) -> int:
+    return len([query for query in queries.captured_queries if "GROUP BY" in query["sql"]])
+
+
+@pytest.mark.django_db
+def test_partial_existing_symptoms_intensity_histograms(authenticated_client: Client, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    dust = SymptomTypeFactory.create(user=user, name="Dust")
+    for offset, intensity in enumerate([2, 2, 7, 10]):
+        SymptomEntryFactory.create(
+            user=user, symptom_type=pollen, entry_date=date(2024, 4, 1) + timedelta(days=offset), intensity=intensity
+        )
+
+    # When
+    response = authenticated_client.get(reverse(EXISTING_SYMPTOMS_PARTIAL_URL_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    histograms = response.context["intensity_histograms"]
+    assert histograms[pollen.uuid].counts == [0, 2, 0, 0, 0, 0, 1, 0, 0, 1]
+    assert dust.uuid not in histograms
+
+    selector = Selector(text=response.content.decode())
+    pollen_bars = selector.css(f"#symptom-type-{pollen.uuid} [data-histogram] > div")
+    assert pollen_bars.css("::attr(data-count)").getall() == ["0", "2", "0", "0", "0", "0", "1", "0", "0", "1"]
+    assert pollen_bars[1].attrib["class"].endswith("h-8")
+    assert pollen_bars[6].attrib["class"].endswith("h-4")
+    assert pollen_bars[1].attrib["title"] == "Intensity 2: 2 entries"
+    assert not selector.css(f"#symptom-type-{dust.uuid} [data-histogram]")
+
+
+@pytest.mark.django_db
+def test_partial_existing_symptoms_histogram_queries_independent_of_data_size(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    url = reverse(EXISTING_SYMPTOMS_PARTIAL_URL_NAME)
+    first_type = SymptomTypeFactory.create(user=user, name="Type 0")
+    SymptomEntryFactory.create(user=user, symptom_type=first_type, entry_date=date(2024, 1, 1), intensity=3)
+    with CaptureQueriesContext(connection) as small_queries:
+        authenticated_client.get(url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for index in range(1, 5):
+            symptom_type = SymptomTypeFactory.create(user=user, name=f"Type {index}")
+            for offset in range(10):
+                SymptomEntryFactory.create(
+                    user=user,
+                    symptom_type=symptom_type,
+                    entry_date=date(2024, 1, 1) + timedelta(days=offset),
+                    intensity=offset % 10 + 1,
+                )
+
+    # When
+    with CaptureQueriesContext(connection) as large_queries:
+        response = authenticated_client.get(url)
+
+    # Then
+    assert len(response.context["intensity_histograms"]) == 5
+    assert count_histogram_queries(large_queries) == count_histogram_queries(small_queries) == 1
+    assert len(large_queries) == len(small_queries)
+
+
+@pytest.mark.django_db
+def test_partial_existing_symptoms_histograms_cached_until_new_entries(
+    authenticated_client: Client, user: User, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+) -> None:
+    # Given
+    symptom_type = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 4, 1), intensity=4)
+    url = reverse(EXISTING_SYMPTOMS_PARTIAL_URL_NAME)
+    authenticated_client.get(url)
+
+    # When
+    with CaptureQueriesContext(connection) as cached_queries:
+        authenticated_client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):
+        SymptomEntryFactory.create(user=user, symptom_type=symptom_type, entry_date=date(2024, 4, 2), intensity=4)
+    refreshed_response = authenticated_client.get(url)
+
+    # Then
+    assert count_histogram_queries(cached_queries) == 0
+    assert refreshed_response.context["intensity_histograms"][symptom_type.uuid].counts[3] == 2
+
+
+# The delete commits before the listing is rendered again, which needs real transactions.
+@pytest.mark.django_db(transaction=True)
+def test_partial_symptom_remove_keeps_remaining_histograms(authenticated_client: Client, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    dust = SymptomTypeFactory.create(user=user, name="Dust")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 4, 1), intensity=5)
+    SymptomEntryFactory.create(user=user, symptom_type=dust, entry_date=date(2024, 4, 1), intensity=8)
+    authenticated_client.get(reverse(EXISTING_SYMPTOMS_PARTIAL_URL_NAME))
+
+    # When
+    response = authenticated_client.delete(
+        reverse(REMOVE_SYMPTOM_PARTIAL_URL_NAME, kwargs={"symptom_type_uuid": pollen.uuid})
+    )
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert list(response.context["intensity_histograms"]) == [dust.uuid]
+    selector = Selector(text=response.content.decode())
+    assert selector.css(f"#symptom-type-{dust.uuid} [data-intensity='8']::attr(data-count)").get() == "1"
@@ -0,0 +1,123 @@
+import csv
+import json
+from datetime import date
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.test import AsyncClient, Client
+from django.urls import NoReverseMatch, reverse
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import Medication
+from tests.factories.medication import MedicationFactory
+from tests.factories.symptom_entry import SymptomEntryFactory
+from tests.factories.symptom_type import SymptomTypeFactory
+
+EXPORT_URL_NAME = "settings:export_history"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_export_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(EXPORT_URL_NAME, kwargs={"export_format": "csv"})
+
+    # When
+    response = anonymous_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_export_csv_streams_entries_and_medications(
+    authenticated_client: Client, user: User, second_user: User
+) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 2), intensity=7)
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 1), intensity=3)
+    SymptomEntryFactory.create(user=second_user, entry_date=date(2024, 5, 1))
+    MedicationFactory.create(user=user, medication_name="Cetirizine", medication_type=Medication.MedicationType.PILLS)
+    url = reverse(EXPORT_URL_NAME, kwargs={"export_format": "csv"})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert isinstance(response, StreamingHttpResponse)
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"].startswith('attachment; filename="allergy-history-')
+
+    rows = list(csv.DictReader(StringIO(response.getvalue().decode())))
+    assert [(row["record_type"], row["entry_date"], row["symptom"], row["intensity"]) for row in rows[:2]] == [
+        ("symptom_entry", "2024-05-01", "Pollen", "3"),
+        ("symptom_entry", "2024-05-02", "Pollen", "7"),
+    ]
+    assert len(rows) == 3
+    assert rows[2]["record_type"] == "medication"
+    assert rows[2]["medication_name"] == "Cetirizine"
+    assert rows[2]["medication_type"] == "pills"
+    assert rows[2]["symptom"] == ""
+
+
+@pytest.mark.django_db
+def test_export_ndjson_streams_one_record_per_line(authenticated_client: Client, user: User) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 1), intensity=3)
+    MedicationFactory.create(user=user, medication_name="Cetirizine", medication_type=Medication.MedicationType.PILLS)
+    url = reverse(EXPORT_URL_NAME, kwargs={"export_format": "ndjson"})
+
+    # When
+    response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+    assert len(records) == 2
+    assert records[0]["record_type"] == "symptom_entry"
+    assert records[0]["entry_date"] == "2024-05-01"
+    assert records[0]["symptom"] == "Pollen"
+    assert records[0]["intensity"] == 3
+    assert "medication_name" not in records[0]
+    assert records[1]["record_type"] == "medication"
+    assert records[1]["medication_name"] == "Cetirizine"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("export_format", ["csv", "ndjson"])
+def test_export_streams_async_iterator_under_asgi(authenticated_client: Client, user: User, export_format: str) -> None:
+    # Given
+    pollen = SymptomTypeFactory.create(user=user, name="Pollen")
+    SymptomEntryFactory.create(user=user, symptom_type=pollen, entry_date=date(2024, 5, 1), intensity=3)
+    MedicationFactory.create(user=user, medication_name="Cetirizine")
+    async_client = AsyncClient()
+    async_client.force_login(user)
+    url = reverse(EXPORT_URL_NAME, kwargs={"export_format": export_format})
+
+    async def read_streaming_content(response: StreamingHttpResponse) -> bytes:
+        return b"".join([chunk async for chunk in response])
+
+    # When
+    response = async_to_sync(async_client.get)(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.is_async
+    content = async_to_sync(read_streaming_content)(response)
+    assert content == authenticated_client.get(url).getvalue()
+
+
+def test_export_unknown_format_has_no_url() -> None:
+    # When / Then
+    with pytest.raises(NoReverseMatch):
+        reverse(EXPORT_URL_NAME, kwargs={"export_format": "xml"})
@@ -0,0 +1,87 @@
+from datetime import date
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+from parsel import Selector
+from pytest_django.asserts import assertRedirects
+
+from allergy.models import SymptomEntry
+from tests.factories.symptom_type import SymptomTypeFactory
+
+IMPORT_URL_NAME = "settings:import_history"
+LOGIN_URL_NAME = "login_view"
+
+
+@pytest.mark.django_db
+def test_import_anonymous(anonymous_client: Client) -> None:
+    # Given
+    url = reverse(IMPORT_URL_NAME)
+
+    # When
+    response = anonymous_client.post(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.FOUND
+    assertRedirects(response, reverse(LOGIN_URL_NAME))
+
+
+@pytest.mark.django_db
+def test_import_get_not_allowed(authenticated_client: Client) -> None:
+    # When
+    response = authenticated_client.get(reverse(IMPORT_URL_NAME))
+
+    # Then
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+def test_import_csv_upload(authenticated_client: Client, user: User, second_user: User) -> None:
+    # Given
+    SymptomTypeFactory.create(user=second_user, name="Pollen")
+    diary = SimpleUploadedFile("diary.csv", b"date,symptom,intensity\n2024-05-01,Pollen,4\n2024-05-02,Pollen,6\n")
+
+    # When
+    response = authenticated_client.post(reverse(IMPORT_URL_NAME), {"diary_file": diary})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    selector = Selector(text=response.content.decode())
+    assert selector.css("p[role='status']::text").get(default="").split() == (
+        "Imported 2 rows into 2 entries, creating 1 new symptom type.".split()
+    )
+    assert list(
+        SymptomEntry.objects.filter(user=user)
+        .order_by("entry_date")
+        .values_list("entry_date", "symptom_type__name", "intensity", "symptom_type__user")
+    ) == [(date(2024, 5, 1), "Pollen", 4, user.pk), (date(2024, 5, 2), "Pollen", 6, user.pk)]
+
+
+@pytest.mark.django_db
+def test_import_invalid_row_shows_error(authenticated_client: Client, user: User) -> None:
+    # Given
+    diary = SimpleUploadedFile("diary.ndjson", b'{"date": "2024-05-01", "symptom": "Pollen", "intensity": 4}\nnope\n')
+
+    # When
+    response = authenticated_client.post(reverse(IMPORT_URL_NAME), {"diary_file": diary})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert "Line 2: invalid JSON." in response.content.decode()
+    assert not SymptomEntry.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_import_unsupported_extension(authenticated_client: Client, user: User) -> None:
+    # Given
+    diary = SimpleUploadedFile("diary.xlsx", b"date,symptom,intensity\n")
+
+    # When
+    response = authenticated_client.post(reverse(IMPORT_URL_NAME), {"diary_file": diary})
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert "Upload a .csv or .ndjson file." in response.content.decode()
@@ -3,7 +3,9 @@ from http import HTTPStatus
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from pytest_django.asserts import assertContains, assertNotContains, assertRedirects, assertTemplateUsed
@@ -194,3 +196,54 @@ def test_overview_tab_post_not_allowed(authenticated_client: Client) -> None:
 
     # Then
     assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+def test_overview_tab_query_budget(authenticated_client: Client, user: User) -> None:
+    # Given
+    today = timezone.now().date()
+    symptom_types = [SymptomTypeFactory.create(user=user, name=name) for name in ["Pollen", "Dust Mites", "Mold"]]
+    for offset in range(10):
+        for symptom_type in symptom_types[: offset % 3 + 1]:
+            SymptomEntryFactory.create(
+                user=user, symptom_type=symptom_type, entry_date=today - timedelta(days=offset), intensity=offset + 1
+            )
+    url = reverse(OVERVIEW_TAB_URL_NAME)
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert len([query for query in queries.captured_queries if "allergy_" in query["sql"]]) == 3
+
+    context = response.context
+    assert context["days_with_symptoms"] == 10
+    assert context["total_entries"] == 19
+    assert [(entry.entry_date, entry.symptom_type.name, entry.intensity) for entry in context["recent_symptoms"]] == [
+        (today, "Pollen", 1),
+        (today - timedelta(days=1), "Dust Mites", 2),
+        (today - timedelta(days=1), "Pollen", 2),
+        (today - timedelta(days=2), "Mold", 3),
+        (today - timedelta(days=2), "Dust Mites", 3),
+    ]
+    assert [(item["symptom_type__name"], item["count"]) for item in context["top_symptoms"]] == [
+        ("Pollen", 10),
+        ("Dust Mites", 6),
+        ("Mold", 3),
+    ]
+
+
+@pytest.mark.django_db
+def test_overview_tab_without_entries_skips_list_query(authenticated_client: Client, user: User) -> None:
+    # Given
+    url = reverse(OVERVIEW_TAB_URL_NAME)
+
+    # When
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(url)
+
+    # Then
+    assert response.status_code == HTTPStatus.OK
+    assert len([query for query in queries.captured_queries if "allergy_" in query["sql"]]) == 1